@@ -91,6 +91,14 @@ All the load functions share very similar arguments:
                                                         long_name='experiment_id')
                 cube.add_aux_coord(experiment_coord)
 
+    * parallel:
+        The number of worker processes used to load the files, e.g.
+        ``iris.load(uris, parallel=8)``. By default, the files are loaded
+        one after another by the calling process. Parallel loading is
+        supported for PP, FieldsFile and NetCDF files. The fields and
+        cubes returned by the workers must be picklable, and for NetCDF
+        files the callback is run by the worker processes.
+
 Format-specific translation behaviour can be modified by using:
     :func:`iris.fileformats.pp.add_load_rules`
 
@@ -139,8 +147,8 @@ else:
     _update(site_configuration)
 
 
-def _generate_cubes(uris, callback):
-    """Returns a generator of cubes given the URIs and a callback."""
+def _generate_cubes(uris, callback, constraints=None, parallel=None):
+    """Returns a generator of cubes given the URIs, a callback and constraints."""
     if isinstance(uris, basestring):
         uris = [uris] 
     
@@ -153,15 +161,16 @@ def _generate_cubes(uris, callback):
     
         # Call each scheme handler with the approriate uris
         if scheme == 'file':
-            for cube in iris.io.load_files(part_names, callback):
+            for cube in iris.io.load_files(part_names, callback,
+                                           constraints, parallel):
                 yield cube
         else:
             raise ValueError('Iris cannot handle the URI scheme: %s' % scheme)
 
 
-def _load_collection(uris, constraints=None, callback=None):
+def _load_collection(uris, constraints=None, callback=None, parallel=None):
     try:
-        cubes = _generate_cubes(uris, callback)
+        cubes = _generate_cubes(uris, callback, constraints, parallel)
         result = iris.cube._CubeFilterCollection.from_cubes(cubes, constraints)
     except EOFError as e:
         raise iris.exceptions.TranslationError("The file appears empty or "
@@ -169,7 +178,7 @@ def _load_collection(uris, constraints=None, callback=None):
     return result
 
 
-def load(uris, constraints=None, callback=None):
+def load(uris, constraints=None, callback=None, parallel=None):
     """
     Loads any number of Cubes for each constraint.
 
@@ -187,15 +196,18 @@ def load(uris, constraints=None, callback=None):
         One or more constraints.
     * callback:
         A modifier/filter function.
+    * parallel:
+        The number of worker processes used to load the files.
 
     Returns:
         An :class:`iris.cube.CubeList`.
 
     """    
-    return _load_collection(uris, constraints, callback).merged().cubes()
+    return _load_collection(uris, constraints, callback,
+                            parallel).merged().cubes()
 
 
-def load_cube(uris, constraint=None, callback=None):
+def load_cube(uris, constraint=None, callback=None, parallel=None):
     """
     Loads a single cube.
 
@@ -213,6 +225,8 @@ def load_cube(uris, constraint=None, callback=None):
         A constraint.
     * callback:
         A modifier/filter function.
+    * parallel:
+        The number of worker processes used to load the files.
 
     Returns:
         An :class:`iris.cube.Cube`.
@@ -222,7 +236,8 @@ def load_cube(uris, constraint=None, callback=None):
     if len(constraints) != 1:
         raise ValueError('only a single constraint is allowed')
 
-    cubes = _load_collection(uris, constraints, callback).merged().cubes()
+    cubes = _load_collection(uris, constraints, callback,
+                             parallel).merged().cubes()
 
     if len(cubes) != 1:
         msg = 'Expected exactly one cube, found {}.'.format(len(cubes))
@@ -230,7 +245,7 @@ def load_cube(uris, constraint=None, callback=None):
     return cubes[0]
 
 
-def load_cubes(uris, constraints=None, callback=None):
+def load_cubes(uris, constraints=None, callback=None, parallel=None):
     """
     Loads exactly one Cube for each constraint.
 
@@ -248,13 +263,16 @@ def load_cubes(uris, constraints=None, callback=None):
         One or more constraints.
     * callback:
         A modifier/filter function.
+    * parallel:
+        The number of worker processes used to load the files.
 
     Returns:
         An :class:`iris.cube.CubeList`.
 
     """
     # Merge the incoming cubes
-    collection = _load_collection(uris, constraints, callback).merged()
+    collection = _load_collection(uris, constraints, callback,
+                                  parallel).merged()
 
     # Make sure we have exactly one merged cube per constraint
     bad_pairs = filter(lambda pair: len(pair) != 1, collection.pairs)
@@ -267,7 +285,7 @@ def load_cubes(uris, constraints=None, callback=None):
     return collection.cubes()
 
 
-def load_raw(uris, constraints=None, callback=None):
+def load_raw(uris, constraints=None, callback=None, parallel=None):
     """
     Loads non-merged cubes.
 
@@ -291,12 +309,14 @@ def load_raw(uris, constraints=None, callback=None):
         One or more constraints.
     * callback:
         A modifier/filter function.
+    * parallel:
+        The number of worker processes used to load the files.
 
     Returns:
         An :class:`iris.cube.CubeList`.
 
     """
-    return _load_collection(uris, constraints, callback).cubes()
+    return _load_collection(uris, constraints, callback, parallel).cubes()
 
 
 def load_strict(uris, constraints=None, callback=None):
@@ -23,7 +23,9 @@ import operator
 
 import numpy as np
 
+import iris.coords
 import iris.exceptions
+import iris.util
 
 
 class Constraint(object):
@@ -193,16 +195,37 @@ class _CoordConstraint(object):
         self.coord_name = coord_name
         self._coord_thing = coord_thing        
         self._call_func = self._cast_coord_thing()
+        self._match = self._cast_coord_thing_to_match()
     
     def _cast_coord_thing(self):
         """Turn the coord thing into a function where appropriate."""
         if callable(self._coord_thing):
             result = self._coord_thing
         elif isinstance(self._coord_thing, collections.Iterable) and not isinstance(self._coord_thing, basestring):
-            result = lambda cell: cell in list(self._coord_thing)
+            values = list(self._coord_thing)
+            result = lambda cell: cell in values
         else:
             result = lambda c: c == self._coord_thing
         return result
+
+    def _cast_coord_thing_to_match(self):
+        """
+        Turn the coord thing into a function of the :class:`iris.coords.CellArray`
+        of a coordinate, which returns a boolean array of the cells which
+        match, or None if the cells must be matched one at a time.
+
+        """
+        thing = self._coord_thing
+        if isinstance(thing, iris.util._Between):
+            result = lambda cells: _between_match(thing, cells)
+        elif callable(thing):
+            result = lambda cells: None
+        elif isinstance(thing, collections.Iterable) and not isinstance(thing, basestring):
+            values = list(thing)
+            result = lambda cells: _membership_match(values, cells)
+        else:
+            result = lambda cells: _equality_match(thing, cells)
+        return result
     
     def __repr__(self):
         return '_CoordConstraint(%r, %r)' % (self.coord_name, self._coord_thing)
@@ -218,7 +241,9 @@ class _CoordConstraint(object):
         dims = cube.coord_dims(coord)
         if len(dims) > 1:
             raise iris.exceptions.CoordinateMultiDimError('Cannot apply constraints to multidimensional coordinates')
-        r = np.array([self._call_func(cell) for cell in coord.cells()])
+        r = self._match(coord.cell_array())
+        if r is None:
+            r = np.array([self._call_func(cell) for cell in coord.cells()])
         if dims:
             cube_cim[dims[0]] = r
         elif not all(r):
@@ -226,6 +251,72 @@ class _CoordConstraint(object):
         return cube_cim
     
 
+# The types of value which a numeric Cell compares with as a number.
+_NUMBER_TYPES = (int, float)
+
+
+def _is_number(value, cells):
+    """Whether the value compares with each of the cells as a number."""
+    # NB. Datetimes are not numbers here, even though a CellArray of a time
+    # reference coordinate can compare with them, so that constraints
+    # continue to compare them with each Cell.
+    return isinstance(value, _NUMBER_TYPES) and \
+        cells.points.dtype.kind in 'biuf'
+
+
+def _is_string(value, cells):
+    """Whether the value compares with each of the cells as a string."""
+    return isinstance(value, basestring) and \
+        cells.points.dtype.kind in 'SU' and cells.bounds is None
+
+
+def _equality_match(value, cells):
+    """
+    Returns which of the :class:`iris.coords.CellArray` cells equal the
+    value, or None if they cannot be compared all at once.
+
+    """
+    if _is_number(value, cells) or _is_string(value, cells):
+        result = cells == value
+    else:
+        result = None
+    return result
+
+
+def _membership_match(values, cells):
+    """
+    Returns which of the :class:`iris.coords.CellArray` cells equal any of
+    the values, or None if they cannot be compared all at once.
+
+    """
+    if all([_is_number(value, cells) for value in values]) or \
+            all([_is_string(value, cells) for value in values]):
+        result = cells.isin(values)
+    else:
+        result = None
+    return result
+
+
+def _between_match(between, cells):
+    """
+    Returns which of the :class:`iris.coords.CellArray` cells satisfy the
+    :func:`iris.util.between` inequality, or None if they cannot be
+    compared all at once.
+
+    """
+    if not (_is_number(between.lh, cells) and _is_number(between.rh, cells)):
+        return None
+    if between.lh_inclusive:
+        result = cells >= between.lh
+    else:
+        result = cells > between.lh
+    if between.rh_inclusive:
+        result &= cells <= between.rh
+    else:
+        result &= cells < between.rh
+    return result
+
+
 class _ColumnIndexManager(object):
     """
     A class to represent column aligned slices which can be operated on using ``&``, ``|`` or ``^``.
@@ -29,6 +29,7 @@ import numpy.ma as ma
 import iris.cube
 import iris.coords
 import iris.exceptions
+import iris.fileformats.manager
 import iris.unit
 import iris.util
 
@@ -303,150 +304,101 @@ def _is_combination(name):
     return _COMBINATION_JOIN in str(name)
 
 
-def build_indexes(positions):
+class _Positions(object):
     """
-    Construct a mapping for each candidate dimension that maps for each
-    of its scalar values the set of values for each of the other candidate
-    dimensions.
-
-    For example:
-
-        >>> from iris._merge import build_indexes
-        >>> positions = [{'a': 0, 'b': 10, 'c': 100},
-        ...              {'a': 1, 'b': 10, 'c': 200},
-        ...              {'a': 2, 'b': 20, 'c': 300}]
-        ...
-        >>> indexes = build_indexes(positions)
-        >>> for k in sorted(indexes):
-        ...     print '%r:' % k
-        ...     for kk in sorted(indexes[k]):
-        ...         print '\t%r:' % kk,
-        ...         for kkk in sorted(indexes[k][kk]):
-        ...             print '%r: %r' % (kkk, indexes[k][kk][kkk]),
-        ...         print
-        ...
-        'a':
-             0: 'b': set([10]) 'c': set([100])
-             1: 'b': set([10]) 'c': set([200])
-             2: 'b': set([20]) 'c': set([300])
-        'b':
-             10: 'a': set([0, 1]) 'c': set([200, 100])
-             20: 'a': set([2]) 'c': set([300])
-        'c':
-             100: 'a': set([0]) 'b': set([10])
-             200: 'a': set([1]) 'b': set([10])
-             300: 'a': set([2]) 'b': set([20])
-
-    Args:
-
-    * positions:
-        A list containing a dictionary of candidate dimension key to
-        scalar value pairs for each source-cube.
-
-    Returns:
-        The cross-reference dictionary for each candidate dimension.
-
-    """
-    names = positions[0].keys()
-    scalar_index_by_name = {name: {} for name in names}
-
-    for position in positions:
-        for name, value in position.iteritems():
-            name_index_by_scalar = scalar_index_by_name[name]
-
-            if value in name_index_by_scalar:
-                value_index_by_name = name_index_by_scalar[value]
-                for other_name in names:
-                    if other_name != name:
-                        value_index_by_name[other_name].add(position[other_name])
-            else:
-                name_index_by_scalar[value] = {other_name: set((position[other_name],)) for other_name in names if other_name != name}
-
-    return scalar_index_by_name
-
-
-def _separable_pair(name, index):
-    """
-    Determine whether the candidate dimension is separable.
-
-    A candidate dimension X and Y are separable if each scalar
-    value of X maps to the same set of scalar values of Y.
-
-    Args:
-
-    * name1:
-        The first candidate dimension to be compared.
-
-    * name2:
-        The second candidate dimension to be compared.
-
-    * index:
-        The cross-reference dictionary for the first candidate
-        dimension.
+    The scalar value of each candidate dimension for each source-cube,
+    held column-wise as integer codes into the unique values of each
+    candidate dimension.
 
-    Returns:
-        Boolean.
+    Relationships between candidate dimensions are then determined by
+    counting unique combinations of codes, rather than by repeatedly
+    cross-referencing the scalar values of every source-cube.
 
     """
-    items = index.itervalues()
-    reference = next(items)[name]
+    def __init__(self, positions):
+        """
+        Args:
 
-    return all([item[name] == reference for item in items])
+        * positions:
+            A list containing a dictionary (or sequence) of candidate
+            dimension key to scalar value pairs for each source-cube.
 
-def _separable(name, indexes):
-    """
-    Determine the candidate dimensions that are separable and
-    inseparable relative to the provided candidate dimension.
+        """
+        first = positions[0]
+        if isinstance(first, dict):
+            self.names = first.keys()
+        else:
+            self.names = range(len(first))
+        self.size = len(positions)
+        self.values = {}
+        self.codes = {}
+
+        for name in self.names:
+            index = {}
+            codes = [index.setdefault(position[name], len(index)) for position in positions]
+            values = [None] * len(index)
+            for value, code in index.iteritems():
+                values[code] = value
+            # The unique values, in order of first occurrence.
+            self.values[name] = values
+            self.codes[name] = np.array(codes, dtype=np.intp)
+
+    def __len__(self):
+        return self.size
+
+    def value(self, name, index):
+        """Returns the scalar value of the candidate dimension for the given source-cube."""
+        return self.values[name][self.codes[name][index]]
+
+    def combined_codes(self, names):
+        """
+        Returns a tuple of the code of the combination of scalar values of the
+        given candidate dimensions for each source-cube, and the number of
+        unique combinations.
 
-    A candidate dimension X and Y are separable if each scalar
-    value of X maps to the same set of scalar values of Y.
+        """
+        codes = np.zeros(self.size, dtype=np.int64)
+        count = 1
 
-    Args:
-    
-    * name:
-        The candidate dimension that requires its separable and
-        inseparable relationship to be determined.
+        for name in names:
+            codes = codes * len(self.values[name]) + self.codes[name]
+            # Keep the codes dense to avoid overflow.
+            uniques, codes = np.unique(codes, return_inverse=True)
+            count = len(uniques)
 
-    * indexes:
-        The cross-reference dictionary for each candidate dimension.
+        return codes, count
 
-    Returns:
-        A tuple containing the set of separable and inseparable
-        candidate dimensions.
+    def first_indices(self, codes):
+        """Returns the index of the first source-cube for each unique code, in code order."""
+        return np.unique(codes, return_index=True)[1]
 
-    """
-    separable = set()
-    inseparable = set()
+    def last_indices(self, codes):
+        """Returns the index of the last source-cube for each unique code, in code order."""
+        return self.size - 1 - np.unique(codes[::-1], return_index=True)[1]
 
-    for target_name in indexes:
-        if name != target_name:
-            if _separable_pair(target_name, indexes[name]):
-                separable.add(target_name)
-            else:
-                inseparable.add(target_name)
 
-    return _Relation(separable, inseparable)
+def _combination_members(name):
+    """Returns the candidate dimensions that are members of the combination."""
+    return [int(member) if member.isdigit() else member for member in name.split(_COMBINATION_JOIN)]
 
 
-def derive_relation_matrix(indexes):
+def derive_relation_matrix(positions):
     """
     Construct a mapping for each candidate dimension that specifies
     which of the other candidate dimensions are separable or inseparable.
 
     A candidate dimension X and Y are separable if each scalar value of
-    X maps to the same set of scalar values of Y.
-
-    Also see :func:`iris._merge.build_indexes`.
+    X maps to the same set of scalar values of Y. That is, iff every
+    combination of the unique scalar values of X and Y occurs.
 
     For example:
 
-        >>> from iris._merge import build_indexes, derive_relation_matrix
-        >>> positions = [{'a': 0, 'b': 10, 'c': 100},
-        ...              {'a': 1, 'b': 10, 'c': 200},
-        ...              {'a': 2, 'b': 20, 'c': 300}]
+        >>> from iris._merge import _Positions, derive_relation_matrix
+        >>> positions = _Positions([{'a': 0, 'b': 10, 'c': 100},
+        ...                         {'a': 1, 'b': 10, 'c': 200},
+        ...                         {'a': 2, 'b': 20, 'c': 300}])
         ...
-        >>> indexes = build_indexes(positions)
-        >>> matrix = derive_relation_matrix(indexes)
+        >>> matrix = derive_relation_matrix(positions)
         >>> for k, v in matrix.iteritems():
         ...     print '%r: %r' % (k, v)
         ...
@@ -456,16 +408,26 @@ def derive_relation_matrix(indexes):
 
     Args:
     
-    * indexes:
-        The cross-reference dictionary for each candidate dimension.
+    * positions:
+        The :class:`_Positions` of the candidate dimensions.
 
     Returns:
         The relation dictionary for each candidate dimension.
 
     """
-    # TODO: This takes twice as long as it could do because it doesn't
-    # account for the symmetric nature of the relationship.
-    relation_matrix = {name: _separable(name, indexes) for name in indexes}
+    names = positions.names
+    relation_matrix = {name: _Relation(set(), set()) for name in names}
+
+    # The relationship is symmetric, so only consider each pair once.
+    for i, name in enumerate(names):
+        for other in names[i + 1:]:
+            _, count = positions.combined_codes([name, other])
+            if count == len(positions.values[name]) * len(positions.values[other]):
+                relation_matrix[name].separable.add(other)
+                relation_matrix[other].separable.add(name)
+            else:
+                relation_matrix[name].inseparable.add(other)
+                relation_matrix[other].inseparable.add(name)
 
     return relation_matrix
 
@@ -549,8 +511,7 @@ def _is_dependent(dependent, independent, positions, function_mapping=None):
         variables in a functional relationship.
 
     * positions:
-        A list containing a dictionary of candidate dimension key to scalar value
-        pairs for each source-cube.
+        The :class:`_Positions` of the candidate dimensions.
 
     Kwargs:
 
@@ -563,21 +524,17 @@ def _is_dependent(dependent, independent, positions, function_mapping=None):
         Boolean.
 
     """
-    valid = True
-    relation = {}
-
-    if isinstance(function_mapping, dict):
-        relation = function_mapping
+    independent = list(independent)
+    codes, count = positions.combined_codes(independent)
+    _, dependent_count = positions.combined_codes(independent + [dependent])
 
-    for position in positions:
-        item = tuple([position[name] for name in independent])
+    # Each combination of independent values must map to exactly one dependent value.
+    valid = count == dependent_count
 
-        if item in relation:
-            if position[dependent] != relation[item]:
-                valid = False
-                break
-        else:
-            relation[item] = position[dependent]
+    if valid and isinstance(function_mapping, dict):
+        for index in positions.first_indices(codes):
+            item = tuple([positions.value(name, index) for name in independent])
+            function_mapping[item] = positions.value(dependent, index)
 
     return valid
 
@@ -648,8 +605,7 @@ def _build_separable_group(space, group, separable_consistent_groups, positions,
         A list of candidate dimension groups that are consistently separable.
 
     * positions:
-        A list containing a dictionary of candidate dimension key to scalar value 
-        pairs for each source-cube.
+        The :class:`_Positions` of the candidate dimensions.
 
     * function_matrix:
         The function mapping dictionary for each candidate dimension that
@@ -710,8 +666,7 @@ def _build_inseparable_group(space, group, positions, function_matrix):
         A set of related (chained) inseparable candidate dimensions.
 
     * positions:
-        A list containing a dictionary of candidate dimension key to scalar value
-        pairs for each source-cube.
+        The :class:`_Positions` of the candidate dimensions.
 
     * function_matrix:
         The function mapping dictionary for each candidate dimension that
@@ -771,8 +726,7 @@ def _build_combination_group(space, group, positions, function_matrix):
         A set of related (chained) inseparable candidate dimensions.
 
     * positions:
-        A list containing a dictionary of candidate dimension key to scalar value
-        pairs for each source-cube.
+        The :class:`_Positions` of the candidate dimensions.
 
     * function_matrix:
         The function mapping dictionary for each candidate dimension that
@@ -785,18 +739,19 @@ def _build_combination_group(space, group, positions, function_matrix):
     combination = _COMBINATION_JOIN.join(sorted(map(str, group)))
     space.update({name: None for name in (combination,)})
     space.update({name: (combination,) for name in group})
-    members = combination.split(_COMBINATION_JOIN)
+    members = _combination_members(combination)
 
     # Populate the function matrix for each member of the group.
     for name in group:
         function_matrix[name] = {}
 
-    for position in positions:
+    codes, _ = positions.combined_codes(members)
+    for index in positions.first_indices(codes):
         # Note, the cell double-tuple! This ensures that the cell value for
         # each member of the group is kept bound together as one key.
-        cell = (tuple([position[int(member) if member.isdigit() else member] for member in members]),)
+        cell = (tuple([positions.value(member, index) for member in members]),)
         for name in group:
-            function_matrix[name][cell] = position[name]
+            function_matrix[name][cell] = positions.value(name, index)
 
 
 def derive_space(groups, relation_matrix, positions, function_matrix=None):
@@ -811,8 +766,7 @@ def derive_space(groups, relation_matrix, positions, function_matrix=None):
           The relation dictionary for each candidate dimension.
 
       * positions:
-          A list containing a dictionary of candidate dimension key to
-          scalar value pairs for each source-cube.
+          The :class:`_Positions` of the candidate dimensions.
 
     Kwargs:
       * function_matrix:
@@ -849,20 +803,123 @@ def derive_space(groups, relation_matrix, positions, function_matrix=None):
     return space
 
 
+def _signature_key(cube_signature, coord_signature):
+    """
+    Returns a hashable key for the cube and coordinate signatures.
+
+    Equal signatures always have equal keys, so the key may be used to
+    bucket signatures prior to comparing them in full. Only the names,
+    shapes and types within the signatures contribute to the key.
+
+    """
+    defn = cube_signature.defn
+    scalar_names = tuple([defn_[:3] for defn_ in coord_signature.scalar_defns])
+    vector_names = tuple([(item.coord.name(), item.dims, item.coord.shape)
+                          for item in coord_signature.vector_dim_coords_and_dims +
+                          coord_signature.vector_aux_coords_and_dims])
+    factories = tuple([(factory_defn.class_, tuple([key for key, _ in factory_defn.dependency_defns]))
+                       for factory_defn in coord_signature.factory_defns])
+
+    return (defn[:3], tuple(cube_signature.data_shape), cube_signature.data_type,
+            scalar_names, vector_names, factories)
+
+
+class ProtoCubeRegistry(object):
+    """
+    Registers source-cubes with the appropriate :class:`ProtoCube`.
+
+    The ProtoCubes are bucketed by the key of their signatures, so each
+    source-cube is only offered to the ProtoCubes it may be compatible
+    with, and the signatures of each source-cube are only built once.
+
+    """
+    def __init__(self):
+        self._proto_cubes_by_key = {}
+        self._proto_cubes_by_name = {}
+
+    def register(self, cube):
+        """
+        Register the cube with the first compatible :class:`ProtoCube`,
+        or with a new ProtoCube if there is no compatible one.
+
+        Args:
+
+        * cube:
+            Candidate :class:`iris.cube.Cube` to be registered.
+
+        Returns:
+            The :class:`ProtoCube` of the cube.
+
+        """
+        cube_signature = ProtoCube._build_signature(cube)
+        coord_payload = ProtoCube._extract_coord_payload(cube)
+        key = _signature_key(cube_signature, coord_payload.as_signature())
+        proto_cubes = self._proto_cubes_by_key.setdefault(key, [])
+
+        for proto_cube in proto_cubes:
+            if proto_cube.register(cube, cube_signature, coord_payload):
+                return proto_cube
+
+        proto_cube = ProtoCube(cube, cube_signature, coord_payload)
+        proto_cubes.append(proto_cube)
+        self._proto_cubes_by_name.setdefault(cube.standard_name, []).append(proto_cube)
+        return proto_cube
+
+    def merge(self, unique=True):
+        """
+        Returns the list of cubes resulting from merging each of the
+        ProtoCubes, ordered by the standard name of the cubes.
+
+        Kwargs:
+
+        * unique:
+            If True, raises `iris.exceptions.DuplicateDataError` if
+            duplicate cubes are detected.
+
+        Returns:
+            A :class:`iris.cube.CubeList` of merged cubes.
+
+        """
+        merged_cubes = iris.cube.CubeList()
+        for name in sorted(self._proto_cubes_by_name):
+            for proto_cube in self._proto_cubes_by_name[name]:
+                merged_cubes.extend(proto_cube.merge(unique=unique))
+
+        return merged_cubes
+
+
 class ProtoCube(object):
     """Framework for merging source-cubes into one or more higher dimensional cubes."""
 
-    def __init__(self, cube):
-        """Create a new ProtoCube from the given cube and record the cube as a source-cube."""
+    # Default hint ordering for candidate dimension coordinates.
+    _hints = ['time', 'forecast_reference_time', 'forecast_period', 'model_level_number']
 
-        # Default hint ordering for candidate dimension coordinates.
-        self._hints = ['time', 'forecast_reference_time', 'forecast_period', 'model_level_number']
+    def __init__(self, cube, cube_signature=None, coord_payload=None):
+        """
+        Create a new ProtoCube from the given cube and record the cube as a source-cube.
+
+        Args:
 
+        * cube:
+            The source :class:`iris.cube.Cube` of the ProtoCube.
+
+        Kwargs:
+
+        * cube_signature:
+            The signature of the cube, if already built.
+
+        * coord_payload:
+            The coordinate payload of the cube, if already extracted.
+
+        """
         # The cube signature is metadata that defines this ProtoCube.
-        self._cube_signature = self._build_signature(cube)
+        if cube_signature is None:
+            cube_signature = self._build_signature(cube)
+        self._cube_signature = cube_signature
 
         # Extract the scalar and vector coordinate data and metadata from the cube. 
-        coord_payload = self._extract_coord_payload(cube)
+        if coord_payload is None:
+            coord_payload = self._extract_coord_payload(cube)
 
         # The coordinate signature defines the scalar and vector coordinates of this ProtoCube.
         self._coord_signature = coord_payload.as_signature()
@@ -896,75 +953,87 @@ class ProtoCube(object):
             A :class:`iris.cube.CubeList` of merged cubes.
 
         """
-        positions = [{i: v for i, v in enumerate(skeleton.scalar_values)} for skeleton in self._skeletons]
-        indexes = build_indexes(positions)
-        relation_matrix = derive_relation_matrix(indexes)
+        positions = _Positions([skeleton.scalar_values for skeleton in self._skeletons])
+        relation_matrix = derive_relation_matrix(positions)
         groups = derive_groups(relation_matrix)
 
         function_matrix = {}
         space = derive_space(groups, relation_matrix, positions, function_matrix=function_matrix)
-        self._define_space(space, positions, indexes, function_matrix)
+        self._define_space(space, positions, function_matrix)
         self._build_coordinates()
 
         # All the final, merged cubes will end up here.
         merged_cubes = iris.cube.CubeList()
 
-        # Collate source-cubes by the nd-index.
-        group_by_nd_index = {}
-        for index, position in enumerate(positions):
-            group = group_by_nd_index.setdefault(self._nd_index(position), [])
-            group.append(index)
+        # Collate source-cubes by the nd-index, in nd-index order.
+        nd_indexes, groups = self._group_by_nd_index(positions)
 
         # Determine the largest group of source-cubes that want to occupy
         # the same nd-index in the final merged cube.
-        group_depth = max([len(group) for group in group_by_nd_index.values()])
-        nd_indexes = group_by_nd_index.keys()
-        nd_indexes.sort()
-        
+        group_depth = max([len(group) for group in groups])
+
         # Check for unique data.
         if unique and group_depth > 1:
             # Find the first offending source-cube with duplicate metadata.
-            index = [group_by_nd_index[nd_index][1] for nd_index in nd_indexes if len(group_by_nd_index[nd_index]) > 1][0]
+            index = [group[1] for group in groups if len(group) > 1][0]
             name = self._cube_signature.defn.name()
             scalars = []
             for defn, value in zip(self._coord_signature.scalar_defns, self._skeletons[index].scalar_values):
                 scalars.append('%s=%r' % (defn.name(), value))
             raise iris.exceptions.DuplicateDataError('Duplicate %r cube, with scalar coordinates %s' % (name, ', '.join(scalars)))
 
+        # Where possible, merge the data proxies of the source-cubes into a
+        # compact array of records, rather than an object array of proxies.
+        records = self._proxy_records() if self._nd_names else None
+        if records is not None:
+            nd_index_arrays = tuple(np.array(nd_indexes, dtype=np.intp).T)
+
         # Generate group-depth merged cubes from the source-cubes.
         for level in xrange(group_depth):
-            # The merged cube's data will be an array of data proxies for deferred loading.
-            merged_cube = self._get_cube()
-
-            for nd_index in nd_indexes:
-                # Get the data of the current existing or last known good source-cube
-                offset = min(level, len(group_by_nd_index[nd_index]) - 1)
-                data = self._skeletons[group_by_nd_index[nd_index][offset]].data
-
-                # Slot the data into merged cube. The nd-index will have less dimensionality than
-                # that of the merged cube's data. The "missing" dimensions correspond to the 
-                # dimensionality of the source-cubes data.
-                if nd_index:
-                    # The use of "flatten" allows us to cope with a 0-dimensional array.
-                    # Otherwise, the assignment copies the 0-d *array* into the merged cube,
-                    # and not the contents of the array!
-                    if data.ndim == 0:
-                        merged_cube._data[nd_index] = data.flatten()[0]
+            if records is not None:
+                # Get the record of the current existing or last known good source-cube.
+                offsets = [group[min(level, len(group) - 1)] for group in groups]
+                data = iris.fileformats.manager.ProxyRecordArray(self._shape, records.proxy_class,
+                                                                 records.paths)
+                data.view(np.ndarray)[nd_index_arrays] = records.view(np.ndarray)[offsets]
+                merged_cube = self._get_cube(data)
+            else:
+                # The merged cube's data will be an array of data proxies for deferred loading.
+                merged_cube = self._get_cube()
+
+                for nd_index, group in zip(nd_indexes, groups):
+                    # Get the data of the current existing or last known good source-cube
+                    offset = min(level, len(group) - 1)
+                    data = self._skeletons[group[offset]].data
+                    # An object array can't hold records, so slot in the
+                    # equivalent proxies instead.
+                    if nd_index and isinstance(data, iris.fileformats.manager.ProxyRecordArray):
+                        data = data.proxies()
+
+                    # Slot the data into merged cube. The nd-index will have less dimensionality than
+                    # that of the merged cube's data. The "missing" dimensions correspond to the 
+                    # dimensionality of the source-cubes data.
+                    if nd_index:
+                        # The use of "flatten" allows us to cope with a 0-dimensional array.
+                        # Otherwise, the assignment copies the 0-d *array* into the merged cube,
+                        # and not the contents of the array!
+                        if data.ndim == 0:
+                            merged_cube._data[nd_index] = data.flatten()[0]
+                        else:
+                            merged_cube._data[nd_index] = data
                     else:
-                        merged_cube._data[nd_index] = data
-                else:
-                    merged_cube._data = data
+                        merged_cube._data = data
             
-            # Unmask the array only if it is filled.
-            if isinstance(merged_cube._data, ma.core.MaskedArray):
-                if ma.count_masked(merged_cube._data) == 0:
-                    merged_cube._data = merged_cube._data.filled()
+                # Unmask the array only if it is filled.
+                if isinstance(merged_cube._data, ma.core.MaskedArray):
+                    if ma.count_masked(merged_cube._data) == 0:
+                        merged_cube._data = merged_cube._data.filled()
 
             merged_cubes.append(merged_cube)
 
         return merged_cubes
 
-    def register(self, cube):
+    def register(self, cube, cube_signature=None, coord_payload=None):
         """
         Add a compatible :class:`iris.cube.Cube` as a source-cube for merging under this 
         :class:`ProtoCube`.
@@ -976,15 +1045,26 @@ class ProtoCube(object):
 
         * cube:
             Candidate :class:`iris.cube.Cube` to be associated with this :class:`ProtoCube`.
-        
+
+        Kwargs:
+
+        * cube_signature:
+            The signature of the cube, if already built.
+
+        * coord_payload:
+            The coordinate payload of the cube, if already extracted.
+
         Returns:
             True iff the :class:`iris.cube.Cube` is compatible with this :class:`ProtoCube`.
 
         """
-        match = self._cube_signature == self._build_signature(cube)
+        if cube_signature is None:
+            cube_signature = self._build_signature(cube)
+        match = self._cube_signature == cube_signature
 
         if match:
-            coord_payload = self._extract_coord_payload(cube)
+            if coord_payload is None:
+                coord_payload = self._extract_coord_payload(cube)
             signature = coord_payload.as_signature()
             match = self._coord_signature == signature
 
@@ -1021,7 +1101,7 @@ class ProtoCube(object):
 
         return axis
 
-    def _define_space(self, space, positions, indexes, function_matrix):
+    def _define_space(self, space, positions, function_matrix):
         """
         Given the derived :class:`ProtoCube` space, define this space in terms of its
         dimensionality, shape, coordinates and associated coordinate to space dimension mappings.
@@ -1033,11 +1113,7 @@ class ProtoCube(object):
             candidate dimensions within the space.
 
         * positions:
-            A list containing a dictionary of candidate dimension key to
-            scalar value pairs for each source-cube.
-
-        * indexes:
-            A cross-reference dictionary for each candidate dimension.
+            The :class:`_Positions` of the candidate dimensions.
 
         * function_matrix:
             The function mapping dictionary for each candidate dimension that
@@ -1059,15 +1135,17 @@ class ProtoCube(object):
         for name in names:
             if space[name] is None:
                 if _is_combination(name):
-                    members = name.split(_COMBINATION_JOIN)
-                    cells = [tuple([position[int(member) if member.isdigit() else member] for member in members]) for position in positions]
+                    members = _combination_members(name)
+                    codes, _ = positions.combined_codes(members)
                     dim_by_name[name] = len(self._shape)
                     self._nd_names.append(name)
-                    self._shape.append(len(cells))
-                    self._cache_by_name[name] = {cell:index for index, cell in enumerate(cells)}
+                    self._shape.append(len(positions))
+                    # Each unique cell is indexed by its last occurrence.
+                    self._cache_by_name[name] = {tuple([positions.value(member, index) for member in members]): int(index)
+                                                 for index in positions.last_indices(codes)}
                 else:
                     # TODO: Consider appropriate sort order (ascending, decending) i.e. use CF positive attribute.
-                    cells = sorted(indexes[name])
+                    cells = sorted(positions.values[name])
                     points = np.array([cell.point for cell in cells], dtype=metadata[name].points_dtype)
                     bounds = np.array([cell.bound for cell in cells], dtype=metadata[name].bounds_dtype) if cells[0].bound is not None else None
                     kwargs = dict(zip(iris.coords.CoordDefn._fields, defns[name]))
@@ -1099,7 +1177,8 @@ class ProtoCube(object):
                 aux_shape = [self._shape[dim] for dim in dims]
                 # Create empty points and bounds in preparation to be filled.
                 points = np.empty(aux_shape, dtype=metadata[name].points_dtype)
-                bounds = np.empty(aux_shape + [len(positions[0][name].bound)], dtype=metadata[name].bounds_dtype) if positions[0][name].bound is not None else None
+                bound = positions.value(name, 0).bound
+                bounds = np.empty(aux_shape + [len(bound)], dtype=metadata[name].bounds_dtype) if bound is not None else None
 
                 # Populate the points and bounds based on the appropriate function mapping.
                 for function_independents, name_value in function_matrix[name].iteritems():
@@ -1129,12 +1208,13 @@ class ProtoCube(object):
         # deferred loading, this does NOT change the shape.
         self._shape.extend(signature.data_shape)
 
-    def _get_cube(self):
+    def _get_cube(self, data=None):
         """
         Returns a cube containing all its coordinates and appropriately shaped
         data that corresponds to this ProtoCube.
 
-        All the values in the cube's data array are masked.
+        All the values in the cube's data array are masked, unless the
+        data is provided.
 
         """
         signature = self._cube_signature
@@ -1142,17 +1222,18 @@ class ProtoCube(object):
         aux_coords_and_dims = [(deepcopy(coord), dims) for coord, dims in self._aux_coords_and_dims]
         kwargs = dict(zip(iris.cube.CubeMetadata._fields, signature.defn))
 
-        # Create fully masked data, i.e. all missing.
-        # (The CubeML checksum doesn't respect the mask, so we zero the
-        # underlying data to ensure repeatable checksums.)
-        if signature.data_manager is None:
-            data = ma.MaskedArray(np.zeros(self._shape,
-                                           signature.data_type),
-                                  mask=np.ones(self._shape, 'bool'),
-                                  fill_value=signature.mdi)
-        else:
-            data = ma.MaskedArray(np.zeros(self._shape, 'object'),
-                                  mask=np.ones(self._shape, 'bool'))
+        if data is None:
+            # Create fully masked data, i.e. all missing.
+            # (The CubeML checksum doesn't respect the mask, so we zero the
+            # underlying data to ensure repeatable checksums.)
+            if signature.data_manager is None:
+                data = ma.MaskedArray(np.zeros(self._shape,
+                                               signature.data_type),
+                                      mask=np.ones(self._shape, 'bool'),
+                                      fill_value=signature.mdi)
+            else:
+                data = ma.MaskedArray(np.zeros(self._shape, 'object'),
+                                      mask=np.ones(self._shape, 'bool'))
 
         cube = iris.cube.Cube(data,
                               dim_coords_and_dims=dim_coords_and_dims,
@@ -1170,21 +1251,74 @@ class ProtoCube(object):
 
         return cube
 
-    def _nd_index(self, position):
-        """Returns the n-dimensional index of this source-cube (position), within the merged cube."""
+    def _proxy_records(self):
+        """
+        Returns a :class:`iris.fileformats.manager.ProxyRecordArray` of the
+        data proxy of each source-cube, or None if the source-cube data is
+        not all single data proxies of the same class that supports records.
 
-        index = []
+        """
+        if self._cube_signature.data_manager is None:
+            return None
+
+        proxies = []
+        for skeleton in self._skeletons:
+            data = skeleton.data
+            if isinstance(data, iris.fileformats.manager.ProxyRecordArray):
+                data = data.proxies()
+            if data.ndim != 0 or isinstance(data, ma.MaskedArray):
+                return None
+            proxies.append(data[()])
+
+        proxy_class = type(proxies[0])
+        if not hasattr(proxy_class, 'record_dtype') or \
+                any([type(proxy) is not proxy_class for proxy in proxies]):
+            return None
+
+        return iris.fileformats.manager.ProxyRecordArray.from_proxies(proxies)
+
+    def _group_by_nd_index(self, positions):
+        """
+        Returns a tuple of the sorted n-dimensional indices within the merged cube,
+        and the indices of the source-cubes (positions) that occupy each of them.
 
+        """
         # Determine the index of the source-cube cell for each dimension.
+        columns = []
         for name in self._nd_names:
+            cache = self._cache_by_name[name]
             if _is_combination(name):
-                members = name.split(_COMBINATION_JOIN)
-                cell = tuple([position[int(member) if member.isdigit() else member] for member in members])
-                index.append(self._cache_by_name[name][cell])
+                members = _combination_members(name)
+                codes, _ = positions.combined_codes(members)
+                cells = [tuple([positions.value(member, index) for member in members])
+                         for index in positions.first_indices(codes)]
+            else:
+                codes = positions.codes[name]
+                cells = positions.values[name]
+            columns.append(np.array([cache[cell] for cell in cells], dtype=np.intp)[codes])
+
+        if columns:
+            shape = self._shape[:len(columns)]
+            flat_indexes = np.ravel_multi_index(columns, shape)
+        else:
+            flat_indexes = np.zeros(len(positions), dtype=np.intp)
+
+        # Stable sort, so that each group is in source-cube order.
+        order = np.argsort(flat_indexes, kind='mergesort')
+        flat_indexes = flat_indexes[order]
+        bounds = np.concatenate([[0], np.flatnonzero(np.diff(flat_indexes)) + 1, [len(order)]])
+
+        nd_indexes = []
+        groups = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            if columns:
+                nd_index = tuple([int(i) for i in np.unravel_index(flat_indexes[start], shape)])
             else:
-                index.append(self._cache_by_name[name][position[name]])
+                nd_index = ()
+            nd_indexes.append(nd_index)
+            groups.append(order[start:stop].tolist())
 
-        return tuple(index)
+        return nd_indexes, groups
 
     def _build_coordinates(self):
         """
@@ -1249,7 +1383,8 @@ class ProtoCube(object):
                               self._vector_aux_coords_dims):
             aux_coords_and_dims.append(_CoordAndDims(item.coord, dims))
 
-    def _build_signature(self, cube):
+    @staticmethod
+    def _build_signature(cube):
         """Generate the signature that defines this cube."""
 
         defn = cube.metadata
@@ -1273,7 +1408,8 @@ class ProtoCube(object):
         skeleton = _Skeleton(coord_payload.scalar.values, cube._data)
         self._skeletons.append(skeleton)
 
-    def _extract_coord_payload(self, cube):
+    @classmethod
+    def _extract_coord_payload(cls, cube):
         """
         Extract all relevant coordinate data and metadata from the cube.
 
@@ -1298,7 +1434,7 @@ class ProtoCube(object):
         
         # Coordinate hint ordering dictionary - from most preferred to least.
         # Copes with duplicate hint entries, where the most preferred is king.
-        hint_dict = {name: i for i, name in zip(range(len(self._hints), 0, -1), self._hints[::-1])}
+        hint_dict = {name: i for i, name in zip(range(len(cls._hints), 0, -1), cls._hints[::-1])}
         # Coordinate axis ordering dictionary.
         axis_dict = {'T': 0, 'Z': 1, 'Y': 2, 'X': 3}
         # Coordinate sort function - by coordinate hint, then by guessed coordinate axis, then
@@ -278,7 +278,7 @@ def coord_comparison(*cubes):
 class Aggregator(object):
     """Convenience class that supports common aggregation functionality."""
     
-    def __init__(self, history, cell_method, call_func, **kwargs):
+    def __init__(self, history, cell_method, call_func, partial=None, **kwargs):
         """
         Create an aggregator for the given call_func.
         
@@ -293,6 +293,9 @@ class Aggregator(object):
         
         Kwargs:
         
+        * partial:
+            The partial aggregation of call_func, which allows the data to
+            be aggregated one chunk at a time. See :meth:`initialise`.
         * kwargs:
             Passed through to call_func.
         
@@ -304,6 +307,7 @@ class Aggregator(object):
         self.call_func = call_func
         '''Data aggregation function.'''
 
+        self._partial = partial
         self._kwargs = kwargs
 
     def aggregate(self, data, axis, **kwargs):
@@ -384,11 +388,110 @@ class Aggregator(object):
         collapsed_cube.data = iris.util.ensure_array(data_result)
         return collapsed_cube
 
+    def supports_partial(self, **kwargs):
+        """
+        Does this aggregator support partial aggregation with the given
+        keywords? See :meth:`initialise`.
+
+        """
+        return self._partial is not None
+
+    def supports_exact_partial(self, **kwargs):
+        """
+        Does this aggregator support partial aggregation with the given
+        keywords, with the same result as :meth:`aggregate`? Partial
+        aggregation of percentiles and medians is only approximate.
+
+        """
+        return self.supports_partial(**kwargs) and self._partial.exact
+
+    def initialise(self, shape, **kwargs):
+        """
+        Returns the initial partial state of the aggregation, for an
+        aggregated result of the given shape.
+
+        Partial aggregation allows data to be aggregated one chunk at a time.
+        The state of each chunk is accumulated into a partial state with
+        :meth:`accumulate`, partial states of different chunks may be
+        combined with :meth:`combine`, and :meth:`finalise` returns the
+        aggregated data of a partial state. Each partial state is a tuple of
+        arrays, the leading dimensions of each being the shape of the
+        aggregated result.
+
+        Keyword arguments are as for :meth:`aggregate`, except that the
+        weights of a weighted aggregation are passed to :meth:`accumulate`
+        with each chunk of data.
+
+        """
+        return self._partial_aggregation().initialise(shape, **self._partial_kwargs(kwargs))
+
+    def accumulate(self, state, data, axis, **kwargs):
+        """
+        Returns the partial state resulting from accumulating the aggregation
+        of the chunk of data along the axis into the partial state.
+
+        """
+        return self._partial_aggregation().accumulate(state, data, axis, **self._partial_kwargs(kwargs))
+
+    def combine(self, state, other):
+        """Returns the partial state resulting from combining two partial states."""
+        return self._partial_aggregation().combine(state, other)
+
+    def finalise(self, state, **kwargs):
+        """Returns the aggregated data of the partial state."""
+        return self._partial_aggregation().finalise(state, **self._partial_kwargs(kwargs))
+
+    def aggregate_segments(self, data, starts, axis, **kwargs):
+        """
+        Perform the aggregation function on each of the consecutive segments
+        of the data along the axis, which start at the given indices, by
+        partial aggregation.
+
+        Returns:
+            The aggregated data, with one element per segment along the axis.
+
+        """
+        partial = self._partial_aggregation()
+        kwargs = self._partial_kwargs(kwargs)
+        return partial.finalise(partial.segment_state(data, starts, axis, **kwargs), **kwargs)
+
+    def supports_rolling(self, **kwargs):
+        """
+        Does this aggregator support rolling window aggregation with
+        :meth:`aggregate_rolling`, given the keywords?
+
+        """
+        return self.supports_exact_partial(**kwargs) and \
+            self._partial.rolling and kwargs.get('weights') is None and \
+            not kwargs.get('returned', False)
+
+    def aggregate_rolling(self, data, window, axis, **kwargs):
+        """
+        Perform the aggregation function on each window of the given length
+        along the axis of the data, in time proportional to the size of the
+        data rather than to the size of the data times the window length.
+
+        Returns:
+            The aggregated data, with one element per window along the axis.
+
+        """
+        partial = self._partial_aggregation()
+        kwargs = self._partial_kwargs(kwargs)
+        return partial.finalise(partial.rolling_state(data, window, axis, **kwargs), **kwargs)
+
+    def _partial_aggregation(self):
+        if self._partial is None:
+            raise ValueError('The %r aggregator does not support partial aggregation.' % self.cell_method)
+        return self._partial
+
+    def _partial_kwargs(self, kwargs):
+        return dict(self._kwargs.items() + kwargs.items())
+
 
 class WeightedAggregator(Aggregator):
 
-    def __init__(self, history, cell_method, call_func, **kwargs):
-        Aggregator.__init__(self, history, cell_method, call_func, **kwargs)
+    def __init__(self, history, cell_method, call_func, partial=None, **kwargs):
+        Aggregator.__init__(self, history, cell_method, call_func, partial, **kwargs)
 
         self._weighting_keywords = ["returned", "weights"]
         '''A list of keywords that trigger weighted behaviour.'''
@@ -427,6 +530,15 @@ class WeightedAggregator(Aggregator):
 
         return result
 
+    def supports_partial(self, **kwargs):
+        """
+        Does this aggregator support partial aggregation with the given
+        keywords? Only some aggregators support weighted partial aggregation.
+
+        """
+        return Aggregator.supports_partial(self) and \
+            (self._partial.weighted or not self.uses_weighting(**kwargs))
+
 
 def _percentile(data, axis, percent, **kwargs):
     # NB. scipy.stats.mstats.scoreatpercentile always works across just the first
@@ -461,12 +573,501 @@ def _rms(array, axis, **kwargs):
     return np.sqrt(np.sum(np.square(array), axis=axis) / n_elements)
 
 
+def _segment_lengths(data, starts, axis):
+    """The lengths of the consecutive segments of the data along the axis."""
+    return np.diff(np.append(starts, data.shape[axis]))
+
+
+def _segment_count(data, starts, axis):
+    """The number of unmasked values of consecutive segments of the data along the axis."""
+    if ma.getmask(data) is not ma.nomask:
+        return np.add.reduceat(~data.mask, starts, axis=axis, dtype=np.intp)
+    lengths_shape = [1] * data.ndim
+    lengths_shape[axis] = len(starts)
+    shape = list(data.shape)
+    shape[axis] = len(starts)
+    return np.zeros(shape, dtype=np.intp) + _segment_lengths(data, starts, axis).reshape(lengths_shape)
+
+
+def _segment_sum(data, starts, axis):
+    """The sum of the unmasked values of consecutive segments of the data along the axis."""
+    return np.add.reduceat(ma.filled(data, 0), starts, axis=axis, dtype=np.float64)
+
+
+def _rolling_sum(data, window, axis, dtype=np.float64):
+    """
+    The sum of the unmasked values of each window of the data along the axis:
+    the sum of the suffix of one block of the window length and the prefix of
+    the next block, as for :func:`_rolling_extreme`. Unlike a difference of
+    cumulative sums, a non-finite value only affects the windows containing it.
+
+    """
+    data = ma.filled(data, 0)
+    data = np.rollaxis(data, axis % data.ndim, data.ndim)
+    length = data.shape[-1]
+    n_blocks = -(-length // window)
+    padded = np.zeros(data.shape[:-1] + (n_blocks * window,), dtype=dtype)
+    padded[..., :length] = data
+    blocks = padded.reshape(data.shape[:-1] + (n_blocks, window))
+    prefix = np.cumsum(blocks, axis=-1).reshape(padded.shape)
+    suffix = np.cumsum(blocks[..., ::-1], axis=-1)[..., ::-1]
+    suffix = suffix.reshape(padded.shape)
+    n_windows = length - window + 1
+    total = suffix[..., :n_windows].copy()
+    # Only the windows which don't start a block extend into the next block.
+    straddles = np.arange(n_windows) % window != 0
+    prefix = prefix[..., window - 1:window - 1 + n_windows]
+    total[..., straddles] += prefix[..., straddles]
+    return np.rollaxis(total, -1, axis % data.ndim)
+
+
+def _rolling_count(data, window, axis):
+    """The number of unmasked values of each window of the data along the axis."""
+    if ma.getmask(data) is not ma.nomask:
+        return _rolling_sum(~data.mask, window, axis, dtype=np.intp)
+    shape = list(data.shape)
+    shape[axis] -= window - 1
+    count = np.empty(shape, dtype=np.intp)
+    count.fill(window)
+    return count
+
+
+def _rolling_extreme(data, window, axis, function, initial):
+    """
+    The extreme of the unmasked values of each window of the data along the
+    axis, by the van Herk/Gil-Werman algorithm: the extreme of a window is
+    that of the suffix of one block of the window length and the prefix of
+    the next block.
+
+    """
+    data = ma.filled(ma.asarray(data, dtype=np.float64), initial)
+    data = np.rollaxis(data, axis % data.ndim, data.ndim)
+    length = data.shape[-1]
+    n_blocks = -(-length // window)
+    padded = np.empty(data.shape[:-1] + (n_blocks * window,))
+    padded.fill(initial)
+    padded[..., :length] = data
+    blocks = padded.reshape(data.shape[:-1] + (n_blocks, window))
+    prefix = function.accumulate(blocks, axis=-1).reshape(padded.shape)
+    suffix = function.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1]
+    suffix = suffix.reshape(padded.shape)
+    n_windows = length - window + 1
+    extreme = function(suffix[..., :n_windows],
+                       prefix[..., window - 1:window - 1 + n_windows])
+    return np.rollaxis(extreme, -1, axis % data.ndim)
+
+
+class _PartialAggregation(object):
+    """
+    The mergeable partial state of an aggregation, which allows data to be
+    aggregated one chunk at a time.
+
+    The state is a tuple of arrays, the leading dimensions of each being the
+    shape of the aggregated result. The first array of the state is always
+    the number of unmasked values that have been accumulated.
+
+    """
+    #: The initial value of each array of the state.
+    initial = (0, 0.0)
+
+    #: Whether the result is the same as that of aggregating all the data at once.
+    exact = True
+
+    #: Whether weighted aggregation is supported, with the "weights" keyword.
+    weighted = False
+
+    #: Whether the state of each window of a rolling window aggregation can
+    #: be found with running totals, by :meth:`rolling_state`.
+    rolling = False
+
+    def initialise(self, shape, **kwargs):
+        state = []
+        for value in self.initial:
+            array = np.empty(shape, dtype=np.array(value).dtype)
+            array.fill(value)
+            state.append(array)
+        return tuple(state)
+
+    def accumulate(self, state, data, axis, **kwargs):
+        return self.combine(state, self.chunk_state(data, axis, **kwargs))
+
+    def chunk_state(self, data, axis, **kwargs):
+        """Returns the state of the given chunk of data, aggregated along the axis."""
+        raise NotImplementedError
+
+    def segment_state(self, data, starts, axis, **kwargs):
+        """
+        Returns the state of consecutive segments of the data along the
+        axis, which start at the given indices. The shape of the state is
+        that of the data, except for one element per segment along the axis.
+
+        """
+        shape = list(data.shape)
+        shape[axis] = len(starts)
+        state = self.initialise(shape, **kwargs)
+        data_key = [slice(None)] * data.ndim
+        state_key = [slice(None)] * data.ndim
+        for i, (start, length) in enumerate(zip(starts, _segment_lengths(data, starts, axis))):
+            data_key[axis] = slice(start, start + length)
+            state_key[axis] = i
+            segment_state = self.chunk_state(data[tuple(data_key)], axis, **kwargs)
+            for array, segment_array in zip(state, segment_state):
+                array[tuple(state_key)] = segment_array
+        return state
+
+    def rolling_state(self, data, window, axis, **kwargs):
+        """
+        Returns the state of each window of the given length along the axis
+        of the data. The shape of the state is that of the data, except for
+        one element per window along the axis.
+
+        """
+        raise NotImplementedError
+
+    def combine(self, state, other):
+        return tuple([a + b for a, b in zip(state, other)])
+
+    def finalise(self, state, **kwargs):
+        raise NotImplementedError
+
+
+class _SumPartial(_PartialAggregation):
+    """The partial state of a sum: the number and sum of the values."""
+    rolling = True
+
+    def chunk_state(self, data, axis, **kwargs):
+        return (ma.count(data, axis=axis),
+                ma.filled(ma.sum(data, axis=axis, dtype=np.float64), 0))
+
+    def segment_state(self, data, starts, axis, **kwargs):
+        return (_segment_count(data, starts, axis),
+                _segment_sum(data, starts, axis))
+
+    def rolling_state(self, data, window, axis, **kwargs):
+        return (_rolling_count(data, window, axis),
+                _rolling_sum(data, window, axis))
+
+    def finalise(self, state, **kwargs):
+        count, total = state
+        return ma.masked_array(total, mask=count == 0)
+
+
+class _MeanPartial(_PartialAggregation):
+    """
+    The partial state of a mean, optionally weighted: the number of values,
+    the sum of their weights and the weighted sum of the values.
+
+    """
+    initial = (0, 0.0, 0.0)
+    weighted = True
+    rolling = True
+
+    def chunk_state(self, data, axis, weights=None, **kwargs):
+        count = ma.count(data, axis=axis)
+        if weights is None:
+            weights_total = np.asarray(count, dtype=np.float64)
+            total = ma.sum(data, axis=axis, dtype=np.float64)
+        else:
+            weights = ma.masked_array(weights, mask=ma.getmaskarray(data))
+            weights_total = ma.sum(weights, axis=axis, dtype=np.float64)
+            total = ma.sum(data * weights, axis=axis, dtype=np.float64)
+        return (count, ma.filled(weights_total, 0), ma.filled(total, 0))
+
+    def segment_state(self, data, starts, axis, weights=None, **kwargs):
+        count = _segment_count(data, starts, axis)
+        if weights is None:
+            weights_total = count.astype(np.float64)
+            total = _segment_sum(data, starts, axis)
+        else:
+            weights = ma.masked_array(weights, mask=ma.getmaskarray(data))
+            weights_total = _segment_sum(weights, starts, axis)
+            total = _segment_sum(data * weights, starts, axis)
+        return (count, weights_total, total)
+
+    def rolling_state(self, data, window, axis, **kwargs):
+        count = _rolling_count(data, window, axis)
+        return (count, count.astype(np.float64),
+                _rolling_sum(data, window, axis))
+
+    def finalise(self, state, returned=False, **kwargs):
+        count, weights_total, total = state
+        result = total / np.where(weights_total == 0, 1, weights_total)
+        result = ma.masked_array(result, mask=count == 0)
+        if returned:
+            result = (result, weights_total)
+        return result
+
+
+class _CountPartial(_PartialAggregation):
+    """The partial state of a count: the number of values, and of those matching the function."""
+    initial = (0, 0)
+    rolling = True
+
+    def chunk_state(self, data, axis, **kwargs):
+        return (ma.count(data, axis=axis),
+                ma.filled(_count(data, axis=axis, **kwargs), 0))
+
+    def segment_state(self, data, starts, axis, function, **kwargs):
+        if not callable(function):
+            raise ValueError('function must be a callable. Got %s.' % type(function))
+        matches = ma.filled(function(data), False).astype(np.intp)
+        return (_segment_count(data, starts, axis),
+                np.add.reduceat(matches, starts, axis=axis))
+
+    def rolling_state(self, data, window, axis, function, **kwargs):
+        if not callable(function):
+            raise ValueError('function must be a callable. Got %s.' % type(function))
+        matches = ma.filled(function(data), False)
+        return (_rolling_count(data, window, axis),
+                _rolling_sum(matches, window, axis, dtype=np.intp))
+
+    def finalise(self, state, **kwargs):
+        count, matches = state
+        return ma.masked_array(matches, mask=count == 0)
+
+
+class _ProportionPartial(_CountPartial):
+    """The partial state of a proportion, which is that of a count."""
+    def finalise(self, state, **kwargs):
+        count, matches = state
+        return ma.masked_array(matches / np.maximum(count, 1), mask=count == 0)
+
+
+class _ExtremePartial(_PartialAggregation):
+    """The partial state of a maximum or minimum: the number of values and their extreme."""
+    rolling = True
+
+    def __init__(self, maximum):
+        self._function = np.maximum if maximum else np.minimum
+        self._reduction = ma.max if maximum else ma.min
+        self.initial = (0, -np.inf if maximum else np.inf)
+
+    def chunk_state(self, data, axis, **kwargs):
+        extreme = ma.asarray(self._reduction(data, axis=axis), dtype=np.float64)
+        return (ma.count(data, axis=axis), ma.filled(extreme, self.initial[1]))
+
+    def segment_state(self, data, starts, axis, **kwargs):
+        count = _segment_count(data, starts, axis)
+        if ma.getmask(data) is not ma.nomask:
+            data = ma.filled(data.astype(np.float64), self.initial[1])
+        extreme = self._function.reduceat(data, starts, axis=axis)
+        return (count, extreme.astype(np.float64))
+
+    def rolling_state(self, data, window, axis, **kwargs):
+        return (_rolling_count(data, window, axis),
+                _rolling_extreme(data, window, axis, self._function,
+                                 self.initial[1]))
+
+    def combine(self, state, other):
+        return (state[0] + other[0], self._function(state[1], other[1]))
+
+    def finalise(self, state, **kwargs):
+        count, extreme = state
+        return ma.masked_array(extreme, mask=count == 0)
+
+
+class _VariancePartial(_PartialAggregation):
+    """
+    The partial state of a variance or standard deviation: the number of
+    values, their mean and the sum of their squared deviations from the mean.
+
+    States are combined with the parallel form of Welford's algorithm.
+
+    """
+    initial = (0, 0.0, 0.0)
+
+    def __init__(self, std=False):
+        self._std = std
+
+    def chunk_state(self, data, axis, **kwargs):
+        count = ma.count(data, axis=axis)
+        mean = ma.filled(ma.mean(data, axis=axis, dtype=np.float64), 0)
+        sum_squares = ma.filled(ma.var(data, axis=axis, dtype=np.float64), 0) * count
+        return (count, mean, sum_squares)
+
+    def segment_state(self, data, starts, axis, **kwargs):
+        count = _segment_count(data, starts, axis)
+        mean = _segment_sum(data, starts, axis) / np.maximum(count, 1)
+        deviations = data - np.repeat(mean, _segment_lengths(data, starts, axis), axis=axis)
+        return (count, mean, _segment_sum(deviations ** 2, starts, axis))
+
+    def combine(self, state, other):
+        count_a, mean_a, sum_squares_a = state
+        count_b, mean_b, sum_squares_b = other
+        count = count_a + count_b
+        weight = count_b / np.maximum(count, 1)
+        delta = mean_b - mean_a
+        mean = mean_a + delta * weight
+        sum_squares = sum_squares_a + sum_squares_b + delta ** 2 * count_a * weight
+        return (count, mean, sum_squares)
+
+    def finalise(self, state, ddof=0, **kwargs):
+        count, _, sum_squares = state
+        dof = count - ddof
+        result = sum_squares / np.maximum(dof, 1)
+        if self._std:
+            result = np.sqrt(result)
+        return ma.masked_array(result, mask=dof <= 0)
+
+
+class _RMSPartial(_PartialAggregation):
+    """
+    The partial state of a root mean square: the number of unmasked values,
+    the number of values, and the sum of the squared values.
+
+    """
+    initial = (0, 0, 0.0)
+    rolling = True
+
+    def chunk_state(self, data, axis, **kwargs):
+        count = np.asarray(ma.count(data, axis=axis))
+        size = np.empty(count.shape, dtype=count.dtype)
+        size.fill(data.shape[axis])
+        sum_squares = ma.filled(ma.sum(np.square(data), axis=axis, dtype=np.float64), 0)
+        return (count, size, sum_squares)
+
+    def segment_state(self, data, starts, axis, **kwargs):
+        size = _segment_count(np.asarray(data), starts, axis)
+        return (_segment_count(data, starts, axis), size,
+                _segment_sum(np.square(data), starts, axis))
+
+    def rolling_state(self, data, window, axis, **kwargs):
+        return (_rolling_count(data, window, axis),
+                _rolling_count(np.asarray(data), window, axis),
+                _rolling_sum(np.square(data), window, axis))
+
+    def finalise(self, state, **kwargs):
+        count, size, sum_squares = state
+        result = np.sqrt(sum_squares / np.maximum(size, 1))
+        return ma.masked_array(result, mask=count == 0)
+
+
+class _QuantileSketch(_PartialAggregation):
+    """
+    The approximate partial state of a percentile or median: the number of
+    values, and a sketch of their distribution as at most sketch_size
+    weighted centroids, sorted by value with any unused centroids last.
+
+    The sketch is exact while no more than sketch_size values have been
+    accumulated. Beyond that, neighbouring values are merged into centroids
+    of roughly equal weight, and the percentile is interpolated between the
+    centroids.
+
+    """
+    exact = False
+
+    def __init__(self, percent=None):
+        self._percent = percent
+
+    def initialise(self, shape, sketch_size=100, **kwargs):
+        shape = tuple(shape)
+        values = np.empty(shape + (sketch_size,))
+        values.fill(np.nan)
+        return (np.zeros(shape, dtype=np.int64), values,
+                np.zeros(shape + (sketch_size,)))
+
+    def accumulate(self, state, data, axis, **kwargs):
+        return self._merge(state, self.chunk_state(data, axis, **kwargs),
+                           state[1].shape[-1])
+
+    def chunk_state(self, data, axis, **kwargs):
+        data = ma.asarray(data)
+        data = np.rollaxis(data, axis % data.ndim, data.ndim)
+        count = np.asarray(ma.count(data, axis=-1), dtype=np.int64)
+        values = ma.filled(data.astype(np.float64), np.nan)
+        weights = (~ma.getmaskarray(data)).astype(np.float64)
+        return (count, values, weights)
+
+    def combine(self, state, other):
+        return self._merge(state, other,
+                           max(state[1].shape[-1], other[1].shape[-1]))
+
+    def _merge(self, state, other, sketch_size):
+        count = state[0] + other[0]
+        shape = count.shape
+        values = np.concatenate([state[1], other[1]], axis=-1)
+        values = values.reshape(-1, values.shape[-1])
+        weights = np.concatenate([state[2], other[2]], axis=-1)
+        weights = weights.reshape(values.shape)
+        values, weights = self._sort(values, weights)
+
+        n_elements, n_centroids = values.shape
+        if n_centroids <= sketch_size:
+            # Pad out to the full size of the sketch.
+            padding = sketch_size - n_centroids
+            values = np.hstack([values, np.empty((n_elements, padding))])
+            values[:, n_centroids:] = np.nan
+            weights = np.hstack([weights, np.zeros((n_elements, padding))])
+        else:
+            # Assign each centroid to one of sketch_size bins, keeping the
+            # centroids distinct where they all fit, and otherwise dividing
+            # their cumulative weight into bins of equal weight.
+            used = weights > 0
+            rank = np.cumsum(used, axis=-1) - 1
+            total = weights.sum(axis=-1)[:, np.newaxis]
+            middle = (np.cumsum(weights, axis=-1) - weights / 2) / \
+                np.where(total == 0, 1, total)
+            bins = np.where(used.sum(axis=-1)[:, np.newaxis] <= sketch_size,
+                            np.maximum(rank, 0),
+                            (middle * sketch_size).astype(np.intp))
+            bins = np.minimum(bins, sketch_size - 1)
+            bins += np.arange(n_elements)[:, np.newaxis] * sketch_size
+            bin_weights = np.bincount(bins.ravel(), weights.ravel(),
+                                      minlength=n_elements * sketch_size)
+            bin_totals = np.bincount(bins.ravel(),
+                                     np.where(used, values * weights, 0).ravel(),
+                                     minlength=n_elements * sketch_size)
+            weights = bin_weights.reshape(n_elements, sketch_size)
+            values = bin_totals.reshape(weights.shape) / \
+                np.where(weights == 0, 1, weights)
+            values[weights == 0] = np.nan
+            values, weights = self._sort(values, weights)
+
+        return (count, values.reshape(shape + (sketch_size,)),
+                weights.reshape(shape + (sketch_size,)))
+
+    @staticmethod
+    def _sort(values, weights):
+        """Sort the centroids of each row by value, with unused centroids (NaN) last."""
+        order = np.argsort(values, axis=-1)
+        rows = np.arange(values.shape[0])[:, np.newaxis]
+        return values[rows, order], weights[rows, order]
+
+    def finalise(self, state, percent=None, **kwargs):
+        if self._percent is not None:
+            percent = self._percent
+        count, values, weights = state
+        shape = count.shape
+        values = values.reshape(-1, values.shape[-1])
+        weights = weights.reshape(values.shape)
+        rows = np.arange(values.shape[0])
+
+        # Each centroid is centred on its cumulative weight, so for unit
+        # weights the percentile is linearly interpolated between the ranked
+        # values, as for scipy.stats.mstats.scoreatpercentile.
+        used = (weights > 0).sum(axis=-1)
+        positions = np.cumsum(weights, axis=-1) - weights / 2
+        target = (percent / 100.0) * (weights.sum(axis=-1) - 1) + 0.5
+        upper = (positions <= target[:, np.newaxis]).sum(axis=-1)
+        lower = np.maximum(upper - 1, 0)
+        upper = np.maximum(np.minimum(upper, used - 1), 0)
+
+        span = positions[rows, upper] - positions[rows, lower]
+        fraction = (target - positions[rows, lower]) / np.where(span == 0, 1, span)
+        fraction = np.clip(np.where(span == 0, 0, fraction), 0, 1)
+        result = values[rows, lower] + \
+            fraction * (values[rows, upper] - values[rows, lower])
+        result = np.where(used == 0, 0, result).reshape(shape)
+        return ma.masked_array(result, mask=count == 0)
+
+
 #
 # Common partial Aggregation class constructors.
 #
 COUNT = Aggregator('Count of {standard_name:s} {action:s} {coord_names:s}',
                                        'count',
-                                       _count)
+                                       _count,
+                                       partial=_CountPartial())
 """
 The number of data that match the given function.
 
@@ -515,7 +1116,8 @@ For example, to compute zonal harmonic means::
 
 MAX = Aggregator('Maximum of {standard_name:s} {action:s} {coord_names:s}',
               'maximum',
-              ma.max)
+              ma.max,
+              partial=_ExtremePartial(maximum=True))
 """
 The maximum, as computed by :func:`numpy.ma.max`.
 
@@ -528,7 +1130,8 @@ For example, to compute zonal maximums::
 
 MEAN = WeightedAggregator('Mean of {standard_name:s} {action:s} {coord_names:s}',
                'mean',
-               ma.average)
+               ma.average,
+               partial=_MeanPartial())
 """
 The mean, as computed by :func:`numpy.ma.average`.
 
@@ -555,7 +1158,8 @@ For example::
 
 MEDIAN = Aggregator('Median of {standard_name:s} {action:s} {coord_names:s}',
                  'median',
-                 ma.median)
+                 ma.median,
+                 partial=_QuantileSketch(percent=50))
 """
 The median, as computed by :func:`numpy.ma.median`.
 
@@ -563,12 +1167,19 @@ For example, to compute zonal medians::
 
     result = cube.collapsed('longitude', iris.analysis.MEDIAN)
 
+.. note::
+
+    Partial aggregation of the median is approximate, once more values
+    have been accumulated than the "sketch_size" keyword of
+    :meth:`~iris.analysis.Aggregator.initialise` (100 by default).
+
 """
 
 
 MIN = Aggregator('Minimum of {standard_name:s} {action:s} {coord_names:s}',
               'minimum',
-              ma.min)
+              ma.min,
+              partial=_ExtremePartial(maximum=False))
 """
 The minimum, as computed by :func:`numpy.ma.min`.
 
@@ -582,6 +1193,7 @@ For example, to compute zonal minimums::
 PERCENTILE = Aggregator('Percentile ({percent}%) of {standard_name:s} {action:s} {coord_names:s}',
                   'percentile ({percent}%)',
                   _percentile,
+                  partial=_QuantileSketch(),
                   alphap=1, 
                   betap=1,
                   )
@@ -601,13 +1213,17 @@ For example, to compute the 90th percentile over time::
 
     The default values of ``alphap`` and ``betap`` are both 1. For detailed
     meanings on these values see :func:`scipy.stats.mstats.mquantiles`.
+    Partial aggregation ignores them, and is approximate once more values
+    have been accumulated than the "sketch_size" keyword of
+    :meth:`~iris.analysis.Aggregator.initialise` (100 by default).
 
 """
 
 
 PROPORTION = Aggregator('Proportion of {standard_name:s} {action:s} {coord_names:s}',
                                        'proportion',
-                                       _proportion)
+                                       _proportion,
+                                       partial=_ProportionPartial())
 """
 The proportion, as a decimal, of data that match the given function.
 
@@ -637,7 +1253,8 @@ Similarly, the proportion of times precipitation exceeded 10 (in cube data units
 
 RMS = Aggregator('Root mean square of {standard_name} {action} {coord_names}',
                  'root mean square',
-                 _rms)
+                 _rms,
+                 partial=_RMSPartial())
 """
 The root mean square, as computed by ((x0**2 + x1**2 + ... + xN-1**2) / N) ** 0.5.
 
@@ -651,6 +1268,7 @@ For example, to compute zonal root mean square::
 STD_DEV = Aggregator('Standard deviation of {standard_name:s} {action:s} {coord_names:s} (delta degrees of freedom: {ddof:d})',
                   'standard_deviation',
                   ma.std,
+                  partial=_VariancePartial(std=True),
                   ddof=1)
 """
 The standard deviation, as computed by :func:`numpy.ma.std`.
@@ -674,7 +1292,8 @@ For example, to obtain the biased standard deviation::
 
 SUM = Aggregator('Sum of {standard_name:s} {action:s} {coord_names:s}',
               'sum',
-              ma.sum)
+              ma.sum,
+              partial=_SumPartial())
 """
 The sum of a dataset, as computed by :func:`numpy.ma.sum`.
 
@@ -688,6 +1307,7 @@ For example, to compute an accumulation over time::
 VARIANCE = Aggregator('Variance of {standard_name:s} {action:s} {coord_names:s} (delta degrees of freedom: {ddof:d})',
                    'variance',
                    ma.var,
+                   partial=_VariancePartial(),
                    ddof=1)
 """
 The variance, as computed by :func:`numpy.ma.var`.
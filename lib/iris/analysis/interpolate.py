@@ -22,10 +22,12 @@ See also: :mod:`NumPy <numpy>`, and :ref:`SciPy <scipy:modindex>`.
 """
 import collections
 import warnings
+import zlib
 
 import numpy as np
 import numpy.ma as ma
 import scipy
+import scipy.sparse
 import scipy.spatial
 from scipy.interpolate.interpolate import interp1d
 
@@ -51,7 +53,7 @@ def _cartesian_sample_points(sample_points, sample_point_coord_names):
     # sample_point_coord_names[coord] : list of n coord names
     #
     # Output:
-    # list of [x,y,z,t,etc] positions, formatted for kdtree
+    # array of [t,etc,x,y,z] positions, formatted for kdtree
 
     # Find lat and lon coord indices
     i_lat = i_lon = None
@@ -67,22 +69,126 @@ def _cartesian_sample_points(sample_points, sample_point_coord_names):
     if i_lat is None or i_lon is None:
         return sample_points.transpose()
     
-    num_points = len(sample_points[0])
-    cartesian_points = [None] * num_points
+    # Add cartesian xyz coordinates from latlon, after the other coordinates.
+    x, y, z = _ll_to_cart(sample_points[i_lon], sample_points[i_lat])
+    columns = [sample_points[c] for c in i_non_latlon] + [x, y, z]
+    return np.column_stack(columns)
 
-    # Get the point coordinates without the latlon
-    for p in range(num_points):
-        cartesian_points[p] = [sample_points[c][p] for c in i_non_latlon]
 
-    # Add cartesian xyz coordinates from latlon
-    x, y, z = _ll_to_cart(sample_points[i_lon], sample_points[i_lat])
-    for p in range(num_points):
-        cartesian_point = cartesian_points[p]
-        cartesian_point.append(x[p])
-        cartesian_point.append(y[p])
-        cartesian_point.append(z[p])
-        
-    return cartesian_points
+class _SpatialIndex(object):
+    """
+    A nearest neighbour search over the points of some coordinates of a
+    cube, which between them span one or more of the cube's dimensions.
+
+    Geographic latitude and longitude are searched as cartesian positions on
+    the unit sphere, as for :func:`_cartesian_sample_points`.
+
+    """
+    def __init__(self, coords_and_dims):
+        self.coord_names = [coord.name() for coord, dims in coords_and_dims]
+
+        #: The cube dimensions spanned by the index, in ascending order.
+        self.dims = sorted(set(dim for coord, dims in coords_and_dims
+                               for dim in dims))
+        shape = [1] * len(self.dims)
+        for coord, dims in coords_and_dims:
+            for dim, length in zip(dims, coord.shape):
+                shape[self.dims.index(dim)] = length
+        self.shape = tuple(shape)
+
+        # Broadcast the points of each coordinate over all the dimensions of
+        # the index, to give the position of every datum in the sample space.
+        positions = np.empty((len(coords_and_dims), int(np.prod(self.shape))))
+        for position, (coord, dims) in zip(positions, coords_and_dims):
+            points = coord.points
+            if dims:
+                points = points.transpose(np.argsort(dims))
+            points_shape = [length if dim in dims else 1 for dim, length in
+                            zip(self.dims, self.shape)]
+            position.reshape(self.shape)[...] = points.reshape(points_shape)
+        self._positions = _cartesian_sample_points(positions, self.coord_names)
+        self._kdtree = None
+
+    def __getstate__(self):
+        # The KD-tree is re-built when needed, rather than copied or pickled.
+        state = self.__dict__.copy()
+        state['_kdtree'] = None
+        return state
+
+    def query(self, values):
+        """
+        Return the indices of the data nearest to the given sample points.
+
+        Args:
+
+        * values
+            A sequence containing, for each coordinate of the index, a value
+            or a sequence of values. The values of all the coordinates
+            together define the sample points.
+
+        Returns:
+            A tuple containing, for each dimension in :attr:`dims`, an array
+            of the index along that dimension of each sample point.
+
+        """
+        sample_points = np.array([np.array(value, dtype=float, ndmin=1)
+                                  for value in values])
+        if not self.dims:
+            return ()
+        if self._kdtree is None:
+            self._kdtree = scipy.spatial.cKDTree(self._positions)
+        cartesian_points = _cartesian_sample_points(sample_points,
+                                                    self.coord_names)
+        distances, flat_indices = self._kdtree.query(cartesian_points)
+        return np.unravel_index(flat_indices, self.shape)
+
+
+def _spatial_index(cube, coords):
+    """
+    Return the :class:`_SpatialIndex` of the given coordinates of the cube.
+
+    The index is cached on the first of the coordinates, and is re-built when
+    the dimensions the coordinates map to change, or when their points are
+    set or modified in place.
+
+    """
+    ok_coord_ids = set(map(id, cube.dim_coords + cube.aux_coords))
+    coords_and_dims = []
+    key = []
+    for coord in coords:
+        if id(coord) not in ok_coord_ids:
+            msg = ('Invalid sample coordinate {!r}: derived coordinates are'
+                   ' not allowed.'.format(coord.name()))
+            raise ValueError(msg)
+        dims = cube.coord_dims(coord)
+        coords_and_dims.append((coord, dims))
+        key.append((id(coord), coord.name(), tuple(dims),
+                    getattr(coord, '_points_version', 0),
+                    _points_fingerprint(coord)))
+    key = tuple(key)
+
+    cache = getattr(coords[0], '_spatial_index_cache', None)
+    if cache is None or cache[0] != key:
+        cache = (key, _SpatialIndex(coords_and_dims))
+        coords[0]._spatial_index_cache = cache
+    return cache[1]
+
+
+def _points_fingerprint(coord):
+    """
+    Returns a checksum of the points of the coordinate if they can be
+    modified in place, or None if they are read-only.
+
+    Setting the points is tracked by the coordinate's points version, but
+    writing into the points array is only detected by this checksum.
+
+    """
+    points = coord._points
+    flags = getattr(points, 'flags', None)
+    if flags is None or not flags.writeable:
+        return None
+    # Ensure points are row-major contiguous for crc32 computation.
+    return zlib.crc32(np.ascontiguousarray(points))
 
 
 def nearest_neighbour_indices(cube, sample_points):
@@ -176,15 +282,10 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_point, cache=None):
     This function is adapted for points sampling a multi-dimensional coord,
     and can currently only do nearest neighbour interpolation.
     
-    Because this function can be slow for multidimensional coordinates,
-    a 'cache' dictionary can be provided by the calling code. 
+    The nearest neighbour search is cached on the sample coordinates, so
+    the 'cache' argument is no longer needed and is ignored.
     
     """
-    
-    # Developer notes:
-    # A "sample space cube" is made which only has the coords and dims we are sampling on.
-    # We get the nearest neighbour using this sample space cube.
-    
     if isinstance(sample_point, dict):
         warnings.warn('Providing a dictionary to specify points is deprecated. Please provide a list of (coordinate, values) pairs.')
         sample_point = sample_point.items()
@@ -196,93 +297,22 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_point, cache=None):
             raise ValueError('Sample points must be a list of (coordinate, value) pairs. Got %r.' % sample_point)
     
     # Convert names to coords in sample_point
-    point = []
-    ok_coord_ids = set(map(id, cube.dim_coords + cube.aux_coords))
+    coords = []
+    values = []
     for coord, value in sample_point:
         if isinstance(coord, basestring):
             coord = cube.coord(coord)
         else:
             coord = cube.coord(coord=coord)
-        if id(coord) not in ok_coord_ids:
-            msg = ('Invalid sample coordinate {!r}: derived coordinates are'
-                   ' not allowed.'.format(coord.name()))
-            raise ValueError(msg)
-        point.append((coord, value))
-        
-    # Reformat sample_point for use in _cartesian_sample_points(), below.
-    sample_point = np.array([[value] for coord, value in point])
-    sample_point_coords = [coord for coord, value in point]
-    sample_point_coord_names = [coord.name() for coord, value in point]
-
-    # Which dims are we sampling?
-    sample_dims = set()
-    for coord in sample_point_coords:
-        for dim in cube.coord_dims(coord):
-            sample_dims.add(dim)
-    sample_dims = sorted(list(sample_dims))
-
-    # Extract a sub cube that lives in just the sampling space.
-    sample_space_slice = [0] * cube.data.ndim
-    for sample_dim in sample_dims:
-        sample_space_slice[sample_dim] = slice(None, None)
-    sample_space_slice = tuple(sample_space_slice)
-    sample_space_cube = cube[sample_space_slice]
-    
-    #...with just the sampling coords
-    for coord in sample_space_cube.coords():
-        if not coord.name() in sample_point_coord_names:
-            sample_space_cube.remove_coord(coord)
-            
-    # Order the sample point coords according to the sample space cube coords
-    sample_space_coord_names = [coord.name() for coord in sample_space_cube.coords()]
-    new_order = [sample_space_coord_names.index(name) for name in sample_point_coord_names]
-    sample_point = np.array([sample_point[i] for i in new_order])
-    sample_point_coord_names = [sample_point_coord_names[i] for i in new_order]
-    
-    # Convert the sample point to cartesian coords.
-    # If there is no latlon within the coordinate there will be no change.
-    # Otherwise, geographic latlon is replaced with cartesian xyz.
-    cartesian_sample_point = _cartesian_sample_points(sample_point, sample_point_coord_names)[0]
-
-    sample_space_coords = sample_space_cube.dim_coords + sample_space_cube.aux_coords
-    sample_space_coords_and_dims = [(coord, sample_space_cube.coord_dims(coord)) for coord in sample_space_coords]
+        coords.append(coord)
+        values.append(value)
 
-    if cache is not None and cube in cache:
-        kdtree = cache[cube]
-    else:
-        # Create a "sample space position" for each datum: sample_space_data_positions[coord_index][datum_index]
-        sample_space_data_positions = np.empty((len(sample_space_coords_and_dims), sample_space_cube.data.size), dtype=float)
-        for d, ndi in enumerate(np.ndindex(sample_space_cube.data.shape)):
-            for c, (coord, coord_dims) in enumerate(sample_space_coords_and_dims):
-                # Index of this datum along this coordinate (could be nD). 
-                keys = tuple(ndi[ind] for ind in coord_dims) if coord_dims else slice(None, None)
-                # Position of this datum along this coordinate.
-                sample_space_data_positions[c][d] = coord.points[keys]
-
-        # Convert to cartesian coordinates. Flatten for kdtree compatibility.
-        cartesian_space_data_coords = _cartesian_sample_points(sample_space_data_positions, sample_point_coord_names)
-
-        # Get the nearest datum index to the sample point. This is the goal of the function.
-        kdtree = scipy.spatial.cKDTree(cartesian_space_data_coords)
-
-    cartesian_distance, datum_index = kdtree.query(cartesian_sample_point)
-    sample_space_ndi = np.unravel_index(datum_index, sample_space_cube.data.shape)
-
-    # Turn sample_space_ndi into a main cube slice.
-    # Map sample cube to main cube dims and leave the rest as a full slice.
-    main_cube_slice = [slice(None, None)] * cube.data.ndim
-    for sample_coord, sample_coord_dims in sample_space_coords_and_dims:
-        # Find the coord in the main cube
-        main_coord = cube.coord(sample_coord.name())
-        main_coord_dims = cube.coord_dims(main_coord)
-        # Mark the nearest data index/indices with respect to this coord
-        for sample_i, main_i in zip(sample_coord_dims, main_coord_dims):
-            main_cube_slice[main_i] = sample_space_ndi[sample_i]
-
-
-    # Update cache
-    if cache is not None:
-        cache[cube] = kdtree
+    # Find the nearest datum in the sample space of the coords, and turn it
+    # into a main cube slice, leaving the other dims as a full slice.
+    index = _spatial_index(cube, coords)
+    main_cube_slice = [slice(None, None)] * cube.ndim
+    for dim, indices in zip(index.dims, index.query(values)):
+        main_cube_slice[dim] = indices[0]
 
     return tuple(main_cube_slice)
 
@@ -311,8 +341,17 @@ def extract_nearest_neighbour(cube, sample_points):
     Returns:
         A cube that represents uninterpolated data as near to the given points as possible.
 
+    .. note::
+
+        Multi-dimensional coordinates, such as the 2D latitude and longitude
+        of a curvilinear grid, are searched together for the nearest point.
+
     """
-    return cube[nearest_neighbour_indices(cube, sample_points)]
+    try:
+        indices = nearest_neighbour_indices(cube, sample_points)
+    except iris.exceptions.CoordinateMultiDimError:
+        indices = _nearest_neighbour_indices_ndcoords(cube, sample_points)
+    return cube[indices]
 
 
 def nearest_neighbour_data_value(cube, sample_points):
@@ -352,6 +391,310 @@ def nearest_neighbour_data_value(cube, sample_points):
     return cube.data[indices]
 
 
+def _regrid_xy_coords(cube, coord_system):
+    # Returns the x and y coordinates of the cube in the given coordinate
+    # system, and the data dimension (or None) of each of them.
+    #
+    # The x and y coordinates must not share data dimensions with any
+    # other coordinates.
+    x_coord = cube.coord(axis='x', coord_system=coord_system)
+    y_coord = cube.coord(axis='y', coord_system=coord_system)
+
+    x_dims = cube.coord_dims(x_coord)
+    y_dims = cube.coord_dims(y_coord)
+
+    x_dim = None
+    if x_dims:
+        if len(x_dims) > 1:
+            raise ValueError('The source x coordinate may not describe more than one data dimension.')
+        x_dim = x_dims[0]
+        dim_sharers = ', '.join([coord.name() for coord in cube.coords(contains_dimension=x_dim) if coord is not x_coord])
+        if dim_sharers:
+            raise ValueError('No coordinates may share a dimension (dimension %s) with the x '
+                             'coordinate, but (%s) do.' % (x_dim, dim_sharers))
+        
+    y_dim = None     
+    if y_dims:
+        if len(y_dims) > 1:
+            raise ValueError('The source y coordinate may not describe more than one data dimension.')
+        y_dim = y_dims[0]
+        dim_sharers = ', '.join([coord.name() for coord in cube.coords(contains_dimension=y_dim) if coord is not y_coord])
+        if dim_sharers:
+            raise ValueError('No coordinates may share a dimension (dimension %s) with the y '
+                             'coordinate, but (%s) do.' % (y_dim, dim_sharers))
+    
+    if x_dim is not None and y_dim == x_dim:
+        raise ValueError('The source x and y coords may not describe the same data dimension.')
+
+    return x_coord, y_coord, x_dim, y_dim
+
+
+def _linear_weights(src_coord, points, extrapolation_mode):
+    # Returns the sparse matrix which linearly interpolates data along the
+    # source coordinate onto the given points, in the same way as linear().
+    src_points = src_coord.points
+    columns = np.arange(len(src_points))
+    points = np.array(points, dtype=np.float64, ndmin=1)
+    if getattr(src_coord, 'circular', False):
+        modulus = src_coord.units.modulus or 0
+        src_points = np.append(src_points, src_points[0] + modulus)
+        columns = np.append(columns, 0)
+        # Map all the requested values into the range of the source data.
+        if modulus:
+            offset = src_coord.points[0]
+            points = ((points - offset) % modulus) + offset
+
+    if len(src_points) <= 1:
+        raise ValueError('Cannot linearly interpolate a coordinate {!r}'
+                         ' with one point.'.format(src_coord.name()))
+
+    monotonic, direction = iris.util.monotonic(src_points,
+                                               return_direction=True)
+    if not monotonic:
+        raise ValueError('Unable to linearly interpolate this cube as the'
+                         ' coordinate {!r} is not monotonic'.format(
+                            src_coord.name()))
+    if direction == -1:
+        src_points = src_points[::-1]
+        columns = columns[::-1]
+    src_points = src_points.astype(np.float64)
+
+    # Interpolate between the two source points either side of each point,
+    # or extrapolate from the two source points at the nearest end.
+    lower = np.searchsorted(src_points, points, side='right') - 1
+    lower = np.clip(lower, 0, len(src_points) - 2)
+    lower_points = src_points[lower]
+    weights = (points - lower_points) / (src_points[lower + 1] - lower_points)
+
+    outside = (points < src_points[0]) | (points > src_points[-1])
+    if np.any(outside):
+        if extrapolation_mode == 'error':
+            raise ValueError('Requested a point outside the range of the'
+                             ' coordinate {!r}.'.format(src_coord.name()))
+        elif extrapolation_mode == 'nan':
+            weights[outside] = np.nan
+
+    rows = np.arange(len(points))
+    matrix = scipy.sparse.coo_matrix(
+        (np.concatenate([1 - weights, weights]),
+         (np.concatenate([rows, rows]),
+          np.concatenate([columns[lower], columns[lower + 1]]))),
+        shape=(len(points), len(src_coord.points)))
+    matrix = matrix.tocsr()
+    matrix.eliminate_zeros()
+    return matrix
+
+
+class Regridder(object):
+    """
+    Regrids cubes from the horizontal grid of one cube onto the horizontal
+    grid of another, re-using the interpolation weights for every cube.
+
+    The weights are computed once, when the regridder is made, as a sparse
+    matrix which maps the source grid onto the new grid. Each cube is then
+    regridded with a single sparse matrix product over all its other
+    dimensions at once.
+
+    For example::
+
+        regridder = Regridder(cubes[0], grid_cube)
+        regridded_cubes = [regridder(cube) for cube in cubes]
+
+    """
+    def __init__(self, source_cube, grid_cube, mode='bilinear',
+                 extrapolation_mode='linear'):
+        """
+        Make a regridder from the horizontal grid of the source cube onto the
+        horizontal grid of the grid cube.
+
+        Args:
+
+        * source_cube:
+            An instance of :class:`iris.cube.Cube` which supplies the source
+            horizontal grid.
+        * grid_cube:
+            An instance of :class:`iris.cube.Cube` which supplies the new
+            horizontal grid.
+
+        Kwargs:
+
+        * mode (string):
+            Regridding interpolation algorithm to be applied, which may be
+            'bilinear' (the default) or 'nearest'. See
+            :func:`iris.analysis.interpolate.regrid`.
+        * extrapolation_mode (string):
+            The bilinear extrapolation mode, which may be 'linear' (the
+            default), 'nan' or 'error'. See
+            :func:`iris.analysis.interpolate.linear`.
+
+        The requirements of the source and grid cubes are those of
+        :func:`iris.analysis.interpolate.regrid`.
+
+        """
+        # Condition 1
+        source_cs = source_cube.coord_system(iris.coord_systems.CoordSystem)
+        grid_cs = grid_cube.coord_system(iris.coord_systems.CoordSystem)
+        if (source_cs is None) != (grid_cs is None):
+            raise ValueError("The source and grid cubes must both have a CoordSystem or both have None.")
+
+        # Condition 2: We can only have one x coordinate and one y coordinate with the source CoordSystem, and those coordinates 
+        # must be the only ones occupying their respective dimension 
+        source_x, source_y, source_x_dim, source_y_dim = \
+            _regrid_xy_coords(source_cube, source_cs)
+
+        # Condition 3
+        # Check for compatible horizontal CSs. Currently that means they're exactly the same except for the coordinate
+        # values.
+        # The same kind of CS ...
+        compatible = (source_cs == grid_cs)
+        if compatible:
+            grid_x = grid_cube.coord(axis='x', coord_system=grid_cs)
+            grid_y = grid_cube.coord(axis='y', coord_system=grid_cs)
+            compatible = source_x.is_compatible(grid_x) and \
+                source_y.is_compatible(grid_y)
+        if not compatible:
+            raise ValueError("The new grid must be defined on the same coordinate system, and have the same coordinate "
+                             "metadata, as the source.")
+
+        # Condition 4
+        if grid_cube.coord_dims(grid_x) and source_x_dim is None or \
+                grid_cube.coord_dims(grid_y) and source_y_dim is None:
+            raise ValueError("The new grid must not require additional data dimensions.")
+
+        self.mode = mode
+        self._coord_system = source_cs
+        self._source_x = source_x
+        self._source_y = source_y
+        self._grid_x = grid_x
+        self._grid_y = grid_y
+
+        # The y and x axes which span data dimensions of the source grid.
+        axes = [(source_coord, grid_coord) for source_dim, source_coord,
+                grid_coord in [(source_y_dim, source_y, grid_y),
+                               (source_x_dim, source_x, grid_x)]
+                if source_dim is not None]
+        self._source_shape = [len(source_coord.points)
+                              for source_coord, grid_coord in axes]
+        self._grid_shape = [len(grid_coord.points)
+                            for source_coord, grid_coord in axes]
+
+        if mode == 'bilinear':
+            # The weights of both axes together are the Kronecker product of
+            # the weights along each axis.
+            if len(axes) != 2:
+                missing, = [coord for coord, dim in [(source_x, source_x_dim),
+                                                     (source_y, source_y_dim)]
+                            if dim is None]
+                raise ValueError('Requested a point over a coordinate which'
+                                 ' does not describe a dimension: {!r}.'.format(
+                                     missing.name()))
+            weights = [_linear_weights(source_coord, grid_coord.points,
+                                       extrapolation_mode)
+                       for source_coord, grid_coord in axes]
+            self._weights = scipy.sparse.kron(weights[0], weights[1],
+                                              format='csr')
+            # The pattern of the weights, for the propagation of masks.
+            self._pattern = self._weights.copy()
+            self._pattern.data[:] = 1
+        else:
+            # Nearest neighbour regridding takes the nearest source point of
+            # each grid point along each axis.
+            indices = [source_coord.nearest_neighbour_indices(grid_coord.points)
+                       for source_coord, grid_coord in axes]
+            if indices:
+                self._indices = np.ravel_multi_index(np.ix_(*indices),
+                                                     self._source_shape)
+                self._indices = self._indices.ravel()
+            else:
+                self._indices = np.zeros(1, dtype=int)
+
+    def __call__(self, cube):
+        """
+        Returns a new cube with values derived from the given cube, which
+        must be on the source grid of the regridder, on the new grid.
+
+        """
+        source_x, source_y, source_x_dim, source_y_dim = \
+            _regrid_xy_coords(cube, self._coord_system)
+        on_grid = all(coord.is_compatible(src_coord) and
+                      np.array_equal(coord.points, src_coord.points)
+                      for coord, src_coord in [(source_x, self._source_x),
+                                               (source_y, self._source_y)])
+        dims = [dim for dim in (source_y_dim, source_x_dim) if dim is not None]
+        if not on_grid or len(dims) != len(self._source_shape):
+            raise ValueError('The cube must be on the source grid of the'
+                             ' regridder.')
+
+        # Move the grid dimensions to the end of the data, and flatten
+        # them together, so all the other dimensions are regridded at once.
+        data = cube.data
+        other_dims = [dim for dim in range(cube.ndim) if dim not in dims]
+        other_shape = [cube.shape[dim] for dim in other_dims]
+        data = data.transpose(other_dims + dims)
+        data = data.reshape(-1, int(np.prod(self._source_shape)))
+
+        if self.mode == 'bilinear':
+            if data.dtype.kind in 'iu':
+                raise ValueError("Cannot linearly interpolate a cube which has integer type data. Consider casting the "
+                                 "cube's data to floating points in order to continue.")
+            mask = ma.getmask(data)
+            new_data = self._weights.dot(ma.filled(data, 0).T).T
+            new_data = new_data.astype(data.dtype)
+            if mask is not ma.nomask:
+                # Mask every grid point which depends on a masked value.
+                new_mask = self._pattern.dot(mask.T.astype(np.float64)).T
+                new_data = ma.array(new_data, mask=new_mask > 0)
+        else:
+            new_data = data[:, self._indices]
+
+        new_data = new_data.reshape(other_shape + self._grid_shape)
+        new_data = new_data.transpose(np.argsort(other_dims + dims))
+
+        # Special case to make 0-dimensional results take the same form as NumPy
+        if new_data.shape == ():
+            new_data = new_data.flat[0]
+
+        # Start with just the metadata and the re-sampled data...
+        new_cube = iris.cube.Cube(new_data)
+        new_cube.metadata = cube.metadata
+
+        # ... and then copy across all the unaffected coordinates.
+
+        # Record a mapping from old coordinate IDs to new coordinates,
+        # for subsequent use in creating updated aux_factories.
+        coord_mapping = {}
+
+        def copy_coords(source_coords, add_method):
+            for coord in source_coords:
+                if coord is source_x or coord is source_y:
+                    continue
+                dims = cube.coord_dims(coord)
+                new_coord = coord.copy()
+                add_method(new_coord, dims)
+                coord_mapping[id(coord)] = new_coord
+
+        copy_coords(cube.dim_coords, new_cube.add_dim_coord)
+        copy_coords(cube.aux_coords, new_cube.add_aux_coord)
+
+        for factory in cube.aux_factories:
+            new_cube.add_aux_factory(factory.updated(coord_mapping))
+
+        # Add the new coords
+        x_coord = self._grid_x.copy()
+        y_coord = self._grid_y.copy()
+        if source_x in cube.dim_coords:
+            new_cube.add_dim_coord(x_coord, source_x_dim)
+        else:
+            new_cube.add_aux_coord(x_coord, cube.coord_dims(source_x))
+
+        if source_y in cube.dim_coords:
+            new_cube.add_dim_coord(y_coord, source_y_dim)
+        else:
+            new_cube.add_aux_coord(y_coord, cube.coord_dims(source_y))
+
+        return new_cube
+
+
 def regrid(source_cube, grid_cube, mode='bilinear', **kwargs):
     """
     Returns a new cube with values derived from the source_cube on the horizontal grid specified
@@ -384,143 +727,13 @@ def regrid(source_cube, grid_cube, mode='bilinear', **kwargs):
     Returns:
         A new :class:`iris.cube.Cube` instance.
 
-    """
-    # Condition 1
-    source_cs = source_cube.coord_system(iris.coord_systems.CoordSystem)
-    grid_cs = grid_cube.coord_system(iris.coord_systems.CoordSystem)
-    if (source_cs is None) != (grid_cs is None):
-        raise ValueError("The source and grid cubes must both have a CoordSystem or both have None.")
-
-    # Condition 2: We can only have one x coordinate and one y coordinate with the source CoordSystem, and those coordinates 
-    # must be the only ones occupying their respective dimension 
-    source_x = source_cube.coord(axis='x', coord_system=source_cs)
-    source_y = source_cube.coord(axis='y', coord_system=source_cs)
-    
-    source_x_dims = source_cube.coord_dims(source_x)
-    source_y_dims = source_cube.coord_dims(source_y)
-
-    source_x_dim = None
-    if source_x_dims:
-        if len(source_x_dims) > 1:
-            raise ValueError('The source x coordinate may not describe more than one data dimension.')
-        source_x_dim = source_x_dims[0]
-        dim_sharers = ', '.join([coord.name() for coord in source_cube.coords(contains_dimension=source_x_dim) if coord is not source_x])
-        if dim_sharers:
-            raise ValueError('No coordinates may share a dimension (dimension %s) with the x '
-                             'coordinate, but (%s) do.' % (source_x_dim, dim_sharers))
-        
-    source_y_dim = None     
-    if source_y_dims:
-        if len(source_y_dims) > 1:
-            raise ValueError('The source y coordinate may not describe more than one data dimension.')
-        source_y_dim = source_y_dims[0]
-        dim_sharers = ', '.join([coord.name() for coord in source_cube.coords(contains_dimension=source_y_dim) if coord is not source_y])
-        if dim_sharers:
-            raise ValueError('No coordinates may share a dimension (dimension %s) with the y '
-                             'coordinate, but (%s) do.' % (source_y_dim, dim_sharers))
-    
-    if source_x_dim is not None and source_y_dim == source_x_dim:
-        raise ValueError('The source x and y coords may not describe the same data dimension.')
-
-        
-    # Condition 3
-    # Check for compatible horizontal CSs. Currently that means they're exactly the same except for the coordinate
-    # values.
-    # The same kind of CS ...
-    compatible = (source_cs == grid_cs)
-    if compatible:
-        grid_x = grid_cube.coord(axis='x', coord_system=grid_cs)
-        grid_y = grid_cube.coord(axis='y', coord_system=grid_cs)
-        compatible = source_x.is_compatible(grid_x) and \
-            source_y.is_compatible(grid_y)
-    if not compatible:
-        raise ValueError("The new grid must be defined on the same coordinate system, and have the same coordinate "
-                         "metadata, as the source.")
-
-    # Condition 4
-    if grid_cube.coord_dims(grid_x) and not source_x_dims or \
-            grid_cube.coord_dims(grid_y) and not source_y_dims:
-        raise ValueError("The new grid must not require additional data dimensions.")
-
-    x_coord = grid_x.copy()
-    y_coord = grid_y.copy()
-
-    
-    #
-    # Adjust the data array to match the new grid.
-    #
-    
-    # get the new shape of the data
-    new_shape = list(source_cube.shape)
-    if source_x_dims:
-        new_shape[source_x_dims[0]] = grid_x.shape[0]
-    if source_y_dims:
-        new_shape[source_y_dims[0]] = grid_y.shape[0]
-
-    new_data = np.empty(new_shape, dtype=source_cube.data.dtype)
-
-    # Prepare the index pattern which will be used to insert a single "column" of data.
-    # NB. A "column" is a slice constrained to a single XY point, which therefore extends over *all* the other axes.
-    # For an XYZ cube this means a column only extends over Z and corresponds to the normal definition of "column".
-    indices = [slice(None, None)] * new_data.ndim
-    
-    if mode == 'bilinear':
-        # Perform bilinear interpolation, passing through any keywords.
-        points_dict = [(source_x, list(x_coord.points)), (source_y, list(y_coord.points))]
-        new_data = linear(source_cube, points_dict, **kwargs).data
-    else:
-        # Perform nearest neighbour interpolation on each column in turn.
-        for iy, y in enumerate(y_coord.points):
-            for ix, x in enumerate(x_coord.points):
-                column_pos = [(source_x,  x), (source_y, y)]
-                column_data = extract_nearest_neighbour(source_cube, column_pos).data
-                if source_y_dim is not None:
-                    indices[source_y_dim] = iy
-                if source_x_dim is not None:
-                    indices[source_x_dim] = ix
-                new_data[tuple(indices)] = column_data
-
-    # Special case to make 0-dimensional results take the same form as NumPy
-    if new_data.shape == ():
-        new_data = new_data.flat[0]
-
-    # Start with just the metadata and the re-sampled data...
-    new_cube = iris.cube.Cube(new_data)
-    new_cube.metadata = source_cube.metadata
-
-    # ... and then copy across all the unaffected coordinates.
-
-    # Record a mapping from old coordinate IDs to new coordinates,
-    # for subsequent use in creating updated aux_factories.
-    coord_mapping = {}
-
-    def copy_coords(source_coords, add_method):
-        for coord in source_coords:
-            if coord is source_x or coord is source_y:
-                continue
-            dims = source_cube.coord_dims(coord)
-            new_coord = coord.copy()
-            add_method(new_coord, dims)
-            coord_mapping[id(coord)] = new_coord
-
-    copy_coords(source_cube.dim_coords, new_cube.add_dim_coord)
-    copy_coords(source_cube.aux_coords, new_cube.add_aux_coord)
-
-    for factory in source_cube.aux_factories:
-        new_cube.add_aux_factory(factory.updated(coord_mapping))
-
-    # Add the new coords
-    if source_x in source_cube.dim_coords:
-        new_cube.add_dim_coord(x_coord, source_x_dim)
-    else:
-        new_cube.add_aux_coord(x_coord, source_x_dims)
+    .. note::
 
-    if source_y in source_cube.dim_coords:
-        new_cube.add_dim_coord(y_coord, source_y_dim)
-    else:
-        new_cube.add_aux_coord(y_coord, source_y_dims)
+        To regrid many cubes from the same grid, make one
+        :class:`iris.analysis.interpolate.Regridder` and re-use it.
 
-    return new_cube
+    """
+    return Regridder(source_cube, grid_cube, mode, **kwargs)(source_cube)
 
 
 def regrid_to_max_resolution(cubes, **kwargs):
@@ -227,19 +227,40 @@ def interpolate(cube, sample_points, method=None):
             method = "nearest" 
             break
 
-    # Use a cache with _nearest_neighbour_indices_ndcoords()
-    cache = {}
-    
+    if method == "nearest":
+        # Find the nearest datum to every trajectory point at once, using the
+        # spatial index of the sample coords.
+        index = iris.analysis.interpolate._spatial_index(
+            cube, [coord for coord, values in sample_points])
+        nearest = index.query([values for coord, values in sample_points])
+
+        # Gather the data columns, by flattening the squished dims onto the
+        # last dimension of the source data.
+        if nearest:
+            column_indices = np.ravel_multi_index(nearest, index.shape)
+        else:
+            column_indices = np.zeros(trajectory_size, dtype=int)
+        data = cube.data.transpose(remaining_dims + index.dims)
+        data = data.reshape(new_data_shape[:-1] + [-1])
+        new_cube.data[...] = data[..., column_indices]
+
+        # Fill in the empty squashed (non derived) coords.
+        for coord in cube.dim_coords + cube.aux_coords:
+            src_dims = cube.coord_dims(coord)
+            if not squish_my_dims.isdisjoint(src_dims):
+                if not squish_my_dims.issuperset(src_dims):
+                    raise Exception("Expected to find exactly one point. "
+                                    "Found %d" % coord.points.size)
+                keys = tuple(nearest[index.dims.index(dim)]
+                             for dim in src_dims)
+                new_cube.coord(coord.name()).points[:] = coord.points[keys]
+
+        return new_cube
+
     for i in range(trajectory_size):
         point = [(coord, values[i]) for coord, values in sample_points]
-        
-        if method in ["linear", None]:
-            column = iris.analysis.interpolate.linear(cube, point)
-            new_cube.data[..., i] = column.data
-        elif method == "nearest":
-            column_index = iris.analysis.interpolate._nearest_neighbour_indices_ndcoords(cube, point, cache=cache)
-            column = cube[column_index]
-            new_cube.data[..., i] = column.data
+        column = iris.analysis.interpolate.linear(cube, point)
+        new_cube.data[..., i] = column.data
         
         # Fill in the empty squashed (non derived) coords.
         for column_coord in column.dim_coords + column.aux_coords:
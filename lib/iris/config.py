@@ -31,6 +31,10 @@ defined by :mod:`ConfigParser`.
 
     Local directory where test data exists.  Defaults to "test_data" sub-directory of the Iris package install directory. The test data directory supports the subset of Iris unit tests that require data. Directory contents accessed via :func:`iris.tests.get_data_path`.
 
+.. py:data:: iris.config.FIELD_INDEX_DIR
+
+    The [optional] full path to a directory in which to cache the field indexes of PP files and FieldsFiles. When set, the field headers and data locations of a file are stored on first load, and re-used by subsequent loads of the unchanged file.
+
 .. py:data:: iris.config.PALETTE_PATH
 
     The full path to the Iris palette configuration directory
@@ -118,6 +122,8 @@ if os.environ.get("override_test_data_repository"):
 PALETTE_PATH = get_dir_option(_RESOURCE_SECTION, 'palette_path',
                               os.path.join(CONFIG_PATH, 'palette'))
 
+FIELD_INDEX_DIR = get_dir_option(_RESOURCE_SECTION, 'field_index_dir')
+
 
 #################
 # Logging options
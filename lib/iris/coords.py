@@ -23,6 +23,7 @@ from __future__ import division
 from abc import ABCMeta, abstractproperty
 from copy import deepcopy
 import collections
+import datetime
 from itertools import chain, izip_longest
 import operator
 import warnings
@@ -274,6 +275,229 @@ class Cell(iris.util._OrderedHashable):
         return np.min(self.bound) <= point <= np.max(self.bound)
 
 
+class CellArray(object):
+    """
+    A read-only view of the cells of a one-dimensional coordinate, as arrays
+    of points and (optionally) bounds, which compares with numbers, dates
+    and other cells all at once.
+
+    Each comparison returns a boolean array with an element per cell, with
+    the same result as the comparison of each :class:`Cell`. So, for
+    example, ``cells == 5`` identifies the cells which contain 5, and
+    ``cells < cell`` the cells which sort before the given cell.
+
+    """
+    def __init__(self, points, bounds=None, units=None):
+        """
+        Args:
+
+        * points:
+            A one-dimensional array of the point of each cell.
+
+        Kwargs:
+
+        * bounds:
+            A two-dimensional array of the bounds of each cell.
+        * units:
+            The units of the points and bounds. Comparison with
+            :class:`datetime.datetime` instances needs a time reference
+            unit.
+
+        """
+        self.points = np.asarray(points)
+        self.bounds = None if bounds is None else np.asarray(bounds)
+        self.units = units
+        if self.points.ndim != 1:
+            raise ValueError('Points must be one-dimensional.')
+        if self.bounds is not None and \
+                (self.bounds.ndim != 2 or
+                 self.bounds.shape[0] != self.points.shape[0]):
+            raise ValueError('Bounds must be two-dimensional, with a row of '
+                             'bounds for each point.')
+
+    def __len__(self):
+        return self.points.shape[0]
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            bound = None if self.bounds is None else self.bounds[key]
+            result = Cell(self.points[key], bound)
+        else:
+            bounds = None if self.bounds is None else self.bounds[key]
+            result = CellArray(self.points[key], bounds, self.units)
+        return result
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return 'CellArray(%r, bounds=%r)' % (self.points, self.bounds)
+
+    def _limits(self):
+        """The lowest and highest values of each cell."""
+        if self.bounds is None:
+            return self.points, self.points
+        return self.bounds.min(axis=-1), self.bounds.max(axis=-1)
+
+    def _other_value(self, other):
+        if isinstance(other, datetime.datetime):
+            if self.units is None or not self.units.is_time_reference():
+                raise ValueError('Cells can only be compared with dates '
+                                 'given a time reference unit.')
+            other = self.units.date2num(other)
+        return other
+
+    def _cells_of(self, other):
+        """The points and bounds of a Cell or CellArray, as arrays."""
+        if isinstance(other, Cell):
+            bounds = None if other.bound is None else np.array(other.bound)
+            return np.asarray(other.point), bounds
+        if len(other) != len(self):
+            raise ValueError('Cannot compare %d cells with %d cells.' %
+                             (len(self), len(other)))
+        return other.points, other.bounds
+
+    def __eq__(self, other):
+        other = self._other_value(other)
+        if isinstance(other, (Cell, CellArray)):
+            points, bounds = self._cells_of(other)
+            result = self.points == points
+            if (self.bounds is None) != (bounds is None) or \
+                    (bounds is not None and
+                     self.bounds.shape[-1] != bounds.shape[-1]):
+                result = np.zeros(self.points.shape, dtype=bool)
+            elif bounds is not None:
+                result &= np.all(self.bounds == bounds, axis=-1)
+        elif isinstance(other, basestring):
+            if self.bounds is None:
+                result = self.points == other
+            else:
+                result = np.zeros(self.points.shape, dtype=bool)
+        else:
+            lower, upper = self._limits()
+            result = (lower <= other) & (other <= upper)
+        return result
+
+    def __ne__(self, other):
+        return ~(self == other)
+
+    def _common_cmp(self, other, operator_method):
+        """
+        Compares the cells with a number, date or cells, as for
+        :meth:`Cell.__common_cmp__`.
+
+        """
+        other = self._other_value(other)
+        if isinstance(other, (Cell, CellArray)):
+            points, bounds = self._cells_of(other)
+            result = operator_method(self.points, points)
+            equal = self.points == points
+            if self.bounds is None:
+                if bounds is not None:
+                    # A point-only cell is less than a point-and-bound cell
+                    # with the same point.
+                    result = np.where(equal, operator_method in
+                                      (operator.lt, operator.le), result)
+            elif bounds is None:
+                result = np.where(equal, operator_method in
+                                  (operator.gt, operator.ge), result)
+            else:
+                # Ordered on the first bound, then the second bound, then
+                # the point.
+                first = self.bounds[:, 0] == bounds[..., 0]
+                second = self.bounds[:, 1] == bounds[..., 1]
+                result = np.where(
+                    first,
+                    np.where(second, result,
+                             operator_method(self.bounds[:, 1],
+                                             bounds[..., 1])),
+                    operator_method(self.bounds[:, 0], bounds[..., 0]))
+        else:
+            lower, upper = self._limits()
+            if operator_method in (operator.gt, operator.le):
+                me = lower
+            else:
+                me = upper
+            result = operator_method(me, other)
+        return np.asarray(result, dtype=bool)
+
+    def __ge__(self, other):
+        return self._common_cmp(other, operator.ge)
+
+    def __le__(self, other):
+        return self._common_cmp(other, operator.le)
+
+    def __gt__(self, other):
+        return self._common_cmp(other, operator.gt)
+
+    def __lt__(self, other):
+        return self._common_cmp(other, operator.lt)
+
+    def isin(self, values):
+        """
+        Returns a boolean array of whether each cell equals any of the given
+        numbers or strings.
+
+        """
+        values = [self._other_value(value) for value in values]
+        if not values:
+            result = np.zeros(self.points.shape, dtype=bool)
+        elif self.bounds is None:
+            result = np.in1d(self.points, values)
+        elif all([isinstance(value, basestring) for value in values]):
+            result = np.zeros(self.points.shape, dtype=bool)
+        else:
+            # Find whether the lowest value above the bottom of each cell is
+            # within the cell.
+            values = np.sort(np.array(values, dtype=np.float64))
+            lower, upper = self._limits()
+            index = np.searchsorted(values, lower)
+            nearest = values[np.minimum(index, len(values) - 1)]
+            result = (index < len(values)) & (nearest <= upper)
+        return result
+
+    def find(self, cells):
+        """
+        Returns the index of the first of these cells which equals each of
+        the given cells, or -1 where there is none.
+
+        Args:
+
+        * cells:
+            A :class:`CellArray`.
+
+        """
+        result = np.empty(len(cells), dtype=np.intp)
+        result.fill(-1)
+        if (self.bounds is None) != (cells.bounds is None) or \
+                (self.bounds is not None and
+                 self.bounds.shape[-1] != cells.bounds.shape[-1]):
+            return result
+
+        # Sort all the cells together, so that equal cells are adjacent,
+        # with these cells first and otherwise in their original order.
+        n_cells = len(self)
+        columns = [np.concatenate([self.points, cells.points])]
+        if self.bounds is not None:
+            bounds = np.concatenate([self.bounds, cells.bounds])
+            columns.extend(bounds.T)
+        indices = np.arange(n_cells + len(cells))
+        order = np.lexsort([indices, indices >= n_cells] + columns[::-1])
+
+        # Each run of equal cells starts with the first of these cells
+        # equal to the others, if there is one.
+        new_run = np.zeros(len(order), dtype=bool)
+        new_run[0] = True
+        for column in columns:
+            column = column[order]
+            new_run[1:] |= column[1:] != column[:-1]
+        run_starts = order[new_run][np.cumsum(new_run) - 1]
+        found = (run_starts < n_cells) & (order >= n_cells)
+        result[order[found] - n_cells] = run_starts[found]
+        return result
+
+
 class Coord(CFVariableMixin):
     """
     Abstract superclass for coordinates.
@@ -509,6 +733,14 @@ class Coord(CFVariableMixin):
             result = not result
         return result
 
+    # "__getstate__" is defined so that searches cached on the coordinate
+    # are neither copied nor pickled with it; they are re-built when needed.
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ('_nearest_neighbour_cache', '_spatial_index_cache'):
+            state.pop(name, None)
+        return state
+
     def _as_defn(self):
         defn = CoordDefn(self.standard_name, self.long_name, self.var_name,
                          self.units, self.attributes, self.coord_system)
@@ -653,6 +885,20 @@ class Coord(CFVariableMixin):
         """
         return _CellIterator(self)
 
+    def cell_array(self):
+        """
+        Returns a :class:`CellArray` view of the cells of this coordinate,
+        which compares all the cells at once.
+
+        For example::
+
+            matches = coord.cell_array() > 5
+
+        """
+        if self.ndim != 1:
+            raise iris.exceptions.CoordinateMultiDimError(self)
+        return CellArray(self.points, self.bounds, self.units)
+
     def _sanity_check_contiguous(self):
         if self.ndim != 1:
             raise iris.exceptions.CoordinateMultiDimError(
@@ -954,25 +1200,16 @@ class Coord(CFVariableMixin):
                   'compatible because of differing metadata.'
             raise ValueError(msg)
 
-        # Cache self.cells for speed. We can also use the index operation on a
-        # list conveniently.
-        self_cells = [cell for cell in self.cells()]
-
-        # Maintain a list of indices on self for which cells exist in both self
-        # and other.
-        self_intersect_indices = []
-        for cell in other.cells():
-            try:
-                self_intersect_indices.append(self_cells.index(cell))
-            except ValueError:
-                pass
+        # Find the indices on self for which cells exist in both self and
+        # other, in the order of other.
+        self_intersect_indices = self.cell_array().find(other.cell_array())
+        self_intersect_indices = self_intersect_indices[
+            self_intersect_indices >= 0]
 
-        if return_indices is False and self_intersect_indices == []:
+        if return_indices is False and len(self_intersect_indices) == 0:
             raise ValueError('No intersection between %s coords possible.' %
                              self.name())
 
-        self_intersect_indices = np.array(self_intersect_indices)
-
         # Return either the indices, or a Coordinate instance of the
         # intersection.
         if return_indices:
@@ -992,68 +1229,38 @@ class Coord(CFVariableMixin):
         .. note:: For circular coordinates, the 'nearest' point can wrap around
             to the other end of the values.
 
+        .. seealso:: :meth:`nearest_neighbour_indices`, for many points.
+
+        """
+        return self.nearest_neighbour_indices(np.array([point]))[0]
+
+    def nearest_neighbour_indices(self, points):
+        """
+        Returns an array of the indices of the cells nearest to each of the
+        given points, as for :meth:`nearest_neighbour_index`.
+
+        Each point is found by a binary search of the sorted points (or
+        bounds) of the coordinate.
+
+        Args:
+
+        * points:
+            A one-dimensional array of values.
+
         """
-        points = self.points
-        bounds = self.bounds if self.has_bounds() else np.array([])
         if self.ndim != 1:
             raise ValueError('Nearest-neighbour is currently limited'
                              ' to one-dimensional coordinates.')
-        do_circular = getattr(self, 'circular', False)
-        if do_circular:
-            wrap_modulus = self.units.modulus
-            # wrap 'point' to a range based on lowest points or bounds value.
-            wrap_origin = np.min(np.hstack((points, bounds.flatten())))
-            point = wrap_origin + (point - wrap_origin) % wrap_modulus
-
-        # Calculate the nearest neighbour.
-        # The algorithm:  given a single value (V),
-        #   if coord has bounds,
-        #     make bounds cells complete and non-overlapping
-        #     return first cell containing V
-        #   else (no bounds),
-        #     find the point which is closest to V
-        #     or if two are equally close, return the lowest index
-        if self.has_bounds():
-            # make bounds ranges complete+separate, so point is in at least one
-            bounds = bounds.copy()
-            # sort the bounds cells by their centre values
-            sort_inds = np.argsort(np.mean(bounds, axis=1))
-            bounds = bounds[sort_inds]
-            # replace all adjacent bounds with their averages
-            mid_bounds = 0.5 * (bounds[:-1, 1] + bounds[1:, 0])
-            bounds[:-1, 1] = mid_bounds
-            bounds[1:, 0] = mid_bounds
-            # if point lies beyond either end, fix the end cell to include it
-            bounds[0, 0] = min(point, bounds[0, 0])
-            bounds[-1, 1] = max(point, bounds[-1, 1])
-            # get index of first-occurring cell that contains the point
-            inside_cells = np.logical_and(point >= np.min(bounds, axis=1),
-                                          point <= np.max(bounds, axis=1))
-            result_index = np.where(inside_cells)[0][0]
-            # return the original index of the cell (before the bounds sort)
-            result_index = sort_inds[result_index]
-
-        # Or, if no bounds, we always have points ...
-        else:
-            if do_circular:
-                # add an extra, wrapped max point (simpler than bounds case)
-                # NOTE: circular implies a DimCoord, so *must* be monotonic
-                if points[-1] >= points[0]:
-                    # ascending value order : add wrapped lowest value to end
-                    index_offset = 0
-                    points = np.hstack((points, points[0] + wrap_modulus))
-                else:
-                    # descending order : add wrapped lowest value at start
-                    index_offset = 1
-                    points = np.hstack((points[-1] + wrap_modulus, points))
-            # return index of first-occurring nearest point
-            distances = np.abs(points - point)
-            result_index = np.where(distances == np.min(distances))[0][0]
-            if do_circular:
-                # convert index back from circular-adjusted points
-                result_index = (result_index - index_offset) % self.shape[0]
+        return self._nearest_neighbour_search().indices(points)
 
-        return result_index
+    def _nearest_neighbour_search(self):
+        """
+        Returns the :class:`_NearestNeighbourSearch` of this coordinate.
+
+        """
+        return _NearestNeighbourSearch(self.points, self.bounds,
+                                       getattr(self, 'circular', False),
+                                       self.units)
 
     def sin(self):
         """
@@ -1244,6 +1451,7 @@ class DimCoord(Coord):
         # Make the array read-only.
         points.flags.writeable = False
 
+        self._points_version = getattr(self, '_points_version', 0) + 1
         self._points = points
 
     @property
@@ -1295,6 +1503,18 @@ class DimCoord(Coord):
     def is_monotonic(self):
         return True
 
+    def _nearest_neighbour_search(self):
+        # The points and bounds are read-only, so the search is cached until
+        # they are replaced.
+        cache = getattr(self, '_nearest_neighbour_cache', None)
+        if cache is None or cache[0] is not self._points or \
+                cache[1] is not self._bounds or \
+                cache[2] != (self.circular, self.units):
+            cache = (self._points, self._bounds, (self.circular, self.units),
+                     Coord._nearest_neighbour_search(self))
+            self._nearest_neighbour_cache = cache
+        return cache[3]
+
 
 class AuxCoord(Coord):
     """A CF auxiliary coordinate."""
@@ -1345,6 +1565,7 @@ class AuxCoord(Coord):
                 raise ValueError("New points shape must match existing points "
                                  "shape.")
 
+        self._points_version = getattr(self, '_points_version', 0) + 1
         self._points = points
 
     @property
@@ -1502,6 +1723,118 @@ class CellMethod(iris.util._OrderedHashable):
         return cellMethod_xml_element
 
 
+class _NearestNeighbourSearch(object):
+    """
+    The sorted points, or the sorted midpoints between bounds, of a
+    one-dimensional coordinate, for finding the nearest neighbour index of
+    many points by binary search.
+
+    The algorithm, given a single value (V), is:
+
+    * if the coordinate has bounds, make the bounds cells complete and
+      non-overlapping by replacing adjacent bounds with their averages, then
+      return the first cell containing V.
+    * otherwise, find the point which is closest to V, or the lowest index
+      if two are equally close.
+
+    """
+    def __init__(self, points, bounds, circular, units):
+        self._n_points = points.shape[0]
+        self._wrap_modulus = None
+        if circular:
+            self._wrap_modulus = units.modulus
+            # Points are wrapped to a range based on the lowest points or
+            # bounds value.
+            values = points if bounds is None else \
+                np.hstack((points, bounds.flatten()))
+            self._wrap_origin = np.min(values)
+
+        if bounds is not None:
+            # Sort the bounds cells by their centre values, and find the
+            # averages of adjacent bounds.
+            self._sort_inds = np.argsort(np.mean(bounds, axis=1))
+            self._bounds = bounds[self._sort_inds]
+            self._mid_bounds = 0.5 * (self._bounds[:-1, 1] +
+                                      self._bounds[1:, 0])
+            # The first cell containing V is found by binary search if the
+            # cells are in order once their bounds are replaced.
+            self._searchable = np.all(np.diff(self._mid_bounds) >= 0) and \
+                (len(self._mid_bounds) == 0 or
+                 (self._bounds[0, 0] <= self._mid_bounds[0] and
+                  self._bounds[-1, 1] >= self._mid_bounds[-1]))
+        else:
+            self._bounds = None
+            self._index_offset = 0
+            if circular:
+                # Add an extra, wrapped max point.
+                # NOTE: circular implies a DimCoord, so *must* be monotonic.
+                if points[-1] >= points[0]:
+                    # ascending value order : add wrapped lowest value to end
+                    points = np.hstack((points, points[0] + self._wrap_modulus))
+                else:
+                    # descending order : add wrapped lowest value at start
+                    self._index_offset = 1
+                    points = np.hstack((points[-1] + self._wrap_modulus,
+                                        points))
+            # A stable sort puts the lowest index first amongst equal points.
+            self._order = np.argsort(points, kind='mergesort')
+            self._sorted_points = points[self._order]
+
+    def indices(self, points):
+        """Returns the nearest neighbour index of each of the points."""
+        points = np.asarray(points)
+        if self._wrap_modulus is not None:
+            points = self._wrap_origin + \
+                (points - self._wrap_origin) % self._wrap_modulus
+        if self._bounds is not None:
+            if self._searchable:
+                result = self._sort_inds[np.searchsorted(self._mid_bounds,
+                                                         points)]
+            else:
+                result = np.array([self._bounded_index(point)
+                                   for point in points], dtype=np.intp)
+        else:
+            result = self._nearest_point_indices(points)
+        return result
+
+    def _bounded_index(self, point):
+        """Returns the index of the first cell containing the point."""
+        bounds = self._bounds.copy()
+        bounds[:-1, 1] = self._mid_bounds
+        bounds[1:, 0] = self._mid_bounds
+        # if point lies beyond either end, fix the end cell to include it
+        bounds[0, 0] = min(point, bounds[0, 0])
+        bounds[-1, 1] = max(point, bounds[-1, 1])
+        inside_cells = np.logical_and(point >= np.min(bounds, axis=1),
+                                      point <= np.max(bounds, axis=1))
+        return self._sort_inds[np.where(inside_cells)[0][0]]
+
+    def _nearest_point_indices(self, points):
+        """
+        Returns the index of the nearest of the coordinate points to each
+        point, from the sorted points either side of it.
+
+        """
+        sorted_points = self._sorted_points
+        n_sorted = sorted_points.shape[0]
+        upper = np.searchsorted(sorted_points, points)
+        candidates = []
+        for position in (np.maximum(upper - 1, 0),
+                         np.minimum(upper, n_sorted - 1)):
+            value = sorted_points[position]
+            # The lowest index of the points with this value.
+            index = self._order[np.searchsorted(sorted_points, value)]
+            candidates.append((np.abs(value - points), index))
+        (lower_distance, lower_index), (upper_distance, upper_index) = \
+            candidates
+        result = np.where(lower_distance < upper_distance, lower_index,
+                          np.where(upper_distance < lower_distance,
+                                   upper_index,
+                                   np.minimum(lower_index, upper_index)))
+        # Convert the indices back from circular-adjusted points.
+        return (result - self._index_offset) % self._n_points
+
+
 # See Coord.cells() for the description/context.
 class _CellIterator(collections.Iterator):
     def __init__(self, coord):
@@ -23,6 +23,7 @@ from xml.dom.minidom import Document
 import collections
 import copy
 import datetime
+import itertools
 import operator
 import re
 import UserDict
@@ -77,6 +78,41 @@ class CubeMetadata(collections.namedtuple('CubeMetadata',
 # The XML namespace to use for CubeML documents
 XML_NAMESPACE_URI = "urn:x-iris:cubeml-0.2"
 
+# Deferred data of more than this many bytes is collapsed one chunk of at
+# most this many bytes at a time, by aggregators that support partial
+# aggregation.
+_MAX_COLLAPSE_CHUNK_BYTES = 256 * 1024 * 1024
+
+
+def _chunk_keys(shape, itemsize, max_bytes):
+    """
+    Returns a generator of the keys of consecutive chunks of an array of
+    the given shape and itemsize, where each chunk is at most max_bytes
+    (or a single element of a leading dimension, if larger).
+
+    Only the leading dimensions are split, and the keys are all slices so
+    each chunk has the same dimensionality as the array.
+
+    """
+    # Find the leading dimension to split, where the trailing dimensions fit.
+    ndim = len(shape)
+    split = ndim
+    chunk_bytes = itemsize
+    while split > 0 and chunk_bytes * shape[split - 1] <= max_bytes:
+        split -= 1
+        chunk_bytes *= shape[split]
+
+    if split == 0:
+        yield (slice(None),) * ndim
+    else:
+        split -= 1
+        step = max(1, max_bytes // chunk_bytes)
+        trailing = (slice(None),) * (ndim - split - 1)
+        for index in itertools.product(*[xrange(length) for length in shape[:split]]):
+            leading = tuple([slice(i, i + 1) for i in index])
+            for start in xrange(0, shape[split], step):
+                yield leading + (slice(start, start + step),) + trailing
+
 
 class _CubeFilter(object):
     """
@@ -320,28 +356,12 @@ class CubeList(list):
 
         """
         # Register each of our cubes with its appropriate ProtoCube.
-        proto_cubes_by_name = {}
+        registry = iris._merge.ProtoCubeRegistry()
         for cube in self:
-            name = cube.standard_name
-            proto_cubes = proto_cubes_by_name.setdefault(name, [])
-            proto_cube = None
-
-            for target_proto_cube in proto_cubes:
-                if target_proto_cube.register(cube):
-                    proto_cube = target_proto_cube
-                    break
-
-            if proto_cube is None:
-                proto_cube = iris._merge.ProtoCube(cube)
-                proto_cubes.append(proto_cube)
+            registry.register(cube)
 
         # Extract all the merged cubes from the ProtoCubes.
-        merged_cubes = CubeList()
-        for name in sorted(proto_cubes_by_name):
-            for proto_cube in proto_cubes_by_name[name]:
-                merged_cubes.extend(proto_cube.merge(unique=unique))
-
-        return merged_cubes
+        return registry.merge(unique=unique)
 
 
 class Cube(CFVariableMixin):
@@ -2259,26 +2279,93 @@ class Cube(CFVariableMixin):
                 collapsed_cube.replace_coord(coord.collapsed(local_dims))
 
         # Perform the aggregation over the cube data
-        # First reshape the data so that the dimensions being aggregated over
-        # are grouped 'at the end'.
         untouched_dims = sorted(untouched_dims)
         dims_to_collapse = sorted(dims_to_collapse)
-        end_size = reduce(operator.mul, (self.shape[dim] for dim in
-                                         dims_to_collapse))
-        new_shape = [self.shape[dim] for dim in untouched_dims] + [end_size]
-        unrolled_data = np.transpose(
-            self.data, untouched_dims + dims_to_collapse).reshape(new_shape)
-        # Perform the same operation on the weights if applicable
-        if kwargs.get("weights") is not None:
-            weights = kwargs["weights"].view()
-            kwargs["weights"] = np.transpose(
-                weights, untouched_dims + dims_to_collapse).reshape(new_shape)
-
-        data_result = aggregator.aggregate(unrolled_data, axis=-1, **kwargs)
+        if self._data_manager is not None and \
+                aggregator.supports_exact_partial(**kwargs) and \
+                np.prod(self.shape) * self._data_manager.data_type.itemsize > \
+                _MAX_COLLAPSE_CHUNK_BYTES:
+            data_result = self._collapsed_data_in_chunks(untouched_dims,
+                                                         dims_to_collapse,
+                                                         aggregator, **kwargs)
+        else:
+            # First reshape the data so that the dimensions being aggregated
+            # over are grouped 'at the end'.
+            end_size = reduce(operator.mul, (self.shape[dim] for dim in
+                                             dims_to_collapse))
+            new_shape = [self.shape[dim] for dim in untouched_dims] + \
+                [end_size]
+            unrolled_data = np.transpose(
+                self.data, untouched_dims + dims_to_collapse).reshape(new_shape)
+            # Perform the same operation on the weights if applicable
+            if kwargs.get("weights") is not None:
+                weights = kwargs["weights"].view()
+                kwargs["weights"] = np.transpose(
+                    weights, untouched_dims + dims_to_collapse).reshape(new_shape)
+
+            data_result = aggregator.aggregate(unrolled_data, axis=-1, **kwargs)
         aggregator.update_metadata(collapsed_cube, coords, axis=-1, **kwargs)
         result = aggregator.post_process(collapsed_cube, data_result, **kwargs)
         return result
 
+    def _collapsed_data_in_chunks(self, untouched_dims, dims_to_collapse,
+                                  aggregator, **kwargs):
+        """
+        Returns the aggregation of the deferred data over the dimensions to
+        collapse, where the data is loaded and accumulated into the partial
+        state of the aggregation one chunk at a time.
+
+        """
+        data_type = self._data_manager.data_type.newbyteorder('=')
+        weights = kwargs.pop('weights', None)
+        returned = kwargs.pop('returned', False)
+        state = aggregator.initialise([self.shape[dim] for dim in
+                                       untouched_dims], **kwargs)
+        masked = False
+        dims = untouched_dims + dims_to_collapse
+
+        for key in _chunk_keys(self.shape, data_type.itemsize,
+                               _MAX_COLLAPSE_CHUNK_BYTES):
+            proxy_array, data_manager = self._data_manager.getitem(self._data,
+                                                                   key)
+            data = data_manager.load(proxy_array)
+            masked = masked or isinstance(data, ma.MaskedArray)
+            new_shape = [data.shape[dim] for dim in untouched_dims] + [-1]
+            data = np.transpose(data, dims).reshape(new_shape)
+            chunk_kwargs = kwargs
+            if weights is not None:
+                chunk_kwargs = dict(kwargs, weights=np.transpose(
+                    weights[key], dims).reshape(new_shape))
+
+            # Accumulate into the region of the state of this chunk.
+            region = tuple([key[dim] for dim in untouched_dims])
+            chunk_state = aggregator.accumulate([array[region] for array in
+                                                 state], data, axis=-1,
+                                                **chunk_kwargs)
+            for array, chunk_array in zip(state, chunk_state):
+                array[region] = chunk_array
+
+        # Match the type of the result of aggregating the data all at once.
+        sample = np.ones([1] * len(untouched_dims) + [2], dtype=data_type)
+        if masked:
+            sample = ma.masked_array(sample)
+            sample[..., 1] = ma.masked
+        sample_kwargs = kwargs
+        if weights is not None:
+            sample_kwargs = dict(kwargs, weights=np.ones(sample.shape,
+                                                         weights.dtype))
+        sample = aggregator.aggregate(sample, axis=-1, **sample_kwargs)
+        data_result = aggregator.finalise(state, returned=returned, **kwargs)
+        if returned:
+            data_result, weights_result = data_result
+        data_result = data_result.astype(sample.dtype)
+        if not isinstance(sample, ma.MaskedArray) and \
+                not ma.is_masked(data_result):
+            data_result = data_result.filled()
+        if returned:
+            data_result = (data_result, weights_result)
+        return data_result
+
     def aggregated_by(self, coords, aggregator, **kwargs):
         """
         Perform aggregation over the cube given one or more "group
@@ -2387,19 +2474,45 @@ class Cube(CFVariableMixin):
         data_shape = list(self.shape)
         data_shape[dimension_to_groupby] = len(groupby)
 
-        # Aggregate the group-by data.
+        if aggregator.supports_exact_partial(**kwargs):
+            aggregateby_data = self._aggregated_by_segments(
+                groupby, dimension_to_groupby, aggregator, **kwargs)
+        else:
+            aggregateby_data = self._aggregated_by_groups(
+                groupby, dimension_to_groupby, data_shape, aggregator,
+                **kwargs)
+
+        # Add the aggregation meta data to the aggregate-by cube.
+        aggregator.update_metadata(aggregateby_cube,
+                                   groupby_coords,
+                                   aggregate=True, **kwargs)
+        # Replace the appropriate coordinates within the aggregate-by cube.
+        for coord in groupby.coords:
+            aggregateby_cube.add_aux_coord(coord.copy(), dimension_to_groupby)
+        # Attatch the aggregate-by data into the aggregate-by cube.
+        aggregateby_cube.data = aggregateby_data
+
+        return aggregateby_cube
+
+    def _aggregated_by_groups(self, groupby, dimension, data_shape,
+                              aggregator, **kwargs):
+        """
+        Returns the aggregation of each group of the data over the group-by
+        dimension, aggregating one group-by sub-cube at a time.
+
+        """
         cube_slice = [slice(None, None)] * len(data_shape)
 
         for i, groupby_slice in enumerate(groupby.group()):
             # Slice the cube with the group-by slice to create a group-by
             # sub-cube.
-            cube_slice[dimension_to_groupby] = groupby_slice
+            cube_slice[dimension] = groupby_slice
             groupby_sub_cube = self[tuple(cube_slice)]
             # Perform the aggregation over the group-by sub-cube and
             # repatriate the aggregated data into the aggregate-by cube data.
-            cube_slice[dimension_to_groupby] = i
+            cube_slice[dimension] = i
             result = aggregator.aggregate(groupby_sub_cube.data,
-                                          axis=dimension_to_groupby,
+                                          axis=dimension,
                                           **kwargs)
             # Determine aggregation result data type for the aggregate-by cube
             # data on first pass.
@@ -2408,17 +2521,49 @@ class Cube(CFVariableMixin):
 
             aggregateby_data[tuple(cube_slice)] = result
 
-        # Add the aggregation meta data to the aggregate-by cube.
-        aggregator.update_metadata(aggregateby_cube,
-                                   groupby_coords,
-                                   aggregate=True, **kwargs)
-        # Replace the appropriate coordinates within the aggregate-by cube.
-        for coord in groupby.coords:
-            aggregateby_cube.add_aux_coord(coord.copy(), dimension_to_groupby)
-        # Attatch the aggregate-by data into the aggregate-by cube.
-        aggregateby_cube.data = aggregateby_data
-
-        return aggregateby_cube
+        return aggregateby_data
+
+    def _aggregated_by_segments(self, groupby, dimension, aggregator,
+                                **kwargs):
+        """
+        Returns the aggregation of each group of the data over the group-by
+        dimension, in a single pass over the data.
+
+        The data is reordered so that each group is a consecutive segment of
+        the group-by dimension, then all the segments are aggregated at once
+        by partial aggregation.
+
+        """
+        groups = list(groupby.group())
+        positions = np.arange(self.shape[dimension])
+        indices = [positions[group if isinstance(group, slice) else
+                             list(group)] for group in groups]
+        lengths = [len(group_indices) for group_indices in indices]
+        starts = np.cumsum([0] + lengths[:-1])
+        indices = np.concatenate(indices)
+
+        data = self.data
+        if np.any(indices != positions):
+            data = data.take(indices, axis=dimension)
+
+        # Match the type of the result of aggregating each group-by sub-cube,
+        # which is that of the first group.
+        sample_key = [slice(None)] * self.ndim
+        sample_key[dimension] = slice(0, lengths[0])
+        sample = data[tuple(sample_key)]
+        if isinstance(sample, ma.MaskedArray) and ma.count_masked(sample) == 0:
+            sample = sample.filled()
+        sample = aggregator.aggregate(sample, axis=dimension, **kwargs)
+
+        result = aggregator.aggregate_segments(data, starts, dimension,
+                                               **kwargs)
+        # As for the aggregation of each group-by sub-cube, a result with no
+        # degrees of freedom is NaN for unmasked data, and the mask of the
+        # result is discarded for masked data.
+        if ma.is_masked(result):
+            result = result.filled(0 if isinstance(data, ma.MaskedArray)
+                                   else np.nan)
+        return ma.getdata(result).astype(sample.dtype)
 
     def rolling_window(self, coord, aggregator, window, **kwargs):
         """
@@ -2522,13 +2667,6 @@ class Cube(CFVariableMixin):
         key[dimension] = slice(None, self.shape[dimension] - window + 1)
         new_cube = self[tuple(key)]
 
-        # take a view of the original data using the rolling_window function
-        # this will add an extra dimension to the data at dimension + 1 which
-        # represents the rolled window (i.e. will have a length of window)
-        rolling_window_data = iris.util.rolling_window(self.data,
-                                                       window=window,
-                                                       axis=dimension)
-
         # now update all of the coordinates to reflect the aggregation
         for coord_ in self.coords(dimensions=dimension):
             if coord_.has_bounds():
@@ -2557,6 +2695,17 @@ class Cube(CFVariableMixin):
             new_cube, [coord],
             action='with a rolling window of length %s over' % window,
             **kwargs)
+        if aggregator.supports_rolling(**kwargs):
+            new_cube.data = self._rolling_window_data(dimension, aggregator,
+                                                      window, **kwargs)
+            return new_cube
+
+        # take a view of the original data using the rolling_window function
+        # this will add an extra dimension to the data at dimension + 1 which
+        # represents the rolled window (i.e. will have a length of window)
+        rolling_window_data = iris.util.rolling_window(self.data,
+                                                       window=window,
+                                                       axis=dimension)
         # and perform the data transformation, generating weights first if
         # needed
         newkwargs = {}
@@ -2576,6 +2725,67 @@ class Cube(CFVariableMixin):
 
         return new_cube
 
+    def _rolling_window_data(self, dimension, aggregator, window, **kwargs):
+        """
+        Returns the rolling window aggregation of the data along the
+        dimension, from running totals of the data.
+
+        Deferred data that would exceed the chunk size once loaded is
+        streamed: one block of the dimension is loaded and aggregated at a
+        time, with each block overlapping the next by one less than the
+        window length.
+
+        """
+        length = self.shape[dimension]
+        shape = list(self.shape)
+        shape[dimension] = length - window + 1
+
+        if self._data_manager is None:
+            data_type = self.data.dtype
+        else:
+            data_type = self._data_manager.data_type.newbyteorder('=')
+        row_bytes = np.prod(self.shape) // length * data_type.itemsize
+
+        if self._data_manager is None or \
+                row_bytes * length <= _MAX_COLLAPSE_CHUNK_BYTES:
+            data = self.data
+            masked = isinstance(data, ma.MaskedArray)
+            data_result = aggregator.aggregate_rolling(data, window,
+                                                       dimension, **kwargs)
+        else:
+            step = max(window, _MAX_COLLAPSE_CHUNK_BYTES // row_bytes)
+            data_result = None
+            masked = False
+            key = [slice(None)] * self.ndim
+            result_key = [slice(None)] * self.ndim
+            for start in xrange(0, shape[dimension], step):
+                key[dimension] = slice(start, start + step + window - 1)
+                proxy_array, data_manager = self._data_manager.getitem(
+                    self._data, tuple(key))
+                data = data_manager.load(proxy_array)
+                masked = masked or isinstance(data, ma.MaskedArray)
+                block_result = aggregator.aggregate_rolling(data, window,
+                                                            dimension,
+                                                            **kwargs)
+                if data_result is None:
+                    data_result = ma.empty(shape, dtype=block_result.dtype)
+                result_key[dimension] = slice(start, start + step)
+                data_result[tuple(result_key)] = block_result
+
+        # Match the type of the result of aggregating each window of the
+        # data.
+        sample_shape = [1] * self.ndim
+        sample_shape[dimension] = 2
+        sample = np.ones(sample_shape, dtype=data_type)
+        if masked:
+            sample = ma.masked_array(sample)
+        sample = aggregator.aggregate(sample, axis=dimension, **kwargs)
+        data_result = data_result.astype(sample.dtype)
+        if not isinstance(sample, ma.MaskedArray) and \
+                not ma.is_masked(data_result):
+            data_result = ma.getdata(data_result)
+        return data_result
+
 
 class ClassDict(object, UserDict.DictMixin):
     """
@@ -50,7 +50,8 @@ FORMAT_AGENT.add_spec(FormatSpec('UM Post Processing file (PP)',
                                  fp.MAGIC_NUMBER_32_BIT,
                                  0x00000100,
                                  pp.load_cubes,
-                                 priority=5))
+                                 priority=5,
+                                 handler_keywords=('constraints', 'parallel')))
 
 
 FORMAT_AGENT.add_spec(FormatSpec('UM Post Processing file (PP) little-endian',
@@ -77,21 +78,24 @@ FORMAT_AGENT.add_spec(FormatSpec('NetCDF',
                                  fp.MAGIC_NUMBER_32_BIT,
                                  0x43444601,
                                  netcdf.load_cubes,
-                                 priority=5))
+                                 priority=5,
+                                 handler_keywords=('parallel',)))
 
 
 FORMAT_AGENT.add_spec(FormatSpec('NetCDF 64 bit offset format',
                                  fp.MAGIC_NUMBER_32_BIT,
                                  0x43444602,
                                  netcdf.load_cubes,
-                                 priority=5))
+                                 priority=5,
+                                 handler_keywords=('parallel',)))
     
 # This covers both v4 and v4 classic model.
 FORMAT_AGENT.add_spec(FormatSpec('NetCDF_v4',
                                  fp.MAGIC_NUMBER_64_BIT,
                                  0x894844460D0A1A0A,
                                  netcdf.load_cubes,
-                                 priority=5))
+                                 priority=5,
+                                 handler_keywords=('parallel',)))
 
 
 #
@@ -101,20 +105,23 @@ FORMAT_AGENT.add_spec(FormatSpec('UM Fieldsfile (FF) pre v3.1',
                                  fp.MAGIC_NUMBER_64_BIT,
                                  0x000000000000000F,
                                  ff.load_cubes,
-                                 priority=4))
+                                 priority=4,
+                                 handler_keywords=('constraints', 'parallel')))
 
 FORMAT_AGENT.add_spec(FormatSpec('UM Fieldsfile (FF) post v5.2',
                                  fp.MAGIC_NUMBER_64_BIT,
                                  0x0000000000000014,
                                  ff.load_cubes,
-                                 priority=4))
+                                 priority=4,
+                                 handler_keywords=('constraints', 'parallel')))
 
 
 FORMAT_AGENT.add_spec(FormatSpec('UM Fieldsfile (FF) ancillary',
                                  fp.MAGIC_NUMBER_64_BIT,
                                  0xFFFFFFFFFFFF8000,
                                  ff.load_cubes,
-                                 priority=4))
+                                 priority=4,
+                                 handler_keywords=('constraints', 'parallel')))
 
 #
 # NIMROD files.
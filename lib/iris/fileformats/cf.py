@@ -26,8 +26,11 @@ References:
 """
 
 from abc import ABCMeta, abstractmethod
+import collections
+import contextlib
 import os
 import re
+import threading
 import UserDict
 import warnings
 
@@ -53,6 +56,143 @@ _CF_PARSE = re.compile(r'''
 # therefore automatically classed as "used" attributes.
 _CF_ATTRS_IGNORE = set(['_FillValue', 'add_offset', 'missing_value', 'scale_factor', ])
 
+# The maximum number of unused netCDF datasets kept open for reading.
+_DATASET_POOL_SIZE = 16
+
+
+################################################################################
+class _PooledDataset(object):
+    """An open netCDF dataset of a file, and the state of that file."""
+
+    __slots__ = ('dataset', 'filename', 'stat', 'pooled')
+
+    def __init__(self, dataset, filename, stat):
+        self.dataset = dataset
+        self.filename = filename
+        self.stat = stat
+        self.pooled = True
+
+
+class _DatasetPool(object):
+    """
+    A bounded, thread-safe pool of open, read-only :class:`netCDF4.Dataset`
+    instances, so that repeated reads of the same netCDF file need not pay
+    the cost of opening the file each time.
+
+    Each acquired dataset is used by only one user at a time, as a netCDF4
+    dataset does not support concurrent reads. A file already in use is
+    opened again for another user. An acquired dataset is never closed
+    until it has been released. Once there are more than `maxsize` unused
+    datasets in the pool, the least recently used of them are closed.
+
+    A pooled dataset is reopened if its file has been modified, and should
+    be discarded from the pool before its file is written.
+
+    """
+    def __init__(self, maxsize=_DATASET_POOL_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        # The unused datasets by id, least recently used first.
+        self._idle = collections.OrderedDict()
+        # The acquired datasets by id.
+        self._acquired = {}
+
+    @staticmethod
+    def _filename(filename):
+        return os.path.abspath(os.path.expanduser(filename))
+
+    def _check_pid(self):
+        # Datasets opened by a parent process are not shared with
+        # a forked child process.
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._idle = collections.OrderedDict()
+            self._acquired = {}
+
+    def _evict(self):
+        while len(self._idle) > self.maxsize:
+            key, entry = self._idle.popitem(last=False)
+            entry.dataset.close()
+
+    def acquire(self, filename):
+        """
+        Returns an open :class:`netCDF4.Dataset` of the given file, for the
+        sole use of the caller until it is given back with :meth:`release`.
+
+        """
+        filename = self._filename(filename)
+        try:
+            stat = os.stat(filename)
+            stat = (stat.st_ino, stat.st_size, stat.st_mtime)
+        except OSError:
+            # Leave netCDF4 to report any missing file.
+            stat = None
+
+        with self._lock:
+            self._check_pid()
+            # Re-use the most recently used dataset of the file, closing
+            # any which are out of date.
+            entry = None
+            for key, idle in reversed(self._idle.items()):
+                if idle.filename == filename:
+                    if idle.stat != stat:
+                        del self._idle[key]
+                        idle.dataset.close()
+                    elif entry is None:
+                        del self._idle[key]
+                        entry = idle
+            if entry is None:
+                entry = _PooledDataset(netCDF4.Dataset(filename, mode='r'),
+                                       filename, stat)
+            self._acquired[id(entry.dataset)] = entry
+        return entry.dataset
+
+    def release(self, dataset):
+        """Gives back a dataset returned by :meth:`acquire`."""
+        with self._lock:
+            entry = self._acquired.pop(id(dataset), None)
+            if entry is not None:
+                if entry.pooled:
+                    self._idle[id(dataset)] = entry
+                    self._evict()
+                else:
+                    entry.dataset.close()
+
+    @contextlib.contextmanager
+    def dataset(self, filename):
+        """
+        A context manager providing an open :class:`netCDF4.Dataset` of the
+        given file, for the sole use of the caller.
+
+        """
+        dataset = self.acquire(filename)
+        try:
+            yield dataset
+        finally:
+            self.release(dataset)
+
+    def discard(self, filename):
+        """
+        Removes any datasets of the given file from the pool, closing each
+        one once it is no longer in use.
+
+        """
+        filename = self._filename(filename)
+        with self._lock:
+            self._check_pid()
+            for key, entry in self._idle.items():
+                if entry.filename == filename:
+                    del self._idle[key]
+                    entry.dataset.close()
+            for entry in self._acquired.itervalues():
+                if entry.filename == filename:
+                    entry.pooled = False
+
+
+_DATASET_POOL = _DatasetPool()
+"""The pool of open netCDF files shared by all CF-netCDF reading."""
+
 
 ################################################################################
 class CFVariable(object):
@@ -86,8 +226,9 @@ class CFVariable(object):
     @staticmethod
     def _identify_common(variables, ignore, target):
         if ignore is None:
-            ignore = []
-            
+            ignore = ()
+        ignore = frozenset(ignore)
+
         if target is None:
             target = variables
         elif isinstance(target, basestring):
@@ -219,7 +360,6 @@ class CFAncillaryDataVariable(CFVariable):
     def identify(cls, variables, ignore=None, target=None, warn=True):
         result = {}
         ignore, target = cls._identify_common(variables, ignore, target)
-        netcdf_variable_names = variables.keys()
 
         # Identify all CF ancillary data variables.
         for nc_var_name, nc_var in target.iteritems():
@@ -229,7 +369,7 @@ class CFAncillaryDataVariable(CFVariable):
             if nc_var_att is not None:
                 for name in nc_var_att.split():
                     if name not in ignore:
-                        if name not in netcdf_variable_names:
+                        if name not in variables:
                             if warn:
                                 message = 'Missing CF-netCDF ancillary data variable %r, referenced by netCDF variable %r'
                                 warnings.warn(message % (name, nc_var_name))
@@ -260,7 +400,6 @@ class CFAuxiliaryCoordinateVariable(CFVariable):
     def identify(cls, variables, ignore=None, target=None, warn=True):
         result = {}
         ignore, target = cls._identify_common(variables, ignore, target)
-        netcdf_variable_names = variables.keys()
 
         # Identify all CF auxiliary coordinate variables.
         for nc_var_name, nc_var in target.iteritems():
@@ -270,7 +409,7 @@ class CFAuxiliaryCoordinateVariable(CFVariable):
             if nc_var_att is not None:
                 for name in nc_var_att.split():
                     if name not in ignore:
-                        if name not in netcdf_variable_names:
+                        if name not in variables:
                             if warn:
                                 message = 'Missing CF-netCDF auxiliary coordinate variable %r, referenced by netCDF variable %r'
                                 warnings.warn(message % (name, nc_var_name))
@@ -303,7 +442,6 @@ class CFBoundaryVariable(CFVariable):
     def identify(cls, variables, ignore=None, target=None, warn=True):
         result = {}
         ignore, target = cls._identify_common(variables, ignore, target)
-        netcdf_variable_names = variables.keys()
 
         # Identify all CF boundary variables.
         for nc_var_name, nc_var in target.iteritems():
@@ -314,7 +452,7 @@ class CFBoundaryVariable(CFVariable):
                 name = nc_var_att.strip()
 
                 if name not in ignore:
-                    if name not in netcdf_variable_names:
+                    if name not in variables:
                         if warn:
                             message = 'Missing CF-netCDF boundary variable %r, referenced by netCDF variable %r'
                             warnings.warn(message % (name, nc_var_name))
@@ -345,7 +483,6 @@ class CFClimatologyVariable(CFVariable):
     def identify(cls, variables, ignore=None, target=None, warn=True):
         result = {}
         ignore, target = cls._identify_common(variables, ignore, target)
-        netcdf_variable_names = variables.keys()
 
         # Identify all CF climatology variables.
         for nc_var_name, nc_var in target.iteritems():
@@ -356,7 +493,7 @@ class CFClimatologyVariable(CFVariable):
                 name = nc_var_att.strip()
 
                 if name not in ignore:
-                    if name not in netcdf_variable_names:
+                    if name not in variables:
                         if warn:
                             message = 'Missing CF-netCDF climatology variable %r, referenced by netCDF variable %r'
                             warnings.warn(message % (name, nc_var_name))
@@ -443,7 +580,6 @@ class _CFFormulaTermsVariable(CFVariable):
     def identify(cls, variables, ignore=None, target=None, warn=True):
         result = {}
         ignore, target = cls._identify_common(variables, ignore, target)
-        netcdf_variable_names = variables.keys()
 
         # Identify all CF formula terms variables.
         for nc_var_name, nc_var in target.iteritems():
@@ -457,7 +593,7 @@ class _CFFormulaTermsVariable(CFVariable):
                     variable_name = match_group['rhs']
 
                     if variable_name not in ignore:
-                        if variable_name not in netcdf_variable_names:
+                        if variable_name not in variables:
                             if warn:
                                 message = 'Missing CF-netCDF formula term variable %r, referenced by netCDF variable %r'
                                 warnings.warn(message % (variable_name, nc_var_name))
@@ -496,7 +632,6 @@ class CFGridMappingVariable(CFVariable):
     def identify(cls, variables, ignore=None, target=None, warn=True):
         result = {}
         ignore, target = cls._identify_common(variables, ignore, target)
-        netcdf_variable_names = variables.keys()
 
         # Identify all grid mapping variables.
         for nc_var_name, nc_var in target.iteritems():
@@ -507,7 +642,7 @@ class CFGridMappingVariable(CFVariable):
                 name = nc_var_att.strip()
                 
                 if name not in ignore:
-                    if name not in netcdf_variable_names:
+                    if name not in variables:
                         if warn:
                             message = 'Missing CF-netCDF grid mapping variable %r, referenced by netCDF variable %r'
                             warnings.warn(message % (name, nc_var_name))
@@ -534,7 +669,6 @@ class CFLabelVariable(CFVariable):
     def identify(cls, variables, ignore=None, target=None, warn=True):
         result = {}
         ignore, target = cls._identify_common(variables, ignore, target)
-        netcdf_variable_names = variables.keys()
 
         # Identify all CF label variables.
         for nc_var_name, nc_var in target.iteritems():
@@ -544,7 +678,7 @@ class CFLabelVariable(CFVariable):
             if nc_var_att is not None:
                 for name in nc_var_att.split():
                     if name not in ignore:
-                        if name not in netcdf_variable_names:
+                        if name not in variables:
                             if warn:
                                 message = 'Missing CF-netCDF label variable %r, referenced by netCDF variable %r'
                                 warnings.warn(message % (name, nc_var_name))
@@ -648,7 +782,6 @@ class CFMeasureVariable(CFVariable):
     def identify(cls, variables, ignore=None, target=None, warn=True):
         result = {}
         ignore, target = cls._identify_common(variables, ignore, target)
-        netcdf_variable_names = variables.keys()
 
         # Identify all CF measure variables.
         for nc_var_name, nc_var in target.iteritems():
@@ -662,7 +795,7 @@ class CFMeasureVariable(CFVariable):
                     variable_name = match_group['rhs']
                     
                     if variable_name not in ignore:
-                        if variable_name not in netcdf_variable_names:
+                        if variable_name not in variables:
                             if warn:
                                 message = 'Missing CF-netCDF measure variable %r, referenced by netCDF variable %r'
                                 warnings.warn(message % (variable_name, nc_var_name))
@@ -790,7 +923,7 @@ class CFReader(object):
         self.cf_group = CFGroup()
         '''Collection of CF-netCDF variables associated with this netCDF file'''
 
-        self._dataset = netCDF4.Dataset(self._filename, mode='r')
+        self._dataset = _DATASET_POOL.acquire(self._filename)
 
         # Issue load optimisation warning.
         if warn and self._dataset.file_format in ['NETCDF3_CLASSIC', 'NETCDF3_64BIT']:
@@ -799,6 +932,7 @@ class CFReader(object):
         
         self._check_monotonic = monotonic
 
+        self._index_references()
         self._translate()
         self._build_cf_groups()
         self._reset()
@@ -806,6 +940,45 @@ class CFReader(object):
     def __repr__(self):
         return '%s(%r)' % (self.__class__.__name__, self._filename)
 
+    def _index_references(self):
+        """
+        Index the netCDF variables which refer to other variables, by the
+        name of each CF-netCDF variable attribute that makes a reference.
+
+        """
+        identities = set(variable_type.cf_identity for variable_type in
+                         self._variable_types + (_CFFormulaTermsVariable,))
+        self._referrers = {identity: [] for identity in identities}
+
+        # Build the index in one pass, in variable order.
+        for nc_var_name, nc_var in self._dataset.variables.iteritems():
+            for identity in identities.intersection(nc_var.ncattrs()):
+                self._referrers[identity].append(nc_var_name)
+
+        self._referrer_sets = {identity: set(names) for identity, names in
+                               self._referrers.iteritems()}
+
+    def _identify_referenced(self, variable_type, ignore, warn=True,
+                             target=None):
+        """
+        Identify the CF-netCDF variables of the given type, as referred to
+        by the target variable, or otherwise by any variable.
+
+        """
+        variables = self._dataset.variables
+        if target is None:
+            targets = self._referrers[variable_type.cf_identity]
+        elif target in self._referrer_sets[variable_type.cf_identity]:
+            targets = [target]
+        else:
+            targets = []
+
+        result = {}
+        for name in targets:
+            result.update(variable_type.identify(variables, ignore=ignore,
+                                                 target=name, warn=warn))
+        return result
+
     def _translate(self):
         """Classify the netCDF variables into CF-netCDF variables."""
         
@@ -824,7 +997,7 @@ class CFReader(object):
         for variable_type in self._variable_types:
             # Prevent grid mapping variables being mis-identified as CF coordinate variables.
             ignore = None if issubclass(variable_type, CFGridMappingVariable) else coordinate_names
-            self.cf_group.update(variable_type.identify(self._dataset.variables, ignore=ignore))
+            self.cf_group.update(self._identify_referenced(variable_type, ignore))
 
         # Identify global netCDF attributes.
         attr_dict = {attr_name: getattr(self._dataset, attr_name, '') for
@@ -842,7 +1015,7 @@ class CFReader(object):
             self.cf_group[name] = CFDataVariable(name, self._dataset.variables[name])
 
         # Identify and register all CF formula terms with the relevant CF variables.
-        formula_terms = _CFFormulaTermsVariable.identify(self._dataset.variables)
+        formula_terms = self._identify_referenced(_CFFormulaTermsVariable, None)
         for cf_var in formula_terms.itervalues():
             if cf_var.cf_name in self.cf_group:
                 self.cf_group[cf_var.cf_name].add_formula_term(cf_var.cf_root, cf_var.cf_term)
@@ -850,7 +1023,8 @@ class CFReader(object):
     def _build_cf_groups(self):
         """Build the first order relationships between CF-netCDF variables."""
         
-        coordinate_names = self.cf_group.coordinates.keys()
+        coordinates = self.cf_group.coordinates
+        coordinate_names = frozenset(coordinates)
 
         for cf_variable in self.cf_group.itervalues():
             cf_group = CFGroup()
@@ -860,8 +1034,9 @@ class CFReader(object):
                 # Prevent grid mapping variables being mis-identified as
                 # CF coordinate variables.
                 ignore = None if issubclass(variable_type, CFGridMappingVariable) else coordinate_names
-                match = variable_type.identify(self._dataset.variables, ignore=ignore,
-                                               target=cf_variable.cf_name, warn=False)
+                match = self._identify_referenced(variable_type, ignore,
+                                                  warn=False,
+                                                  target=cf_variable.cf_name)
                 cf_group.update({name: self.cf_group[name] for name in match.iterkeys()})
 
             # Build CF data variable relationships.
@@ -871,12 +1046,12 @@ class CFReader(object):
                 # Add appropriate "dimensioned" CF coordinate variables.
                 cf_group.update({cf_name: self.cf_group[cf_name] for cf_name
                                     in cf_variable.dimensions if cf_name in
-                                    self.cf_group.coordinates})
+                                    coordinates})
                 # Add appropriate "dimensionless" CF coordinate variables.
                 coordinates_attr = getattr(cf_variable, 'coordinates', '')
                 cf_group.update({cf_name: self.cf_group[cf_name] for cf_name
                                     in coordinates_attr.split() if cf_name in
-                                    self.cf_group.coordinates})
+                                    coordinates})
 
             # Add the CF group to the variable.
             cf_variable.cf_group = cf_group
@@ -888,7 +1063,8 @@ class CFReader(object):
             self.cf_group[nc_var_name].cf_attrs_reset()
 
     def __del__(self):
-        # Explicitly close dataset to prevent file remaining open.
-        self._dataset.close()
+        # Explicitly release the dataset, to allow the file to be closed.
+        if hasattr(self, '_dataset'):
+            _DATASET_POOL.release(self._dataset)
 
 
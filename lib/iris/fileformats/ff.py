@@ -99,6 +99,47 @@ _LBUSER_DTYPE_LOOKUP = {1: np.dtype('>f8'),
                         3: np.dtype('>i8'),
                         'default': np.dtype('>f8'), }
 
+# The structured data type of the valid FF LOOKUP table entries.
+_FF_LOOKUP_DTYPE = np.dtype([('lb', np.int64, (pp.NUM_LONG_HEADERS, )),
+                             ('b', np.float64, (pp.NUM_FLOAT_HEADERS, ))])
+
+
+def _index_ff_lookup(filename):
+    """
+    Returns a structured array of the PP headers of all the valid entries
+    within the LOOKUP table of a FieldsFile, read in a single pass.
+
+    """
+    ff_header = FFHeader(filename)
+    # FF table pointer initialisation based on FF LOOKUP table configuration.
+    table_index, table_entry_depth, table_count = ff_header.lookup_table
+    table_offset = (table_index - 1) * FF_WORD_DEPTH       # in bytes
+
+    # Check for an instantaneous dump.
+    if ff_header.dataset_type == 1:
+        table_count = ff_header.total_prognostic_fields
+
+    # Read the whole FF LOOKUP table in one go.
+    with open(filename, 'rb') as ff_file:
+        ff_file.seek(table_offset, os.SEEK_SET)
+        table = np.fromfile(ff_file, dtype='>i8',
+                            count=table_count * table_entry_depth)
+    table_count = table.size // table_entry_depth
+    table = table[:table_count * table_entry_depth].reshape(table_count,
+                                                            table_entry_depth)
+
+    # There are no more valid entries after the first terminating entry.
+    terminate = np.flatnonzero(table[:, 0] == _FF_LOOKUP_TABLE_TERMINATE)
+    if terminate.size:
+        table = table[:terminate[0]]
+
+    n_headers = pp.NUM_LONG_HEADERS + pp.NUM_FLOAT_HEADERS
+    lookup = np.empty(len(table), dtype=_FF_LOOKUP_DTYPE)
+    lookup['lb'] = table[:, :pp.NUM_LONG_HEADERS]
+    lookup['b'] = table[:, pp.NUM_LONG_HEADERS:n_headers].view('>f8')
+    return lookup
+
+
 class FFHeader(object):
     """A class to represent the FIXED_LENGTH_HEADER section of a FieldsFile."""
     
@@ -210,7 +251,7 @@ class FFHeader(object):
 class FF2PP(object):
     """A class to extract the individual PPFields from within a FieldsFile."""
 
-    def __init__(self, filename, read_data=False):
+    def __init__(self, filename, read_data=False, header_filter=None):
         """
         Create a FieldsFile to Post Process instance that returns a generator
         of PPFields contained within the FieldsFile.
@@ -225,6 +266,11 @@ class FF2PP(object):
         * read_data (boolean):
             Specify whether to read the associated PPField data within the FieldsFile.
             Default value is False.
+
+        * header_filter (function):
+            A function which, given the structured array of FF LOOKUP table
+            entries, returns a boolean array selecting the fields to extract.
+            Default value is None, which extracts all the fields.
             
         Returns:
             PPField generator.
@@ -239,6 +285,7 @@ class FF2PP(object):
         self._ff_header = FFHeader(filename)
         self._filename = filename
         self._read_data = read_data
+        self._header_filter = header_filter
 
     def _payload(self, field):
         '''Calculate the payload data depth (in bytes) and type.'''
@@ -268,36 +315,20 @@ class FF2PP(object):
         return data_depth, data_type
         
     def _extract_field(self):
-        # FF table pointer initialisation based on FF LOOKUP table configuration. 
-        table_index, table_entry_depth, table_count = self._ff_header.lookup_table
-        table_offset = (table_index - 1) * FF_WORD_DEPTH       # in bytes
-        table_entry_depth = table_entry_depth * FF_WORD_DEPTH  # in bytes
-        # Open the FF for processing.
-        ff_file = open(self._ff_header.ff_filename, 'rb')
-        ff_file_seek = ff_file.seek
-
-        # Check for an instantaneous dump.
-        if self._ff_header.dataset_type == 1:
-            table_count = self._ff_header.total_prognostic_fields
+        # Read the valid FF LOOKUP table entries, re-using any cached copy.
+        lookup = pp._cached_index(self._filename, 'ff', _index_ff_lookup)
+        if self._header_filter is not None:
+            lookup = lookup[self._header_filter(lookup)]
+        # Open the FF for processing, if the data is to be read.
+        ff_file = None
+        if self._read_data:
+            ff_file = open(self._ff_header.ff_filename, 'rb')
+            ff_file_seek = ff_file.seek
 
         # Process each FF LOOKUP table entry.
-        while table_count:
-            table_count -= 1
-            # Move file pointer to the start of the current FF LOOKUP table entry.
-            ff_file_seek(table_offset, os.SEEK_SET)
-            # Read the current PP header entry from the FF LOOKUP table.
-            header_integers = np.fromfile(ff_file, dtype='>i8',
-                                          count=pp.NUM_LONG_HEADERS)
-            header_floats = np.fromfile(ff_file, dtype='>f8',
-                                        count=pp.NUM_FLOAT_HEADERS)
+        for entry in lookup:
             # In 64-bit words.
-            header_data = tuple(header_integers) + tuple(header_floats)
-            # Check whether the current FF LOOKUP table entry is valid.
-            if header_data[0] == _FF_LOOKUP_TABLE_TERMINATE:
-                # There are no more FF LOOKUP table entries to read. 
-                break
-            # Calculate next FF LOOKUP table entry.
-            table_offset += table_entry_depth
+            header_data = tuple(entry['lb']) + tuple(entry['b'])
             # Construct a PPField object and populate using the header_data
             # read from the current FF LOOKUP table.
             # (The PPField sub-class will depend on the header release number.)
@@ -322,14 +353,15 @@ class FF2PP(object):
                 field._data = np.array(proxy)
                 field._data_manager = DataManager(data_shape, data_type, field.bmdi)
             yield field
-        ff_file.close()
+        if ff_file is not None:
+            ff_file.close()
         return
         
     def __iter__(self):
         return self._extract_field()
 
 
-def load_cubes(filenames, callback):
+def load_cubes(filenames, callback, constraints=None, parallel=None):
     """
     Loads cubes from a list of fields files filenames.
     
@@ -340,6 +372,12 @@ def load_cubes(filenames, callback):
     Kwargs:
     
     * callback - a function which can be passed on to :func:`iris.io.run_callback`
+
+    * constraints - one or more constraints, used to skip those fields which
+      cannot produce a matching cube. The resultant cubes must still be
+      filtered by the constraints.
+
+    * parallel - the number of worker processes used to load the files.
     
     .. note::
 
@@ -347,4 +385,5 @@ def load_cubes(filenames, callback):
         is not preserved when there is a field with orography references).
          
     """
-    return pp._load_cubes_variable_loader(filenames, callback, FF2PP)
+    return pp._load_cubes_variable_loader(filenames, callback, FF2PP,
+                                          constraints, parallel)
@@ -28,6 +28,7 @@ import warnings
 
 import numpy as np
 
+import iris.io
 import iris.proxy
 iris.proxy.apply_proxy('gribapi', globals())
 
@@ -564,7 +565,7 @@ def load_cubes(filenames, callback=None):
     return rules.load_cubes(filenames, callback, grib_loader)
 
 
-def save_grib2(cube, target, append=False, **kwargs):
+def save_grib2(cube, target, append=False, prefetch=False, **kwargs):
     """
     Save a cube to a GRIB2 file.
     
@@ -579,6 +580,12 @@ def save_grib2(cube, target, append=False, **kwargs):
                       Only applicable when target is a filename, not a file handle.
                       Default is False.
 
+        * prefetch  - Whether to load the data of the next message in a background thread
+                      while the current message is being saved. Default is False.
+
+    Each message only loads its own data from the source of the cube's data, so
+    the whole cube is never held in memory.
+
     See also :func:`iris.io.save`.
     
     """
@@ -601,7 +608,8 @@ def save_grib2(cube, target, append=False, **kwargs):
                                                "latitude or longitude coord")
 
     # Save each latlon slice2D in the cube 
-    for slice2D in cube.slices([lat_coords[0], lon_coords[0]]):
+    slices = cube.slices([lat_coords[0], lon_coords[0]])
+    for slice2D in iris.io._realised_slices(slices, prefetch):
 
         # Save this slice to the grib file
         grib_message = gribapi.grib_new_from_samples("GRIB2")
@@ -19,6 +19,7 @@ Provides support for virtual cube data and deferred loading.
 
 """
 
+import collections
 from copy import deepcopy
 import types
 
@@ -74,6 +75,86 @@ class _HashableSlice(iris.util._OrderedHashable):
         return slice(self.start, self.stop, self.step)
 
 
+def _rebuild_proxy_record_array(records, proxy_class, paths):
+    """Reconstructs a pickled :class:`ProxyRecordArray`."""
+    result = records.view(ProxyRecordArray)
+    result.proxy_class = proxy_class
+    result.paths = paths
+    return result
+
+
+class ProxyRecordArray(np.ndarray):
+    """
+    A compact array of data proxies, all of the same class.
+
+    In place of an object per proxy, each element is a structured record of
+    an index into a table of file paths shared by the whole array, and the
+    fields of the proxy class's ``record_dtype``. Elements with a negative
+    path index represent missing proxies.
+
+    The proxy class must provide a ``record_dtype``, a ``record`` method that
+    returns the field values of a proxy, and a ``from_record`` class method
+    that constructs a proxy from a path and a record (e.g.
+    :class:`iris.fileformats.pp.PPDataProxy`).
+
+    Slicing or copying the array retains the proxy class and the paths, and
+    :meth:`DataManager.load` accepts it in place of an array of proxies.
+
+    """
+    def __new__(cls, shape, proxy_class, paths):
+        dtype = np.dtype([('path_index', np.int32)] + proxy_class.record_dtype.descr)
+        result = np.zeros(shape, dtype=dtype)
+        result['path_index'] = -1
+        return _rebuild_proxy_record_array(result, proxy_class, tuple(paths))
+
+    @classmethod
+    def from_proxies(cls, proxies):
+        """
+        Returns a one-dimensional :class:`ProxyRecordArray` of the given
+        sequence of proxies, which must all be of the same class.
+
+        """
+        proxy_class = type(proxies[0])
+        path_indices = {}
+        for proxy in proxies:
+            path_indices.setdefault(proxy.path, len(path_indices))
+        paths = sorted(path_indices, key=path_indices.get)
+
+        result = cls(len(proxies), proxy_class, paths)
+        result.view(np.ndarray)[:] = [(path_indices[proxy.path],) + tuple(proxy.record())
+                                      for proxy in proxies]
+        return result
+
+    def __array_finalize__(self, obj):
+        self.proxy_class = getattr(obj, 'proxy_class', None)
+        self.paths = getattr(obj, 'paths', ())
+
+    def __getitem__(self, keys):
+        result = np.ndarray.__getitem__(self, keys)
+        if not isinstance(result, np.ndarray):
+            # Retain a single record as a 0-dimensional array.
+            result = _rebuild_proxy_record_array(np.array(result, dtype=self.dtype),
+                                                  self.proxy_class, self.paths)
+        return result
+
+    def __reduce__(self):
+        return (_rebuild_proxy_record_array,
+                (self.view(np.ndarray), self.proxy_class, self.paths))
+
+    def proxies(self):
+        """
+        Returns the equivalent object array of proxies, with None for each
+        missing proxy.
+
+        """
+        result = np.empty(self.shape, dtype='object')
+        for index, record in np.ndenumerate(self.view(np.ndarray)):
+            path_index = record['path_index']
+            if path_index >= 0:
+                result[index] = self.proxy_class.from_record(self.paths[path_index], record)
+        return result
+
+
 class DataManager(iris.util._OrderedHashable):
     """
     Holds the context that allows a corresponding array of DataProxy objects to be
@@ -244,11 +325,76 @@ class DataManager(iris.util._OrderedHashable):
         
         return tuple(merged_slice)
 
+    def _load_payloads(self, proxies, deferred_slice):
+        """
+        Returns a generator of (index, payload) pairs for the given list of
+        proxies.
+
+        Proxies whose class provides a ``load_many`` method (e.g.
+        :class:`iris.fileformats.pp.PPDataProxy`) are loaded together by
+        that method, which can share files and reads between them. The
+        other proxies are loaded one at a time.
+
+        """
+        proxy_groups = collections.defaultdict(list)
+        for i, proxy in enumerate(proxies):
+            proxy_groups[type(proxy)].append(i)
+
+        for proxy_class, group in proxy_groups.iteritems():
+            load_many = getattr(proxy_class, 'load_many', None)
+            if load_many is None:
+                for i in group:
+                    payload = proxies[i].load(self._orig_data_shape,
+                                              self.data_type, self.mdi,
+                                              deferred_slice)
+                    yield i, payload
+            else:
+                group_proxies = [proxies[i] for i in group]
+                for j, payload in load_many(group_proxies,
+                                            self._orig_data_shape,
+                                            self.data_type, self.mdi,
+                                            deferred_slice):
+                    yield group[j], payload
+
+    def _single_payload_data(self, payload, array_shape):
+        """
+        Returns the real data array equivalent to :meth:`load` for the
+        payload of a single proxy.
+
+        """
+        dtype = self.data_type.newbyteorder('=')
+        if payload.dtype != dtype:
+            payload = payload.astype(dtype)
+        data = payload.reshape(array_shape)
+
+        if ma.isMaskedArray(data):
+            if ma.count_masked(data) == 0:
+                data = data.filled()
+            elif self.mdi is not None:
+                data.fill_value = self.mdi
+
+        if not data.flags['C_CONTIGUOUS']:
+            data = data.copy()
+
+        return data
+
     def load(self, proxy_array):
         """Returns the real data array that corresponds to the given array of proxies."""
         
+        if isinstance(proxy_array, ProxyRecordArray):
+            proxy_array = proxy_array.proxies()
+
         deferred_slice = self._deferred_slice_merge()
         array_shape = self.shape(proxy_array)
+
+        # A single proxy (e.g. one 2D field) can provide the data directly,
+        # without the overhead of a fully masked array to assemble into.
+        if proxy_array.size == 1:
+            proxy = proxy_array.flat[0]
+            if proxy not in [None, 0]:
+                payload = proxy.load(self._orig_data_shape, self.data_type,
+                                     self.mdi, deferred_slice)
+                return self._single_payload_data(payload, array_shape)
         
         # Create fully masked data (all missing)
         try:
@@ -263,16 +409,20 @@ class DataManager(iris.util._OrderedHashable):
                     ' memory. Consider using indexing to select a subset of'
                     ' the Cube.'.format(array_shape))
 
+        indices = []
+        proxies = []
         for index, proxy in np.ndenumerate(proxy_array):
             if proxy not in [None, 0]:  # 0 can come from slicing masked proxy; np.array(masked_constant).
-                payload = proxy.load(self._orig_data_shape, self.data_type, self.mdi, deferred_slice)
+                indices.append(index)
+                proxies.append(proxy)
 
-                # Explicitly set the data fill value when no mdi value has been specified
-                # in order to override default masked array fill value behaviour.
-                if self.mdi is None and ma.isMaskedArray(payload):
-                    data.fill_value = payload.fill_value
+        for i, payload in self._load_payloads(proxies, deferred_slice):
+            # Explicitly set the data fill value when no mdi value has been specified
+            # in order to override default masked array fill value behaviour.
+            if self.mdi is None and ma.isMaskedArray(payload):
+                data.fill_value = payload.fill_value
 
-                data[index] = payload
+            data[indices[i]] = payload
 
         # we can turn the masked array into a normal array if it's full.
         if ma.count_masked(data) == 0:
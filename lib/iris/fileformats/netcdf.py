@@ -25,10 +25,12 @@ Version 1.4, 27 February 2009.
 """
 
 import collections
+import copy
 import itertools
 import os
 import os.path
 import string
+import threading
 import warnings
 
 import iris.proxy
@@ -173,8 +175,25 @@ class CFNameCoordMap(object):
         return result
 
 
+# The PyKE knowledge engine of each thread.
+_PYKE_ENGINES = threading.local()
+
+
 def _pyke_kb_engine():
-    """Return the PyKE knowledge engine for CF->cube conversion."""
+    """
+    Return the PyKE knowledge engine for CF->cube conversion.
+
+    The engine is created on first use, and then reused, by each thread.
+
+    """
+    engine = getattr(_PYKE_ENGINES, 'engine', None)
+    if engine is None:
+        engine = _PYKE_ENGINES.engine = _create_pyke_kb_engine()
+    return engine
+
+
+def _create_pyke_kb_engine():
+    """Create the PyKE knowledge engine for CF->cube conversion."""
 
     pyke_dir = os.path.join(os.path.dirname(__file__), '_pyke_rules')
     compile_dir = os.path.join(pyke_dir, 'compiled_krb')
@@ -232,11 +251,10 @@ class NetCDFDataProxy(object):
             :class:`numpy.ndarray`
 
         """
-        dataset = netCDF4.Dataset(self.path)
-        variable = dataset.variables[self.variable_name]
-        # Get the NetCDF variable data and slice.
-        payload = variable[deferred_slice]
-        dataset.close()
+        with iris.fileformats.cf._DATASET_POOL.dataset(self.path) as dataset:
+            variable = dataset.variables[self.variable_name]
+            # Get the NetCDF variable data and slice.
+            payload = variable[deferred_slice]
 
         return payload
 
@@ -315,8 +333,26 @@ def _set_attributes(attributes, key, value):
         attributes[str(key)] = value
 
 
-def _load_cube(engine, cf, cf_var, filename):
-    """Create the cube associated with the CF-netCDF data variable."""
+def _cf_group_signature(cf_var):
+    """
+    Return a signature of the structure of the CF-netCDF data variable.
+
+    Within a file, data variables with the same signature have the same
+    coordinates, coordinate systems and formula terms.
+
+    """
+    return (tuple(cf_var.dimensions), frozenset(cf_var.cf_group.keys()))
+
+
+def _load_cube(engine, cf, cf_var, filename, coords_cache=None):
+    """
+    Create the cube associated with the CF-netCDF data variable.
+
+    If a coords_cache dictionary is given, the coordinates are only built
+    by the inference engine for the first data variable of each structure
+    (see :func:`_cf_group_signature`), and copied for the others.
+
+    """
 
     # Figure out what the eventual data type will be after any scale/offset
     # transforms.
@@ -344,22 +380,56 @@ def _load_cube(engine, cf, cf_var, filename):
     engine.rule_triggered = set()
     engine.filename = filename
 
-    # Assert any case-specific facts.
-    _assert_case_specific_facts(engine, cf, cf_var.cf_group)
+    signature = None
+    cached = None
+    if coords_cache is not None:
+        signature = _cf_group_signature(cf_var)
+        cached = coords_cache.get(signature)
+
+    if cached is None:
+        # Assert any case-specific facts.
+        _assert_case_specific_facts(engine, cf, cf_var.cf_group)
+    else:
+        # Without any case-specific facts, only the rules for the metadata
+        # of the cube itself are triggered.
+        engine.provides['coordinates'] = []
 
     # Run pyke inference engine with forward chaining rules.
     engine.activate(_PYKE_RULE_BASE)
 
-    # Populate coordinate attributes with the untouched attributes from the
-    # associated CF-netCDF variable.
-    coordinates = engine.provides.get('coordinates', [])
     attribute_predicate = lambda item: item[0] not in _CF_ATTRS
 
-    for coord, cf_var_name in coordinates:
-        tmpvar = itertools.ifilter(attribute_predicate,
-                                   cf.cf_group[cf_var_name].cf_attrs_unused())
-        for attr_name, attr_value in tmpvar:
-            _set_attributes(coord.attributes, attr_name, attr_value)
+    if cached is None:
+        # Populate coordinate attributes with the untouched attributes from
+        # the associated CF-netCDF variable.
+        coordinates = engine.provides.get('coordinates', [])
+
+        for coord, cf_var_name in coordinates:
+            tmpvar = itertools.ifilter(
+                attribute_predicate, cf.cf_group[cf_var_name].cf_attrs_unused())
+            for attr_name, attr_value in tmpvar:
+                _set_attributes(coord.attributes, attr_name, attr_value)
+
+        if signature is not None:
+            coord_defns = []
+            for coord, cf_var_name in coordinates:
+                is_dim = any(coord is dim_coord for dim_coord in
+                             cube.dim_coords)
+                coord_defns.append((coord.copy(), cf_var_name,
+                                    cube.coord_dims(coord), is_dim))
+            coords_cache[signature] = (coord_defns,
+                                       copy.deepcopy(engine.requires))
+    else:
+        # Add copies of the coordinates of the same structure.
+        coord_defns, requires = cached
+        for coord, cf_var_name, dims, is_dim in coord_defns:
+            coord = coord.copy()
+            if is_dim:
+                cube.add_dim_coord(coord, dims)
+            else:
+                cube.add_aux_coord(coord, dims or None)
+            engine.provides['coordinates'].append((coord, cf_var_name))
+        engine.requires.update(copy.deepcopy(requires))
 
     tmpvar = itertools.ifilter(attribute_predicate, cf_var.cf_attrs_unused())
     # Attach untouched attributes of the associated CF-netCDF data variable to
@@ -397,7 +467,7 @@ def _load_aux_factory(engine, cf, filename, cube):
         cube.add_aux_factory(factory)
 
 
-def load_cubes(filenames, callback=None):
+def load_cubes(filenames, callback=None, parallel=None):
     """
     Loads cubes from a list of NetCDF filenames.
 
@@ -411,6 +481,10 @@ def load_cubes(filenames, callback=None):
     * callback (callable function):
         Function which can be passed on to :func:`iris.io.run_callback`.
 
+    * parallel (int):
+        The number of worker processes used to load the files. Each worker
+        also runs the callback for the cubes of its files.
+
     Returns:
         Generator of loaded NetCDF :class:`iris.cubes.Cube`.
 
@@ -421,16 +495,19 @@ def load_cubes(filenames, callback=None):
     if isinstance(filenames, basestring):
         filenames = [filenames]
 
-    for filename in filenames:
+    def load_file(filename):
         # Ingest the netCDF file.
         cf = iris.fileformats.cf.CFReader(filename)
 
+        # The coordinates of each structure of CF data variable in the file.
+        coords_cache = {}
+
         # Process each CF data variable.
         for cf_var in cf.cf_group.data_variables.itervalues():
             # Only process CF data variables that do not participate in a
             # formula term.
             if not cf_var.has_formula_terms():
-                cube = _load_cube(engine, cf, cf_var, filename)
+                cube = _load_cube(engine, cf, cf_var, filename, coords_cache)
 
                 # Process any associated formula terms and attach
                 # the corresponding AuxCoordFactory.
@@ -446,6 +523,10 @@ def load_cubes(filenames, callback=None):
 
                 yield cube
 
+    for cubes in iris.io._map_files(load_file, filenames, parallel):
+        for cube in cubes:
+            yield cube
+
 
 class Saver(object):
     """A manager for saving netcdf files."""
@@ -489,6 +570,8 @@ class Saver(object):
         """List of grid mappings added to the file"""
         self._existing_dim = {}
         """A dictionary, listing dimension names and corresponding length"""
+        # Any open dataset of the file must be closed before it is written.
+        iris.fileformats.cf._DATASET_POOL.discard(filename)
         self._dataset = netCDF4.Dataset(filename, mode='w',
                                         format=netcdf_format)
         """NetCDF dataset"""
@@ -502,7 +585,8 @@ class Saver(object):
         self._dataset.sync()
         self._dataset.close()
 
-    def write(self, cube):
+    def write(self, cube, zlib=False, complevel=4, shuffle=True,
+              chunksizes=None, least_significant_digit=None):
         """
         Wrapper for saving cubes to a NetCDF file.
 
@@ -511,9 +595,38 @@ class Saver(object):
         * cube (:class:`iris.cube.Cube`):
             A :class:`iris.cube.Cube` to be saved to a netCDF file.
 
+        Kwargs:
+
+        * zlib (bool):
+            If True, the data will be compressed in the netCDF file using gzip
+            compression (default False).
+
+        * complevel (int):
+            An integer between 1 and 9 describing the level of compression
+            desired (default 4). Ignored if zlib=False.
+
+        * shuffle (bool):
+            If True, the HDF5 shuffle filter will be applied before compressing
+            the data (default True). Ignored if zlib=False.
+
+        * chunksizes (tuple of int):
+            Used to manually specify the HDF5 chunksizes for each dimension of
+            the variable. If None, and zlib=True, each chunk is a single
+            horizontal field of the cube, as given by its dimension
+            coordinates.
+
+        * least_significant_digit (int):
+            If specified, the data will be quantized, so that the data is
+            accurate to this decimal place, to improve compression.
+
         Returns:
             None.
 
+        .. note::
+
+            The compression and chunking keywords only apply to the 'NETCDF4'
+            and 'NETCDF4_CLASSIC' formats, see :meth:`netCDF4.Dataset.createVariable`.
+
         """
         if len(cube.aux_factories) > 1:
             raise ValueError('Multiple auxiliary factories are not supported.')
@@ -534,7 +647,10 @@ class Saver(object):
         self._create_cf_dimensions(dimension_names)
 
         # Create the associated cube CF-netCDF data variable.
-        cf_var_cube = self._create_cf_data_variable(cube, dimension_names)
+        cf_var_cube = self._create_cf_data_variable(
+            cube, dimension_names, zlib=zlib, complevel=complevel,
+            shuffle=shuffle, chunksizes=chunksizes,
+            least_significant_digit=least_significant_digit)
 
         # Add coordinate variables and return factory definitions
         factory_defn = self._add_dim_coords(cube, dimension_names)
@@ -1083,7 +1199,44 @@ class Saver(object):
             # Refer to grid var
             cf_var_cube.grid_mapping = cs.grid_mapping_name
 
-    def _create_cf_data_variable(self, cube, dimension_names):
+    def _field_chunksizes(self, cube):
+        """
+        Determine the chunksizes of a single horizontal field of the cube.
+
+        The horizontal dimensions are those of the cube's X and Y dimension
+        coordinates, or otherwise its last two dimensions.
+
+        Args:
+
+        * cube (:class:`iris.cube.Cube`):
+            The associated cube being saved to CF-netCDF file.
+
+        Returns:
+            Tuple of chunksizes, one for each dimension of the cube.
+
+        """
+        field_dims = set()
+        for coord in cube.coords(dim_coords=True):
+            if iris.util.guess_coord_axis(coord) in ('X', 'Y'):
+                field_dims.update(cube.coord_dims(coord))
+        if len(field_dims) != 2:
+            field_dims = set(range(cube.ndim)[-2:])
+
+        return tuple(length if dim in field_dims else 1
+                     for dim, length in enumerate(cube.shape))
+
+    def _deferred_chunks(self, cube, chunksizes):
+        """
+        Returns a generator of (key, data) pairs, which loads the deferred
+        data of the cube one chunk at a time.
+
+        """
+        data_manager = cube._data_manager
+        for key in _chunk_keys(cube.shape, chunksizes):
+            proxy_array, chunk_manager = data_manager.getitem(cube._data, key)
+            yield key, chunk_manager.load(proxy_array)
+
+    def _create_cf_data_variable(self, cube, dimension_names, **kwargs):
         """
         Create CF-netCDF data variable for the cube and any associated grid
         mapping.
@@ -1097,6 +1250,10 @@ class Saver(object):
         * dimension_names (list):
             String names for each dimension of the cube.
 
+        Kwargs:
+
+        * Any compression and chunking keywords of :meth:`Saver.write`.
+
         Returns:
             The newly created CF-netCDF data variable.
 
@@ -1105,16 +1262,50 @@ class Saver(object):
         while cf_name in self._dataset.variables:
             cf_name = self._increment_name(cf_name)
 
-        # Determine whether there is a cube MDI value.
-        fill_value = None
-        if isinstance(cube.data, ma.core.MaskedArray):
-            fill_value = cube.data.fill_value
+        chunksizes = kwargs.get('chunksizes')
+        if chunksizes is None and kwargs.get('zlib') and cube.ndim:
+            chunksizes = kwargs['chunksizes'] = self._field_chunksizes(cube)
+
+        lazy = cube._data_manager is not None and cube.ndim
+        if lazy:
+            # Write deferred data one chunk (or one field) at a time, so
+            # that the whole of the data is never held in memory.
+            data_manager = cube._data_manager
+            dtype = data_manager.data_type.newbyteorder('=')
+            chunks = self._deferred_chunks(cube, chunksizes or
+                                           self._field_chunksizes(cube))
+
+            # The fill value must be known before any data is written, so
+            # take it from the first chunk, as for a masked array. Any
+            # other masked chunks are filled with the same value, or with
+            # the netCDF default fill value of the data type.
+            first_chunk = next(chunks, None)
+            fill_value = None
+            if first_chunk is not None and \
+                    isinstance(first_chunk[1], ma.core.MaskedArray):
+                fill_value = first_chunk[1].fill_value
+                if np.array(fill_value, dtype=dtype) != fill_value:
+                    fill_value = None
+            if first_chunk is not None:
+                chunks = itertools.chain([first_chunk], chunks)
+        else:
+            dtype = cube.data.dtype
+
+            # Determine whether there is a cube MDI value.
+            fill_value = None
+            if isinstance(cube.data, ma.core.MaskedArray):
+                fill_value = cube.data.fill_value
 
         # Create the cube CF-netCDF data variable with data payload.
-        cf_var = self._dataset.createVariable(cf_name, cube.data.dtype,
+        cf_var = self._dataset.createVariable(cf_name, dtype,
                                               dimension_names,
-                                              fill_value=fill_value)
-        cf_var[:] = cube.data
+                                              fill_value=fill_value,
+                                              **kwargs)
+        if lazy:
+            for key, data in chunks:
+                cf_var[key] = data
+        else:
+            cf_var[:] = cube.data
 
         if cube.standard_name:
             cf_var.standard_name = cube.standard_name
@@ -1182,7 +1373,20 @@ class Saver(object):
         return '{}_{}'.format(varname, num)
 
 
-def save(cube, filename, netcdf_format='NETCDF4'):
+def _chunk_keys(shape, chunksizes):
+    """
+    Returns a generator of the keys of each chunk of an array of the
+    given shape, in order.
+
+    """
+    ranges = [[slice(start, start + size)
+               for start in xrange(0, length, size)]
+              for length, size in zip(shape, chunksizes)]
+    return itertools.product(*ranges)
+
+
+def save(cube, filename, netcdf_format='NETCDF4', zlib=False, complevel=4,
+         shuffle=True, chunksizes=None, least_significant_digit=None):
     """
     Save cube(s) to a netCDF file, given the cube and the filename.
 
@@ -1201,9 +1405,18 @@ def save(cube, filename, netcdf_format='NETCDF4'):
         Underlying netCDF file format, one of 'NETCDF4', 'NETCDF4_CLASSIC',
         'NETCDF3_CLASSIC' or 'NETCDF3_64BIT'. Default is 'NETCDF4' format.
 
+    * zlib, complevel, shuffle, chunksizes, least_significant_digit:
+        The compression and chunking of the data of each cube, as for
+        :meth:`Saver.write`.
+
     Returns:
         None.
 
+    Deferred data is written one chunk at a time, so that the data of each
+    cube is never all held in memory. For example, to save with compression::
+
+        iris.fileformats.netcdf.save(cube, filename, zlib=True)
+
     .. seealso::
 
         NetCDF Context manager (:class:`~Saver`).
@@ -1219,4 +1432,6 @@ def save(cube, filename, netcdf_format='NETCDF4'):
     with Saver(filename, netcdf_format) as sman:
         # Iterate through the cubelist.
         for cube in cubes:
-            sman.write(cube)
+            sman.write(cube, zlib=zlib, complevel=complevel, shuffle=shuffle,
+                       chunksizes=chunksizes,
+                       least_significant_digit=least_significant_digit)
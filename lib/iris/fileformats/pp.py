@@ -22,18 +22,24 @@ Provides UK Met Office Post Process (PP) format specific capabilities.
 import abc
 import collections
 from copy import deepcopy
+import hashlib
 import itertools
+import multiprocessing.pool
 import operator
 import os
 import re
 import struct
+import warnings
 
 import numpy as np
 import numpy.ma as ma
 import netcdftime
 
 import iris.config
+import iris.coords
+import iris._constraints
 import iris.fileformats.rules
+import iris.fileformats.um_cf_map
 import iris.io
 import iris.unit
 import iris.fileformats.manager
@@ -42,7 +48,7 @@ import iris.proxy
 iris.proxy.apply_proxy('iris.fileformats.pp_packing', globals())
 
 
-__all__ = ['load', 'save', 'PPField', 'add_load_rules', 'reset_load_rules', 
+__all__ = ['load', 'save', 'PPField', 'PPFieldIndex', 'add_load_rules', 'reset_load_rules', 
            'add_save_rules', 'reset_save_rules', 'STASH', 'EARTH_RADIUS']
 
 
@@ -51,6 +57,7 @@ EARTH_RADIUS = 6371229.0
 
 # PP->Cube and Cube->PP rules are loaded on first use
 _load_rules = None
+_user_load_rules = False
 _cross_reference_rules = None
 _save_rules = None
 
@@ -605,6 +612,33 @@ class BitwiseInt(SplittableInt):
             SplittableInt.__setattr__(self, name, value)
 
 
+# Neighbouring data payloads separated by no more than this many bytes are
+# read from the file together by PPDataProxy.load_many.
+_MAX_READ_GAP = 64 * 1024
+
+# The maximum number of bytes read at once by PPDataProxy.load_many.
+_MAX_READ_SIZE = 64 * 1024 * 1024
+
+# The number of threads used by PPDataProxy.load_many to unpack WGDOS and
+# RLE packed payloads, or None to use one per CPU.
+_UNPACK_THREADS = None
+
+# The number of threads used by save to pack fields, or None to use one per
+# CPU, up to _PACK_BATCH_SIZE.
+_PACK_THREADS = None
+
+# The maximum number of WGDOS or RLE packed fields held in memory by save,
+# to be packed concurrently.
+_PACK_BATCH_SIZE = 4
+
+# The LBPACK "n1" values of the packing methods which are unpacked by the
+# pp_packing extension (i.e. WGDOS and RLE).
+_PACKED_N1 = (1, 4)
+
+# The names of the n1/n2/n3/n4/n5 values of LBPACK.
+_LBPACK_NAME_MAPPING = dict(n5=slice(4, None), n4=3, n3=2, n2=1, n1=0)
+
+
 class PPDataProxy(object):
     """A reference to the data payload of a single PP field."""
     
@@ -635,6 +669,21 @@ class PPDataProxy(object):
         return '%s(%r, %r, %r, %r)' % \
                 (self.__class__.__name__, self.path, self.offset, self.data_len, self.lbpack)
 
+    #: The fields of a compact record of the proxy, excluding the path.
+    #: See :class:`iris.fileformats.manager.ProxyRecordArray`.
+    record_dtype = np.dtype([('offset', np.int64), ('data_len', np.int64),
+                             ('lbpack', np.int32)])
+
+    def record(self):
+        """Returns the values of the :attr:`record_dtype` fields of the proxy."""
+        return (self.offset, self.data_len, int(self.lbpack))
+
+    @classmethod
+    def from_record(cls, path, record):
+        """Returns the proxy of the given path and :attr:`record_dtype` record."""
+        lbpack = SplittableInt(int(record['lbpack']), _LBPACK_NAME_MAPPING)
+        return cls(path, int(record['offset']), int(record['data_len']), lbpack)
+
     def load(self, data_shape, data_type, mdi, deferred_slice):
         """
         Load the corresponding proxy data item and perform any deferred slicing.
@@ -658,44 +707,75 @@ class PPDataProxy(object):
         with open(self.path, 'rb') as pp_file:
             pp_file.seek(self.offset, os.SEEK_SET)
             data = _read_data(pp_file, self.lbpack, self.data_len, data_shape, data_type, mdi)
-                
-        # Identify which index items in the deferred slice are tuples. 
-        tuple_dims = [i for i, value in enumerate(deferred_slice) if isinstance(value, tuple)]
-        
-        # Whenever a slice consists of more than one tuple index item, numpy does not slice the
-        # data array as we want it to. We therefore require to split the deferred slice into 
-        # multiple slices and consistently slice the data with one slice per tuple.
-        if len(tuple_dims) > 1:
-            # Identify which index items in the deferred slice are single scalar values.
-            # Such dimensions will collapse in the sliced data shape.
-            collapsed_dims = [i for i, value in enumerate(deferred_slice) if isinstance(value, int)]
-
-            # Equate the first slice to be the original deferred slice.
-            tuple_slice = list(deferred_slice)
-            # Replace all tuple index items in the slice, except for the first,
-            # to be full slices over their dimension.
-            for dim in tuple_dims[1:]:
-                tuple_slice[dim] = slice(None)
-            
-            # Perform the deferred slice containing only the first tuple index item.
-            payload = data[tuple_slice]
-            
-            # Re-slice the data consistently with the next single tuple index item. 
-            for dim in tuple_dims[1:]:
-                # Identify all those pre-sliced collapsed dimensions less than
-                # the dimension of the current slice tuple index item.
-                ndims_collapsed = len(filter(lambda x: x < dim, collapsed_dims))
-                # Construct the single tuple slice.
-                tuple_slice = [slice(None)] * payload.ndim
-                tuple_slice[dim - ndims_collapsed] = deferred_slice[dim]
-                # Slice the data with this single tuple slice.
-                payload = payload[tuple_slice]
-        else:
-            # The deferred slice contains no more than one tuple index item, so
-            # it's safe to slice the data directly.
-            payload = data[deferred_slice]
-        
-        return payload
+
+        return _deferred_slice_data(data, deferred_slice)
+
+    @classmethod
+    def load_many(cls, proxies, data_shape, data_type, mdi, deferred_slice):
+        """
+        Load the data payloads of many proxies, and perform any deferred
+        slicing.
+
+        The proxies are grouped by file and sorted by offset, and each
+        file is opened once and read with as few large sequential reads as
+        possible, by coalescing neighbouring payloads. The WGDOS and RLE
+        packed payloads of each read are unpacked by a pool of threads.
+
+        Args:
+
+        * proxies (sequence of :class:`PPDataProxy`):
+            The proxies to load.
+        * data_shape, data_type, mdi, deferred_slice:
+            As for :meth:`load`.
+
+        Returns:
+            A generator of (index, payload) pairs, where index is the
+            position of the proxy in `proxies`. The pairs are generated in
+            file order, not necessarily the order of `proxies`.
+
+        """
+        def decode(task):
+            i, lbpack, data_bytes = task
+            data = _data_from_bytes(data_bytes, lbpack, data_shape,
+                                    data_type, mdi)
+            return i, _deferred_slice_data(data, deferred_slice)
+
+        by_path = collections.defaultdict(list)
+        for i, proxy in enumerate(proxies):
+            by_path[proxy.path].append(i)
+
+        pool = None
+        try:
+            for path, indices in by_path.iteritems():
+                indices.sort(key=lambda i: proxies[i].offset)
+                with open(path, 'rb') as pp_file:
+                    for run in _coalesce_reads(proxies, indices):
+                        start = proxies[run[0]].offset
+                        end = max(proxies[i].offset + proxies[i].data_len
+                                  for i in run)
+                        pp_file.seek(start, os.SEEK_SET)
+                        run_bytes = pp_file.read(end - start)
+                        tasks = [(i, proxies[i].lbpack,
+                                  buffer(run_bytes, proxies[i].offset - start,
+                                         proxies[i].data_len))
+                                 for i in run]
+                        packed = sum(1 for task in tasks
+                                     if task[1].n1 in _PACKED_N1)
+                        if packed > 1:
+                            # The unpacking releases the GIL, so the
+                            # payloads can be unpacked concurrently.
+                            if pool is None:
+                                pool = multiprocessing.pool.ThreadPool(
+                                    _UNPACK_THREADS)
+                            results = pool.imap(decode, tasks)
+                        else:
+                            results = itertools.imap(decode, tasks)
+                        for result in results:
+                            yield result
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
 
     def __eq__(self, other):
         result = NotImplemented
@@ -714,25 +794,97 @@ class PPDataProxy(object):
         return result
 
 
+def _coalesce_reads(proxies, indices):
+    """
+    Split the given indices of proxies, which must be sorted by offset, into
+    runs which can be read from the file together.
+
+    """
+    run = []
+    run_start = run_end = None
+    for i in indices:
+        proxy = proxies[i]
+        end = proxy.offset + proxy.data_len
+        if run and (proxy.offset - run_end > _MAX_READ_GAP or
+                    max(end, run_end) - run_start > _MAX_READ_SIZE):
+            yield run
+            run = []
+        if not run:
+            run_start = proxy.offset
+            run_end = end
+        run.append(i)
+        run_end = max(run_end, end)
+    if run:
+        yield run
+
+
+def _deferred_slice_data(data, deferred_slice):
+    """Apply the deferred slice of a data proxy to its loaded data."""
+    # Identify which index items in the deferred slice are tuples. 
+    tuple_dims = [i for i, value in enumerate(deferred_slice) if isinstance(value, tuple)]
+    
+    # Whenever a slice consists of more than one tuple index item, numpy does not slice the
+    # data array as we want it to. We therefore require to split the deferred slice into 
+    # multiple slices and consistently slice the data with one slice per tuple.
+    if len(tuple_dims) > 1:
+        # Identify which index items in the deferred slice are single scalar values.
+        # Such dimensions will collapse in the sliced data shape.
+        collapsed_dims = [i for i, value in enumerate(deferred_slice) if isinstance(value, int)]
+
+        # Equate the first slice to be the original deferred slice.
+        tuple_slice = list(deferred_slice)
+        # Replace all tuple index items in the slice, except for the first,
+        # to be full slices over their dimension.
+        for dim in tuple_dims[1:]:
+            tuple_slice[dim] = slice(None)
+        
+        # Perform the deferred slice containing only the first tuple index item.
+        payload = data[tuple_slice]
+        
+        # Re-slice the data consistently with the next single tuple index item. 
+        for dim in tuple_dims[1:]:
+            # Identify all those pre-sliced collapsed dimensions less than
+            # the dimension of the current slice tuple index item.
+            ndims_collapsed = len(filter(lambda x: x < dim, collapsed_dims))
+            # Construct the single tuple slice.
+            tuple_slice = [slice(None)] * payload.ndim
+            tuple_slice[dim - ndims_collapsed] = deferred_slice[dim]
+            # Slice the data with this single tuple slice.
+            payload = payload[tuple_slice]
+    else:
+        # The deferred slice contains no more than one tuple index item, so
+        # it's safe to slice the data directly.
+        payload = data[deferred_slice]
+    
+    return payload
+
+
 def _read_data(pp_file, lbpack, data_len, data_shape, data_type, mdi):
     """Read the data from the given file object given its precise location in the file."""
+    return _data_from_bytes(pp_file.read(data_len), lbpack, data_shape,
+                            data_type, mdi)
+
+
+def _data_from_bytes(data_bytes, lbpack, data_shape, data_type, mdi):
+    """Decode the data payload of a field from the given bytes."""
+    count = len(data_bytes) / data_type.itemsize
     if lbpack.n1 == 0:
-        data = np.fromfile(pp_file, dtype=data_type, count=data_len / data_type.itemsize)
+        data = np.frombuffer(data_bytes, dtype=data_type, count=count)
     elif lbpack.n1 == 1:
-        data = pp_file.read(data_len)
-        data = pp_packing.wgdos_unpack(data, data_shape[0], data_shape[1], mdi)
+        data = pp_packing.wgdos_unpack(data_bytes, data_shape[0], data_shape[1], mdi)
     elif lbpack.n1 == 2:
-        data = np.fromfile(pp_file, dtype=data_type, count=data_len / data_type.itemsize)
+        data = np.frombuffer(data_bytes, dtype=data_type, count=count)
     elif lbpack.n1 == 4:
-        data = np.fromfile(pp_file, dtype=data_type, count=data_len / data_type.itemsize)
-        data = pp_packing.rle_decode(data, data_shape[0], data_shape[1], mdi)
+        data = pp_packing.rle_decode(data_bytes, data_shape[0], data_shape[1], mdi)
     else:
         raise iris.exceptions.NotYetImplementedError('PP fields with LBPACK of %s are not supported.' % lbpack)
 
-    # Ensure the data is in the native byte order
+    # Ensure the data is in the native byte order, and is a writeable copy
+    # rather than a view of the given bytes.
     if not data.dtype.isnative:
-        data.byteswap(True)
-        data.dtype = data.dtype.newbyteorder('=')
+        data = data.byteswap().view(data.dtype.newbyteorder('='))
+    elif not data.flags.writeable:
+        data = data.copy()
         
     # Reform in row-column order
     data.shape = data_shape
@@ -864,8 +1016,7 @@ class PPField(object):
     def _lbpack_setter(self, new_value):
         if not isinstance(new_value, SplittableInt):
             # add the n1/n2/n3/n4/n5 values for lbpack
-            name_mapping = dict(n5=slice(4, None), n4=3, n3=2, n2=1, n1=0)
-            new_value = SplittableInt(new_value, name_mapping)
+            new_value = SplittableInt(new_value, _LBPACK_NAME_MAPPING)
         self._lbpack = new_value
 
     lbpack = property(lambda self: self._lbpack, _lbpack_setter)
@@ -956,10 +1107,22 @@ class PPField(object):
             The fields which are automatically calculated are: 'lbext',
             'lblrec' and 'lbuser[0]'. Some fields are not currently
             populated, these are: 'lbegin', 'lbnrec', 'lbuser[1]'.
+
+        .. note::
+
+            Real data can be packed by setting 'lbpack' to 1 (WGDOS), with
+            an accuracy of 2 ** 'bacc', or to 4 (run length encoding of the
+            missing data).
             
         """
+        self._save(file_handle, self._encoded_data())
 
-        # Before we can actually write to file, we need to calculate the header elements.
+    def _encoded_data(self):
+        """
+        Return the data type and the (packed) data payload of this field, as
+        they will be written to a PP file.
+
+        """
         # First things first, make sure the data is big-endian
         data = self.data
         if isinstance(data, ma.core.MaskedArray):
@@ -970,6 +1133,31 @@ class PPField(object):
             data = data.byteswap(False)
             data.dtype = data.dtype.newbyteorder('>')
 
+        lbpack = int(self.lbpack)
+        if lbpack == 0:
+            payload = data
+        elif lbpack in _PACKED_N1 and data.dtype == np.dtype('>f4'):
+            native_data = data.astype(np.dtype('f4'))
+            if lbpack == 1:
+                payload = pp_packing.wgdos_pack(native_data, int(self.bacc),
+                                                self.bmdi)
+            else:
+                payload = pp_packing.rle_encode(native_data, self.bmdi)
+                payload = payload.astype(np.dtype('>f4'))
+        else:
+            raise NotImplementedError('Writing packed pp data with lbpack of %s '
+                                      'is not supported.' % lbpack)
+        return data.dtype, payload
+
+    def _save(self, file_handle, encoded_data):
+        """
+        Save the PPField to the given file object, given the result of
+        :meth:`_encoded_data`.
+
+        """
+        # Before we can actually write to file, we need to calculate the header elements.
+        data_type, payload = encoded_data
+
         # Create the arrays which will hold the header information
         lb = np.empty(shape=NUM_LONG_HEADERS, dtype=np.dtype(">u%d" % PP_WORD_DEPTH))
         b = np.empty(shape=NUM_FLOAT_HEADERS, dtype=np.dtype(">f%d" % PP_WORD_DEPTH))
@@ -1037,19 +1225,22 @@ class PPField(object):
         lb[HEADER_DICT['lbext'][0]] = len_of_data_payload / PP_WORD_DEPTH
 
         # Put the data length of pp.data into len_of_data_payload (in BYTES)
-        len_of_data_payload += data.size * PP_WORD_DEPTH
+        if isinstance(payload, np.ndarray):
+            len_of_data_payload += payload.nbytes
+        else:
+            len_of_data_payload += len(payload)
 
         # populate lbrec in WORDS
         lb[HEADER_DICT['lblrec'][0]] = len_of_data_payload / PP_WORD_DEPTH
 
         # populate lbuser[0] to have the data's datatype
-        if data.dtype == np.dtype('>f4'):
+        if data_type == np.dtype('>f4'):
             lb[HEADER_DICT['lbuser'][0]] = 1
-        elif data.dtype == np.dtype('>i4'):
+        elif data_type == np.dtype('>i4'):
             # NB: there is no physical difference between lbuser[0] of 2 or 3 so we encode just 2
             lb[HEADER_DICT['lbuser'][0]] = 2
         else:
-            raise IOError('Unable to write data array to a PP file. The datatype was %s.' % data.dtype)
+            raise IOError('Unable to write data array to a PP file. The datatype was %s.' % data_type)
 
         # NB: lbegin, lbnrec, lbuser[1] not set up
 
@@ -1075,11 +1266,10 @@ class PPField(object):
         pp_file.write(struct.pack(">L", int(len_of_data_payload)))
 
         # the data itself
-        if lb[HEADER_DICT['lbpack'][0]] == 0:
-            data.tofile(pp_file)
+        if isinstance(payload, np.ndarray):
+            payload.tofile(pp_file)
         else:
-            raise NotImplementedError('Writing packed pp data with lbpack of %s '
-                                      'is not supported.' % lb[HEADER_DICT['lbpack'][0]])
+            pp_file.write(payload)
 
         # extra data elements
         for int_code, extra_data in extra_items:
@@ -1328,7 +1518,562 @@ def make_pp_field(header_values):
     return pp_field
 
 
-def load(filename, read_data=False):
+# The version of the cached field index format.
+_INDEX_CACHE_VERSION = 1
+
+
+def _index_cache_path(filename, kind):
+    """Returns the path of the cached field index for the given file."""
+    key = '%s:%s' % (kind, os.path.abspath(filename))
+    name = '%s.%s.npz' % (hashlib.sha1(key).hexdigest(), kind)
+    return os.path.join(iris.config.FIELD_INDEX_DIR, name)
+
+
+def _cached_index(filename, kind, index_function):
+    """
+    Returns the field index of the given file, as created by the given index
+    function, re-using any cached copy of the index.
+
+    The index is cached in the :data:`iris.config.FIELD_INDEX_DIR`
+    directory, and is keyed on the path, size and modification time of
+    the file. If that directory is not configured then no caching occurs.
+
+    Args:
+
+    * filename (string):
+        The name of the file to index.
+    * kind (string):
+        A name identifying the type of index, e.g. 'pp'.
+    * index_function:
+        A function which, given the filename, returns the index as a
+        structured :class:`numpy.ndarray`.
+
+    """
+    if iris.config.FIELD_INDEX_DIR is None:
+        return index_function(filename)
+
+    stat = os.stat(filename)
+    key = (os.path.abspath(filename), stat.st_size, stat.st_mtime)
+    cache_path = _index_cache_path(filename, kind)
+
+    # Use the cached index, but only if it describes this exact file.
+    if os.path.isfile(cache_path):
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                cache = np.load(cache_file)
+                cache_key = (str(cache['path']), int(cache['size']),
+                             float(cache['mtime']))
+                if (int(cache['version']) == _INDEX_CACHE_VERSION and
+                        cache_key == key):
+                    return cache['index']
+        except (IOError, ValueError, KeyError):
+            # An unreadable cache is simply re-built.
+            pass
+
+    index = index_function(filename)
+
+    # Write to a temporary file first, so concurrent readers never see
+    # a partially written index.
+    temp_path = '%s.%d.tmp' % (cache_path, os.getpid())
+    try:
+        with open(temp_path, 'wb') as cache_file:
+            np.savez(cache_file, index=index, path=key[0], size=key[1],
+                     mtime=key[2], version=_INDEX_CACHE_VERSION)
+        os.rename(temp_path, cache_path)
+    except (IOError, OSError) as err:
+        warnings.warn('Unable to cache the field index of %r: %s' %
+                      (filename, err))
+    return index
+
+
+# The structured data type of a row of a PPFieldIndex.
+_PP_INDEX_DTYPE = np.dtype([('lb', np.int32, (NUM_LONG_HEADERS, )),
+                            ('b', np.float32, (NUM_FLOAT_HEADERS, )),
+                            ('data_offset', np.int64),
+                            ('data_len', np.int64)])
+
+
+def _index_header_positions():
+    # Map each header name, from any header release, to its zero-based
+    # positions within the combined (long + float) header.
+    positions = {}
+    for release_number in sorted(UM_HEADERS):
+        positions.update(_header_defn(release_number))
+    return positions
+
+
+_INDEX_HEADER_POSITIONS = _index_header_positions()
+
+
+def _strided_bytes(file_bytes, offset, count, stride, nbytes):
+    """
+    Returns a read-only (count, nbytes) view of the bytes of the given array,
+    where each row starts stride bytes after the previous one.
+
+    """
+    return np.lib.stride_tricks.as_strided(file_bytes[offset:],
+                                           shape=(count, nbytes),
+                                           strides=(stride, 1))
+
+
+def _index_pp_file(filename):
+    """
+    Returns a structured array, with one row per field, describing the
+    headers and data locations of all the fields within a PP file.
+
+    The file is memory-mapped and the header records are located by runs of
+    records with the same length, before being decoded together.
+
+    """
+    if os.path.getsize(filename) == 0:
+        return np.empty(0, dtype=_PP_INDEX_DTYPE)
+
+    file_bytes = np.memmap(filename, dtype=np.uint8, mode='r')
+    try:
+        file_size = file_bytes.size
+        header_bytes = PP_HEADER_DEPTH
+        # Locate the header records as runs of equal length records. Each
+        # run is found by checking the data length word which follows each
+        # header, for up to twice as many records as the previous run.
+        runs = []
+        offset = 0
+        run_length = 1
+        while offset < file_size:
+            len_offset = offset + header_bytes + 2 * PP_WORD_DEPTH
+            if len_offset + PP_WORD_DEPTH > file_size:
+                raise ValueError('Truncated PP field header at byte offset '
+                                 '%s of %r.' % (offset, filename))
+            data_len = int(_strided_bytes(file_bytes, len_offset, 1, 1,
+                                          PP_WORD_DEPTH).view('>u4')[0, 0])
+            record_bytes = header_bytes + data_len + 4 * PP_WORD_DEPTH
+            available = (file_size - len_offset - PP_WORD_DEPTH) // \
+                record_bytes + 1
+            count = min(run_length, available)
+            data_lens = np.ascontiguousarray(
+                _strided_bytes(file_bytes, len_offset, count, record_bytes,
+                               PP_WORD_DEPTH)).view('>u4')[:, 0]
+            mismatch = np.flatnonzero(data_lens != data_len)
+            if mismatch.size:
+                count = mismatch[0]
+                run_length = 1
+            else:
+                run_length = 2 * count
+            runs.append((offset + PP_WORD_DEPTH, record_bytes, count,
+                         data_len))
+            offset += count * record_bytes
+
+        # Copy the bytes of every header into one array, then re-interpret
+        # them as the long and float header words.
+        header_offsets = np.concatenate([
+            np.arange(count, dtype=np.int64) * record_bytes + header_offset
+            for header_offset, record_bytes, count, data_len in runs])
+        data_lens = np.concatenate([
+            np.repeat(np.int64(data_len), count)
+            for header_offset, record_bytes, count, data_len in runs])
+        headers = np.empty((len(header_offsets), header_bytes),
+                           dtype=np.uint8)
+        start = 0
+        for header_offset, record_bytes, count, data_len in runs:
+            headers[start:start + count] = _strided_bytes(
+                file_bytes, header_offset, count, record_bytes, header_bytes)
+            start += count
+    finally:
+        del file_bytes
+
+    index = np.empty(len(header_offsets), dtype=_PP_INDEX_DTYPE)
+    index['lb'] = headers.view('>i%d' % PP_WORD_DEPTH)[:, :NUM_LONG_HEADERS]
+    index['b'] = headers.view('>f%d' % PP_WORD_DEPTH)[:, NUM_LONG_HEADERS:]
+
+    # The data length word records the length of the data plus the
+    # extra data, which must agree with LBLREC.
+    lblrec = index['lb'][:, _INDEX_HEADER_POSITIONS['lblrec'][0]]
+    bad = np.flatnonzero(data_lens != lblrec * PP_WORD_DEPTH)
+    if bad.size:
+        i = bad[0]
+        raise ValueError('LBLREC has a different value to the integer recorded after the '
+                         'header in the file (%s and %s).' % (lblrec[i] * PP_WORD_DEPTH,
+                                                              data_lens[i]))
+
+    lbext = index['lb'][:, _INDEX_HEADER_POSITIONS['lbext'][0]]
+    index['data_offset'] = header_offsets + header_bytes + 2 * PP_WORD_DEPTH
+    index['data_len'] = data_lens - lbext * PP_WORD_DEPTH
+    return index
+
+
+def _header_values(headers, name):
+    """
+    Returns the values of the named header element from a structured array
+    of field headers, such as a :attr:`PPFieldIndex.headers`.
+
+    """
+    try:
+        positions = _INDEX_HEADER_POSITIONS[name]
+    except KeyError:
+        raise ValueError('Unknown PP header element: %r' % name)
+    if positions[0] < NUM_LONG_HEADERS:
+        values = headers['lb']
+        index = slice(positions[0], positions[-1] + 1)
+    else:
+        values = headers['b']
+        index = slice(positions[0] - NUM_LONG_HEADERS,
+                      positions[-1] - NUM_LONG_HEADERS + 1)
+    if len(positions) == 1:
+        index = index.start
+    return values[:, index]
+
+
+class _IndexedPPField(object):
+    """
+    A mixin for the PPField classes, which reads each header element from
+    a row of a :class:`PPFieldIndex` when it is first used, rather than
+    setting every header element when the field is created.
+
+    """
+    def __getattr__(self, name):
+        # Only called for header elements which have not yet been set.
+        row = self.__dict__.get('_index_row')
+        header = name
+        if name.startswith('_') and name[1:] in _SPECIAL_HEADERS:
+            header = name[1:]
+        positions = self._INDEX_POSITIONS.get(header)
+        if row is None or positions is None:
+            raise AttributeError(name)
+        values = [row['lb'][position] if position < NUM_LONG_HEADERS else
+                  row['b'][position - NUM_LONG_HEADERS]
+                  for position in positions]
+        if len(values) == 1:
+            values = values[0]
+        else:
+            values = tuple(values)
+        setattr(self, header, values)
+        return getattr(self, name)
+
+
+class _IndexedPPField2(_IndexedPPField, PPField2):
+    _INDEX_POSITIONS = dict(PPField2.HEADER_DEFN)
+
+
+class _IndexedPPField3(_IndexedPPField, PPField3):
+    _INDEX_POSITIONS = dict(PPField3.HEADER_DEFN)
+
+
+_INDEXED_PP_CLASSES = {
+    2: _IndexedPPField2,
+    3: _IndexedPPField3
+}
+
+
+class PPFieldIndex(object):
+    """
+    An index of all the fields within a PP file.
+
+    The index is built from a single pass over a memory-map of the file, and
+    holds every field header as one row of a structured NumPy array. This
+    makes it cheap to scan and filter the fields of a file, as the
+    corresponding :class:`PPField` instances are only created on demand.
+    If :data:`iris.config.FIELD_INDEX_DIR` is set, the index is cached there
+    and re-used for as long as the file is unchanged::
+
+        index = iris.fileformats.pp.PPFieldIndex(filename)
+        mask = index.stash_mask('m01s16i203')
+        for field in index.fields(mask):
+            print field
+
+    """
+    def __init__(self, filename):
+        """
+        Create an index of the fields within the given PP file.
+
+        Args:
+
+        * filename (string):
+            The name of the PP file to index.
+
+        """
+        self.filename = filename
+        """The name of the indexed PP file."""
+
+        self.headers = _cached_index(filename, 'pp', _index_pp_file)
+        """The structured array of field headers and data locations."""
+
+    def __len__(self):
+        return len(self.headers)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.filename)
+
+    def __iter__(self):
+        return self.fields()
+
+    def header(self, name):
+        """
+        Return the values of the named header element for all the fields.
+
+        Args:
+
+        * name (string):
+            The name of a PP header element, e.g. 'lbft' or 'lbuser'.
+
+        Returns:
+            A :class:`numpy.ndarray` with one row per field.
+
+        """
+        return _header_values(self.headers, name)
+
+    def stash_mask(self, stash):
+        """
+        Return a boolean array identifying the fields with the given STASH code.
+
+        Args:
+
+        * stash (:class:`STASH` or string):
+            The STASH code, e.g. 'm01s16i203'.
+
+        """
+        if isinstance(stash, basestring):
+            stash = STASH.from_msi(stash)
+        lbuser = self.header('lbuser')
+        return ((lbuser[:, 6] == stash.model) &
+                (lbuser[:, 3] == stash.section * 1000 + stash.item))
+
+    def field(self, i, pp_file=None, read_data=False):
+        """
+        Return a :class:`PPField` for the given row of the index.
+
+        The header elements of the field are read from the row of the index
+        as they are used.
+
+        Args:
+
+        * i (int):
+            The index of the field within the file.
+
+        Kwargs:
+
+        * pp_file:
+            An open file object for the PP file, used to read any extra data
+            or the data payload. If None, the file is opened when required.
+        * read_data (boolean):
+            Whether to read the data payload. Default False.
+
+        """
+        row = self.headers[i]
+        lbrel = row['lb'][_INDEX_HEADER_POSITIONS['lbrel'][0]]
+        if lbrel not in _INDEXED_PP_CLASSES:
+            raise ValueError('Unsupported header release number: {}'.format(lbrel))
+        pp_field = _INDEXED_PP_CLASSES[lbrel]()
+        pp_field._index_row = row
+
+        data_offset = int(row['data_offset'])
+        data_len = int(row['data_len'])
+        data_type = LBUSER_DTYPE_LOOKUP.get(pp_field.lbuser[0], LBUSER_DTYPE_LOOKUP['default'])
+        data_shape = (pp_field.lbrow, pp_field.lbnpt)
+        extra_len = pp_field.lbext * PP_WORD_DEPTH
+
+        if read_data or extra_len:
+            if pp_file is None:
+                with open(self.filename, 'rb') as pp_file:
+                    return self.field(i, pp_file, read_data)
+            pp_file.seek(data_offset, os.SEEK_SET)
+
+        if read_data:
+            pp_field._data = pp_field.read_data(pp_file, data_len, data_shape, data_type)
+            pp_field._data_manager = None
+        else:
+            # NB. This makes a 0-dimensional array
+            pp_field._data = np.array(PPDataProxy(self.filename, data_offset, data_len, pp_field.lbpack))
+            pp_field._data_manager = iris.fileformats.manager.DataManager(data_shape, data_type, pp_field.bmdi)
+
+        if extra_len:
+            pp_file.seek(data_offset + data_len, os.SEEK_SET)
+            pp_field._read_extra_data(pp_file, pp_file.read, extra_len)
+
+        return pp_field
+
+    def fields(self, mask=None, read_data=False):
+        """
+        Return an iterator of the PPFields in the index.
+
+        Kwargs:
+
+        * mask:
+            A boolean array, or an array of integer indices, selecting which
+            fields to return. Default is all the fields.
+        * read_data (boolean):
+            Whether to read the data payloads. Default False.
+
+        """
+        indices = np.arange(len(self.headers))
+        if mask is not None:
+            indices = indices[mask]
+        with open(self.filename, 'rb') as pp_file:
+            for i in indices:
+                yield self.field(i, pp_file, read_data)
+
+
+class _HeaderArrays(object):
+    """
+    Provides PPField-like access to the header elements of many fields at
+    once, where each element is an array with the field as its last
+    dimension, e.g. ``f.lbuser[3] == 33`` gives a boolean array.
+
+    """
+    def __init__(self, headers):
+        self._headers = headers
+
+    def __len__(self):
+        return len(self._headers)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            values = _header_values(self._headers, name)
+        except ValueError:
+            raise AttributeError(name)
+        return values.T
+
+
+def _unique_map(func, *columns):
+    """
+    Applies the given function to each distinct combination of values in
+    the given columns, and returns the results as an array.
+
+    """
+    keys = zip(*columns)
+    results = {}
+    for key in set(keys):
+        results[key] = func(*key)
+    return np.array([results[key] for key in keys], dtype=bool)
+
+
+def _stash_from_header(model, lbuser3):
+    return STASH(model, lbuser3 / 1000, lbuser3 % 1000)
+
+
+def _name_mask(name, f):
+    # The standard load rules name a field with a valid STASH code listed
+    # in STASH_TO_CF from that table, regardless of the other rules. All
+    # other fields may end up with any name.
+    def matches(model, lbuser3):
+        stash = str(_stash_from_header(model, lbuser3))
+        cf = iris.fileformats.um_cf_map.STASH_TO_CF.get(stash)
+        return cf is None or cf.cfname == name
+    return _unique_map(matches, f.lbuser[6], f.lbuser[3])
+
+
+def _attribute_mask(attributes, f):
+    # Only the STASH attribute is derived directly from the header.
+    if 'STASH' not in attributes:
+        return np.ones(len(f), dtype=bool)
+    value = attributes['STASH']
+
+    def matches(model, lbuser3):
+        if model == 0 and lbuser3 == 0:
+            # The standard load rules add no STASH attribute.
+            return False
+        stash = _stash_from_header(model, lbuser3)
+        if callable(value):
+            return bool(value(stash))
+        return stash == value
+    return _unique_map(matches, f.lbuser[6], f.lbuser[3])
+
+
+def _five_digit(lbcode):
+    # Equivalent to "len(f.lbcode) == 5".
+    return (lbcode >= 10000) & (lbcode < 100000)
+
+
+# The coordinates which the standard load rules create purely from header
+# elements, as functions returning the points and whether each field
+# has the coordinate.
+_HEADER_COORDS = {
+    'model_level_number': lambda f: (f.lblev, (f.lbvc == 65) |
+                                     ((f.lbvc == 2) & ~_five_digit(f.lbcode))),
+    'pseudo_level': lambda f: (f.lbuser[4], f.lbuser[4] != 0),
+    'realization': lambda f: (f.lbrsvd[3], f.lbrsvd[3] != 0),
+}
+
+
+def _coord_mask(coord_constraint, f):
+    if coord_constraint.coord_name not in _HEADER_COORDS:
+        return np.ones(len(f), dtype=bool)
+    points, present = _HEADER_COORDS[coord_constraint.coord_name](f)
+    mask = coord_constraint._match(iris.coords.CellArray(points))
+    if mask is None:
+        call_func = coord_constraint._call_func
+        matches = lambda point: bool(call_func(iris.coords.Cell(point)))
+        mask = _unique_map(matches, points)
+    return present & mask
+
+
+def _constraint_mask(constraint, f):
+    """
+    Returns a boolean array identifying the fields which may produce a cube
+    matching the given constraint. Any part of the constraint which cannot
+    be decided from the headers alone is treated as matching.
+
+    """
+    if isinstance(constraint, iris._constraints.ConstraintCombination):
+        return constraint.operator(_constraint_mask(constraint.lhs, f),
+                                   _constraint_mask(constraint.rhs, f))
+    mask = np.ones(len(f), dtype=bool)
+    if constraint._name:
+        mask &= _name_mask(constraint._name, f)
+    if isinstance(constraint, iris._constraints.AttributeConstraint):
+        mask &= _attribute_mask(constraint._attributes, f)
+    for coord_constraint in constraint._coord_constraints:
+        mask &= _coord_mask(coord_constraint, f)
+    return mask
+
+
+def _rule_mask(rule, f):
+    """
+    Returns a boolean array identifying the fields which may match the given
+    rule. Conditions which cannot be evaluated for all the fields at once
+    are treated as matching.
+
+    """
+    mask = np.ones(len(f), dtype=bool)
+    for condition in rule._conditions:
+        try:
+            result = eval(condition, {}, {'field': f, 'f': f, 'pp': f})
+        except Exception:
+            continue
+        if (isinstance(result, np.ndarray) and result.dtype == bool and
+                result.shape == mask.shape):
+            mask &= result
+    return mask
+
+
+def _header_filter(constraints):
+    """
+    Returns a function which, given a structured array of field headers,
+    returns a boolean array of the fields to load in order to satisfy the
+    given constraints. Returns None if the constraints cannot be applied
+    to the field headers.
+
+    """
+    constraints = iris._constraints.list_of_constraints(constraints)
+    if _user_load_rules:
+        # Additional rules may derive cube metadata from anything.
+        return None
+
+    def header_filter(headers):
+        f = _HeaderArrays(headers)
+        mask = np.zeros(len(f), dtype=bool)
+        for constraint in constraints:
+            mask |= _constraint_mask(constraint, f)
+        # Always keep the fields which are referenced by other fields,
+        # e.g. orography.
+        for rule in _cross_reference_rules._rules:
+            mask |= _rule_mask(rule, f)
+        return mask
+
+    return header_filter
+
+
+def load(filename, read_data=False, header_filter=None):
     """
     Return an iterator of PPFields given a filename.
     
@@ -1341,6 +2086,11 @@ def load(filename, read_data=False):
     * read_data - boolean 
         Flag whether or not the data should be read, if False an empty data manager
         will be provided which can subsequently load the data on demand. Default False.
+
+    * header_filter - function or None
+        A function which, given the structured array of field headers of a
+        :class:`PPFieldIndex`, returns a boolean array selecting the fields to
+        load. Default None, which loads all the fields.
         
     To iterate through all of the fields in a pp file::
     
@@ -1349,70 +2099,13 @@ def load(filename, read_data=False):
     
     """
     
-    pp_file = open(filename, 'rb')
-        
-    # Get a reference to the seek method on the file
-    # (this is accessed 3* #number of headers so can provide a small performance boost)
-    pp_file_seek = pp_file.seek
-    pp_file_read = pp_file.read
-        
-    # Keep reading until we reach the end of file
-    while True:
-        # Move past the leading header length word
-        pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-        # Get the LONG header entries
-        header_longs = np.fromfile(pp_file, dtype='>i%d' % PP_WORD_DEPTH, count=NUM_LONG_HEADERS)
-        # Nothing returned => EOF
-        if len(header_longs) == 0:
-            break
-        # Get the FLOAT header entries
-        header_floats = np.fromfile(pp_file, dtype='>f%d' % PP_WORD_DEPTH, count=NUM_FLOAT_HEADERS)
-        header = tuple(header_longs) + tuple(header_floats)
-
-        # Make a PPField of the appropriate sub-class (depends on header release number)
-        pp_field = make_pp_field(header)
-        
-        # Skip the trailing 4-byte word containing the header length
-        pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-        
-        # Read the word telling me how long the data + extra data is
-        # This value is # of bytes
-        len_of_data_plus_extra = struct.unpack_from('>L', pp_file_read(PP_WORD_DEPTH))[0]
-        if len_of_data_plus_extra != pp_field.lblrec * PP_WORD_DEPTH:
-            raise ValueError('LBLREC has a different value to the integer recorded after the '
-                             'header in the file (%s and %s).' % (pp_field.lblrec * PP_WORD_DEPTH, 
-                                                                  len_of_data_plus_extra))
-        
-        # calculate the extra length in bytes
-        extra_len = pp_field.lbext * PP_WORD_DEPTH
-        
-        # Derive size and datatype of payload
-        data_len = len_of_data_plus_extra - extra_len
-        data_type = LBUSER_DTYPE_LOOKUP.get(pp_field.lbuser[0], LBUSER_DTYPE_LOOKUP['default'])
-        
-        data_shape = (pp_field.lbrow, pp_field.lbnpt)
-
-        if read_data:
-            pp_field._data = pp_field.read_data(pp_file, data_len, data_shape, data_type)
-            pp_field._data_manager = None
-        else:
-            # NB. This makes a 0-dimensional array
-            pp_field._data = np.array(PPDataProxy(filename, pp_file.tell(), data_len, pp_field.lbpack))
-            pp_field._data_manager = iris.fileformats.manager.DataManager(data_shape, data_type, pp_field.bmdi)
-
-            # Skip the data
-            pp_file_seek(data_len, os.SEEK_CUR)
-
-        # Do we have any extra data to deal with?
-        if extra_len:
-            pp_field._read_extra_data(pp_file, pp_file_read, extra_len)
-
-        # Skip that last 4 byte record telling me the length of the field I have already read
-        pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-
+    # Index the file in a single pass, then create each field on demand.
+    index = PPFieldIndex(filename)
+    mask = None
+    if header_filter is not None:
+        mask = header_filter(index.headers)
+    for pp_field in index.fields(mask, read_data=read_data):
         yield pp_field
-        
-    pp_file.close()
 
 
 def _ensure_load_rules_loaded():
@@ -1441,17 +2134,22 @@ def add_load_rules(filename):
     the order they were registered.
     
     """
+    # Uses this module-level variable
+    global _user_load_rules
+
     _ensure_load_rules_loaded()
     _load_rules.import_rules(filename)
+    _user_load_rules = True
 
 
 def reset_load_rules():
     """Resets the PP load process to use only the standard conversion rules."""
     
-    # Uses this module-level variable
-    global _load_rules
+    # Uses these module-level variables
+    global _load_rules, _user_load_rules
     
     _load_rules = None
+    _user_load_rules = False
 
 
 def _ensure_save_rules_loaded():
@@ -1487,7 +2185,7 @@ def reset_save_rules():
     _save_rules = None
 
 
-def load_cubes(filenames, callback=None):
+def load_cubes(filenames, callback=None, constraints=None, parallel=None):
     """
     Loads cubes from a list of pp filenames.
     
@@ -1498,6 +2196,12 @@ def load_cubes(filenames, callback=None):
     Kwargs:
     
     * callback - a function which can be passed on to :func:`iris.io.run_callback`
+
+    * constraints - one or more constraints, used to skip those fields which
+      cannot produce a matching cube. The resultant cubes must still be
+      filtered by the constraints.
+
+    * parallel - the number of worker processes used to load the files.
     
     .. note::
 
@@ -1505,18 +2209,29 @@ def load_cubes(filenames, callback=None):
         is not preserved when there is a field with orography references)
          
     """
-    return _load_cubes_variable_loader(filenames, callback, load)
+    return _load_cubes_variable_loader(filenames, callback, load, constraints,
+                                       parallel)
 
 
-def _load_cubes_variable_loader(filenames, callback, loading_function):
+def _load_cubes_variable_loader(filenames, callback, loading_function,
+                                constraints=None, parallel=None):
     _ensure_load_rules_loaded()
     rules = iris.fileformats.rules
-    pp_loader = rules.Loader(loading_function, _load_rules,
+    field_generator = loading_function
+    # A callback may change anything about a cube, so the constraints can
+    # only be applied to the field headers in its absence.
+    if constraints is not None and callback is None:
+        header_filter = _header_filter(constraints)
+        if header_filter is not None:
+            field_generator = lambda filename: loading_function(
+                filename, header_filter=header_filter)
+    pp_loader = rules.Loader(field_generator, _load_rules,
                              _cross_reference_rules, 'PP_LOAD')
-    return rules.load_cubes(filenames, callback, pp_loader)
+    return rules.load_cubes(filenames, callback, pp_loader, parallel)
 
 
-def save(cube, target, append=False, field_coords=None):
+def save(cube, target, append=False, field_coords=None, lbpack=None,
+         bacc=None, prefetch=False):
     """
     Use the PP saving rules (and any user rules) to save a cube to a PP file.
     
@@ -1536,6 +2251,20 @@ def save(cube, target, append=False, field_coords=None):
                          determine the x and y coordinates of the resulting fields. 
                          If None, the final two  dimensions are chosen for slicing.
 
+        * lbpack       - The packing method of the fields, overriding the save rules:
+                         0 for unpacked, 1 for WGDOS packing, or 4 for run length
+                         encoding. Packing requires real data, and is done for many
+                         fields at once by a pool of threads.
+
+        * bacc         - The WGDOS packing accuracy of the fields, as a power of two,
+                         overriding the save rules, e.g. -6 packs to the nearest 1/64.
+
+        * prefetch     - Whether to load the data of the next field in a background thread
+                         while the current field is being saved. Default is False.
+
+    Each field only loads its own data from the source of the cube's data, so
+    the whole cube is never held in memory.
+
     See also :func:`iris.io.save`.
     
     """
@@ -1604,40 +2333,85 @@ def save(cube, target, append=False, field_coords=None):
         # NB watch out for the ordering of the dimensions
         field_coords = (cube.coords(dimensions=n_dims-2)[0], cube.coords(dimensions=n_dims-1)[0])
 
-    # Save each named or latlon slice2D in the cube
-    for slice2D in cube.slices(field_coords):
-        # Start with a blank PPField
-        pp_field = PPField3()
-
-        # Set all items to 0 because we need lbuser, lbtim
-        # and some others to be present before running the rules.
-        for name, positions in pp_field.HEADER_DEFN:
-            # Establish whether field name is integer or real
-            default = 0 if positions[0] <= NUM_LONG_HEADERS - UM_TO_PP_HEADER_OFFSET else 0.0
-            # Establish whether field position is scalar or composite
-            if len(positions) > 1:
-                default = [default] * len(positions)
-            setattr(pp_field, name, default)
-
-        # Some defaults should not be 0
-        pp_field.lbrel = 3      # Header release 3.
-        pp_field.lbcode = 1     # Grid code.
-        pp_field.bmks = 1.0     # Some scaley thing.
-        pp_field.lbproc = 0
-
-        # Set the data
-        pp_field.data = slice2D.data
-
-        # Run the PP save rules on the slice2D, to fill the PPField,
-        # recording the rules that were used
-        rules_result = _save_rules.verify(slice2D, pp_field)
-        verify_rules_ran = rules_result.matching_rules
+    def fields():
+        # Generate the PPField of each named or latlon slice2D in the cube
+        for slice2D in iris.io._realised_slices(cube.slices(field_coords),
+                                                prefetch):
+            # Start with a blank PPField
+            pp_field = PPField3()
+
+            # Set all items to 0 because we need lbuser, lbtim
+            # and some others to be present before running the rules.
+            for name, positions in pp_field.HEADER_DEFN:
+                # Establish whether field name is integer or real
+                default = 0 if positions[0] <= NUM_LONG_HEADERS - UM_TO_PP_HEADER_OFFSET else 0.0
+                # Establish whether field position is scalar or composite
+                if len(positions) > 1:
+                    default = [default] * len(positions)
+                setattr(pp_field, name, default)
+
+            # Some defaults should not be 0
+            pp_field.lbrel = 3      # Header release 3.
+            pp_field.lbcode = 1     # Grid code.
+            pp_field.bmks = 1.0     # Some scaley thing.
+            pp_field.lbproc = 0
+
+            # Set the data
+            pp_field.data = slice2D.data
+
+            # Run the PP save rules on the slice2D, to fill the PPField,
+            # recording the rules that were used
+            rules_result = _save_rules.verify(slice2D, pp_field)
+            verify_rules_ran = rules_result.matching_rules
         
-        # Log the rules used
-        iris.fileformats.rules.log('PP_SAVE', target if isinstance(target, basestring) else target.name, verify_rules_ran)
-
-        # Write to file
-        pp_field.save(pp_file)
+            # Log the rules used
+            iris.fileformats.rules.log('PP_SAVE', target if isinstance(target, basestring) else target.name, verify_rules_ran)
+
+            # Apply any explicit packing
+            if lbpack is not None:
+                pp_field.lbpack = lbpack
+            if bacc is not None:
+                pp_field.bacc = bacc
+
+            yield pp_field
+
+    # Write each unpacked field as soon as it is made, so that only one field
+    # is held in memory (or two, with prefetch). Packed fields are held back
+    # in small batches, so that they can be packed by a pool of threads.
+    threads = min(_PACK_THREADS or multiprocessing.cpu_count(),
+                  _PACK_BATCH_SIZE)
+    pools = []
+
+    def write(batch):
+        # Encode the batch of fields, concurrently if there are several,
+        # and write them to file in order.
+        if len(batch) > 1:
+            if not pools:
+                pools.append(multiprocessing.pool.ThreadPool(threads))
+            encoded = pools[0].map(PPField._encoded_data, batch)
+        else:
+            encoded = [pp_field._encoded_data() for pp_field in batch]
+        for pp_field, encoded_data in itertools.izip(batch, encoded):
+            pp_field._save(pp_file, encoded_data)
+
+    try:
+        batch = []
+        for pp_field in fields():
+            if int(pp_field.lbpack) in _PACKED_N1:
+                batch.append(pp_field)
+                if len(batch) < _PACK_BATCH_SIZE:
+                    continue
+            else:
+                # Write any held back fields first, to keep them in order.
+                write(batch)
+                batch = [pp_field]
+            write(batch)
+            batch = []
+        write(batch)
+    finally:
+        for pool in pools:
+            pool.terminate()
+            pool.join()
 
     if isinstance(target, basestring):
         pp_file.close()
@@ -20,8 +20,10 @@ Processing of simple IF-THEN rules.
 """
 
 import abc
+import ast
 import collections
 import getpass
+import itertools
 import logging
 import logging.handlers as handlers
 import operator
@@ -346,6 +348,10 @@ class Rule(object):
                                
         return result
 
+    # Whether the conditions of this type of rule only depend on the
+    # field as it was at the start of a rules run.
+    _dispatchable = True
+
     def _matches_field(self, field):
         """Simple wrapper onto evaluates_true in the case where cube is None."""
         return self.evaluates_true(None, field)
@@ -464,6 +470,10 @@ class ObjectReturningRule(FunctionRule):
 
 class ProcedureRule(Rule):
     """A Rule with nothing returned by its actions."""
+    # The actions of a ProcedureRule modify the field (e.g. "pp.lbft = 3"),
+    # so the conditions of later rules cannot be decided in advance.
+    _dispatchable = False
+
     def _create_action_method(self, i, action):
         # PP saving style action. No return value, e.g. "pp.lbft = 3".
         exec compile('def _exec_action_%d(self, field, f, pp, grib, cm): %s' % (i, action), '<string>', 'exec')
@@ -482,6 +492,154 @@ class ProcedureRule(Rule):
             warnings.warn(warning)
 
 
+# The compiled key expressions used by the rule dispatch trees, shared
+# between all the RulesContainer instances.
+_dispatch_getters = {}
+
+# The types of field value which can safely be used as dispatch keys, i.e.
+# those for which equality is consistent with hashing.
+_DISPATCH_VALUE_TYPES = (int, long, float, basestring, np.number)
+
+
+def _dispatch_test(condition):
+    """
+    Return the (key, value) of a condition of the form "<key> == <literal>",
+    or None if the condition does not have that form.
+
+    """
+    try:
+        tree = ast.parse(condition.strip(), mode='eval').body
+    except SyntaxError:
+        return None
+    if not (isinstance(tree, ast.Compare) and len(tree.ops) == 1 and
+            isinstance(tree.ops[0], ast.Eq)):
+        return None
+    try:
+        value = ast.literal_eval(tree.comparators[0])
+    except ValueError:
+        return None
+    if not isinstance(value, (int, long, float, basestring)):
+        return None
+    # The key must only depend on the field, not the cube being built.
+    names = [node.id for node in ast.walk(tree.left)
+             if isinstance(node, ast.Name)]
+    if 'cm' in names:
+        return None
+    # Recover the source of the key expression.
+    key = condition.strip().rpartition('==')[0].strip()
+    try:
+        key_tree = ast.parse(key, mode='eval').body
+    except SyntaxError:
+        return None
+    if ast.dump(key_tree) != ast.dump(tree.left):
+        return None
+    return key, value
+
+
+def _dispatch_getter(key):
+    """Return a function which evaluates the given key expression."""
+    getter = _dispatch_getters.get(key)
+    if getter is None:
+        code = 'lambda field, f, pp, grib, cm: %s' % key
+        getter = eval(compile(code, '<string>', 'eval'))
+        _dispatch_getters[key] = getter
+    return getter
+
+
+class _DispatchNode(object):
+    """
+    A node in the decision tree used to find the rules which might match
+    a field.
+
+    Each node tests the single key expression which leads the most of its
+    rules (e.g. "f.lbuser[3]"), and maps the value of that expression to a
+    child node for the rules whose leading condition is "<key> == value".
+    The rules which do not lead with that key are handled by a further
+    child node, and those with no usable leading condition are always
+    candidates.
+
+    """
+    def __init__(self, entries):
+        # Each entry is a (rule index, remaining conditions) pair.
+        self.key = None
+        self.getter = None
+        self.branches = {}
+        self.indices = []
+        self.other = None
+
+        tests = {}
+        keyed_counts = collections.Counter()
+        for index, conditions in entries:
+            test = None
+            if conditions:
+                test = _dispatch_test(conditions[0])
+            tests[index] = test
+            if test is not None:
+                keyed_counts[test[0]] += 1
+
+        if keyed_counts:
+            key, count = keyed_counts.most_common(1)[0]
+            if count > 1:
+                self.key = key
+                self.getter = _dispatch_getter(key)
+
+        if self.key is None:
+            self.indices = [index for index, conditions in entries]
+        else:
+            branch_entries = collections.defaultdict(list)
+            other_entries = []
+            for index, conditions in entries:
+                test = tests[index]
+                if test is not None and test[0] == self.key:
+                    branch_entries[test[1]].append((index, conditions[1:]))
+                else:
+                    other_entries.append((index, conditions))
+            for value, value_entries in branch_entries.iteritems():
+                self.branches[value] = _DispatchNode(value_entries)
+            if other_entries:
+                self.other = _DispatchNode(other_entries)
+
+    def all_indices(self):
+        """Return the indices of all the rules under this node."""
+        indices = list(self.indices)
+        for node in self.branches.itervalues():
+            indices.extend(node.all_indices())
+        if self.other is not None:
+            indices.extend(self.other.all_indices())
+        return indices
+
+    def candidates(self, field, cube):
+        """
+        Return the indices of the rules under this node which might match
+        the given field.
+
+        """
+        indices = list(self.indices)
+        if self.key is not None:
+            try:
+                value = self.getter(field, field, field, field, cube)
+            except Exception:
+                # Leave the rules themselves to report the problem.
+                indices.extend(self._branch_indices())
+            else:
+                if isinstance(value, _DISPATCH_VALUE_TYPES):
+                    node = self.branches.get(value)
+                    if node is not None:
+                        indices.extend(node.candidates(field, cube))
+                else:
+                    # Not safe to hash, so any of the branches could match.
+                    indices.extend(self._branch_indices())
+            if self.other is not None:
+                indices.extend(self.other.candidates(field, cube))
+        return indices
+
+    def _branch_indices(self):
+        indices = []
+        for node in self.branches.itervalues():
+            indices.extend(node.all_indices())
+        return indices
+
+
 class RulesContainer(object):
     """
     A collection of :class:`Rule` instances, with the ability to read rule
@@ -499,6 +657,10 @@ class RulesContainer(object):
         """
         self._rules = []
         self.rule_type = rule_type
+        # The decision tree over self._rules, and the number of rules it
+        # was built from.
+        self._dispatch_tree = None
+        self._dispatch_size = 0
         if filepath is not None:
             self.import_rules(filepath)
 
@@ -568,6 +730,30 @@ class RulesContainer(object):
         verify_result = self.verify(cube, field)
         return verify_result
     
+    def _candidate_rules(self, cube, field):
+        """
+        Return, in order, the rules whose conditions might be true for the
+        given field.
+
+        Rather than testing every rule, the "<key> == <literal>" conditions
+        which lead the rules are compiled into a decision tree, which is
+        rebuilt whenever rules are added. Only the rules the tree can not
+        rule out are returned.
+
+        """
+        rules = self._rules
+        if len(rules) != self._dispatch_size:
+            self._dispatch_tree = None
+            if all(rule._dispatchable for rule in rules):
+                entries = [(i, list(rule._conditions))
+                           for i, rule in enumerate(rules)]
+                self._dispatch_tree = _DispatchNode(entries)
+            self._dispatch_size = len(rules)
+        if self._dispatch_tree is not None:
+            indices = sorted(self._dispatch_tree.candidates(field, cube))
+            rules = [rules[i] for i in indices]
+        return rules
+
     def matching_rules(self, field):
         """
         Return a list of rules which match the given field.
@@ -575,7 +761,8 @@ class RulesContainer(object):
         Returns: list of Rule instances
         
         """
-        return filter(lambda rule: rule._matches_field(field), self._rules)
+        return filter(lambda rule: rule._matches_field(field),
+                      self._candidate_rules(None, field))
         
     def verify(self, cube, field):
         """
@@ -597,7 +784,7 @@ class RulesContainer(object):
         """
         matching_rules = []
         factories = []
-        for rule in self._rules:
+        for rule in self._candidate_rules(cube, field):
             if rule.evaluates_true(cube, field):
                 matching_rules.append(rule)
                 rule_factories = rule.run_actions(cube, field)
@@ -751,20 +938,33 @@ Loader = collections.namedtuple('Loader',
                                  'log_name'))
 
 
-def load_cubes(filenames, user_callback, loader):
+def load_cubes(filenames, user_callback, loader, parallel=None):
+    """
+    Returns a generator of the cubes translated from the fields of the
+    given files.
+
+    If `parallel` is greater than one, the fields of each file are
+    generated and translated by that many worker processes, which requires
+    the fields and cubes to be picklable. The callback and the cross-
+    referencing are always done by the calling process.
+
+    """
     concrete_reference_targets = {}
     results_needing_reference = []
 
     if isinstance(filenames, basestring):
         filenames = [filenames]
 
-    for filename in filenames:
+    def translate(filename):
         for field in loader.field_generator(filename):
             # Convert the field to a Cube, logging the rules that were used
             rules_result = loader.load_rules.result(field)
-            cube = rules_result.cube
             log(loader.log_name, filename, rules_result.matching_rules)
+            yield field, rules_result.cube, rules_result.factories
 
+    translations = iris.io._map_files(translate, filenames, parallel)
+    for filename, translated in itertools.izip(filenames, translations):
+        for field, cube, factories in translated:
             cube = iris.io.run_callback(user_callback, cube, field, filename)
 
             if cube is None:
@@ -783,15 +983,14 @@ def load_cubes(filenames, user_callback, loader):
                     concrete_reference_targets[name] = target
                 target.add_cube(cube)
 
-            if rules_result.factories:
-                results_needing_reference.append(rules_result)
+            if factories:
+                results_needing_reference.append((cube, factories))
             else:
                 yield cube
 
     regrid_cache = {}
-    for result in results_needing_reference:
-        cube = result.cube
-        for factory in result.factories:
+    for cube, factories in results_needing_reference:
+        for factory in factories:
             try:
                 args = _dereference_args(factory, concrete_reference_targets,
                                          regrid_cache, cube)
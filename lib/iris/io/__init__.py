@@ -19,6 +19,8 @@ Provides an interface to manage URI scheme support in iris.
 
 """
 import glob
+import multiprocessing
+import multiprocessing.pool
 import os.path
 import types
 import re
@@ -143,10 +145,97 @@ def decode_uri(uri, default='file'):
     return scheme, part
 
 
-def load_files(filenames, callback):
+# The function being applied by a worker process of _map_files, which is
+# set by the worker pool's initializer in each worker process.
+_map_function = None
+
+
+def _init_map_worker(function):
+    global _map_function
+    _map_function = function
+
+
+def _call_map_function(filename):
+    return list(_map_function(filename))
+
+
+def _map_files(function, filenames, parallel=None):
+    """
+    Returns a generator of the results of applying the given function
+    to each of the filenames, in order.
+
+    If `parallel` is greater than one, the function is applied by a pool
+    of that many worker processes. The function is handed to the workers
+    as they are forked from the calling process, so it need not be
+    picklable, but each of its results is converted to a list which must
+    be picklable.
+
+    """
+    if parallel is None or parallel <= 1 or len(filenames) < 2:
+        for filename in filenames:
+            yield function(filename)
+    else:
+        pool = multiprocessing.Pool(min(parallel, len(filenames)),
+                                    initializer=_init_map_worker,
+                                    initargs=(function,))
+        try:
+            for result in pool.imap(_call_map_function, filenames):
+                yield result
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+
+def _realise_data(cube):
+    cube.data
+
+
+def _realised_slices(slices, prefetch=False):
+    """
+    Returns a generator of the given cube slices, for saving one at a time.
+
+    Each slice loads only its own data, so a saver need never hold more
+    than one slice of a cube in memory. If `prefetch` is True, the data of
+    the next slice is loaded by a background thread while the current slice
+    is being saved, so at most two slices are held in memory.
+
+    """
+    if not prefetch:
+        for cube in slices:
+            yield cube
+    else:
+        pool = multiprocessing.pool.ThreadPool(1)
+        try:
+            pending = None
+            for cube in slices:
+                result = pool.apply_async(_realise_data, (cube,))
+                if pending is not None:
+                    pending[1].get()
+                    yield pending[0]
+                pending = (cube, result)
+            if pending is not None:
+                pending[1].get()
+                yield pending[0]
+        finally:
+            pool.terminate()
+            pool.join()
+
+
+def load_files(filenames, callback, constraints=None, parallel=None):
     """
     Takes a list of filenames which may also be globs, and optionally a
     callback function, and returns a generator of Cubes from the given files.
+
+    Any constraints are passed on to those format handlers whose format
+    specification lists ``constraints`` in its
+    :attr:`~iris.io.format_picker.FormatSpecification.handler_keywords`,
+    allowing them to skip content which cannot match. The resultant cubes
+    must still be filtered by the constraints.
+
+    Similarly, a number of worker processes may be given as `parallel`,
+    which is passed on to those format handlers whose format specification
+    lists ``parallel``, allowing them to load their files concurrently.
     
     .. note::
 
@@ -174,7 +263,14 @@ def load_files(filenames, callback):
     
     # Call each iris format handler with the approriate filenames
     for handling_format_spec, fnames in handler_map.iteritems():
-        for cube in handling_format_spec.handler(fnames, callback):
+        handler = handling_format_spec.handler
+        kwargs = {}
+        for name, value in [('constraints', constraints),
+                            ('parallel', parallel)]:
+            if value is not None and \
+                    name in handling_format_spec.handler_keywords:
+                kwargs[name] = value
+        for cube in handler(fnames, callback, **kwargs):
             yield cube
 
 
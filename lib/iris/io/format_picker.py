@@ -126,7 +126,8 @@ class FormatSpecification(object):
     a FileElement, such as filename extension or 32-bit magic number, with an associated value for format identification.
 
     """
-    def __init__(self, format_name, file_element, file_element_value, handler=None, priority=0):
+    def __init__(self, format_name, file_element, file_element_value, handler=None, priority=0,
+                 handler_keywords=()):
         """
         Constructs a new FormatSpecification given the format_name and particular FileElements
         
@@ -141,6 +142,8 @@ class FormatSpecification(object):
         * handler - function which will be called when the specification has been identified and is required to handler a format.
                             If None, then the file can still be identified but no handling can be done.
         * priority - Integer giving a priority for considering this specification where higher priority means sooner consideration.
+        * handler_keywords - The names of the optional keywords, such as 'constraints' and 'parallel', which the handler
+                            accepts in addition to the filenames and callback.
                 
         """
         if not isinstance(file_element, FileElement):
@@ -151,6 +154,7 @@ class FormatSpecification(object):
         self._file_element_value = file_element_value
         self._format_name = format_name
         self._handler = handler
+        self._handler_keywords = tuple(handler_keywords)
         self.priority = priority
         
     def __hash__(self):
@@ -176,6 +180,11 @@ class FormatSpecification(object):
         """The handler function of this FileFormat. (Read only)"""
         return self._handler
 
+    @property
+    def handler_keywords(self):
+        """The names of the optional keywords accepted by the handler function. (Read only)"""
+        return self._handler_keywords
+
     def __cmp__(self, other):
         if not isinstance(other, FormatSpecification):
             return NotImplemented
@@ -294,6 +294,23 @@ class TestAggregateBy(tests.IrisTest):
         row = [list(np.sqrt([50., 122., 170., 362.])), [18., 12., 10., 6.]]
         np.testing.assert_almost_equal(aggregateby_cube.data, np.array(row, dtype=np.float32))
 
+    def test_segments_match_groups(self):
+        # The single pass aggregation of masked data with non-contiguous
+        # groups matches the aggregation of each group-by sub-cube.
+        cube = self.cube_multi
+        cube.data = np.ma.masked_less(cube.data, 20)
+        groupby = iris.analysis._Groupby([self.coord_z1_multi, self.coord_z2_multi])
+        data_shape = [len(groupby)] + list(cube.shape[1:])
+        for aggregator, kwargs in [(iris.analysis.MEAN, {}),
+                                   (iris.analysis.SUM, {}),
+                                   (iris.analysis.MAX, {}),
+                                   (iris.analysis.STD_DEV, {}),
+                                   (iris.analysis.COUNT, {'function': lambda values: values > 40})]:
+            result = cube._aggregated_by_segments(groupby, 0, aggregator, **kwargs)
+            expected = cube._aggregated_by_groups(groupby, 0, data_shape, aggregator, **kwargs)
+            self.assertEqual(result.dtype, expected.dtype)
+            np.testing.assert_array_almost_equal(result, expected)
+
     def test_returned_weights(self):
         self.assertRaises(ValueError, self.cube_single.aggregated_by, 'height', iris.analysis.MEAN, returned=True) 
         self.assertRaises(ValueError, self.cube_single.aggregated_by, 'height', iris.analysis.MEAN, weights=[1,2,3,4,5]) 
@@ -26,6 +26,7 @@ import zlib
 import cartopy.crs as ccrs
 import matplotlib
 import matplotlib.pyplot as plt
+import mock
 import numpy as np
 import numpy.ma as ma
 import shapely.geometry
@@ -382,6 +383,120 @@ class TestAggregators(tests.IrisTest):
         self.assertCML(gt6, ('analysis', 'count_foo_bar_2d.cml'), checksum=False)
 
 
+class TestPartialAggregation(tests.IrisTest):
+    def setUp(self):
+        data = np.arange(24, dtype=np.float32).reshape(4, 6) % 7
+        self.data = ma.masked_array(data, mask=(data == 3))
+        self.data[2] = ma.masked
+
+    def _check(self, aggregator, **kwargs):
+        expected = aggregator.aggregate(self.data, axis=-1, **kwargs)
+        state = aggregator.initialise((4,), **kwargs)
+        state = aggregator.accumulate(state, self.data[:, :2], axis=-1, **kwargs)
+        other = aggregator.initialise((4,), **kwargs)
+        other = aggregator.accumulate(other, self.data[:, 2:], axis=-1, **kwargs)
+        result = aggregator.finalise(aggregator.combine(state, other), **kwargs)
+        self.assertArrayEqual(ma.getmaskarray(result), ma.getmaskarray(expected))
+        self.assertArrayAlmostEqual(ma.filled(result, 0), ma.filled(expected, 0))
+
+    def test_sum(self):
+        self._check(iris.analysis.SUM)
+
+    def test_mean(self):
+        self._check(iris.analysis.MEAN)
+
+    def test_count(self):
+        self._check(iris.analysis.COUNT, function=lambda values: values > 2)
+
+    def test_min_max(self):
+        self._check(iris.analysis.MIN)
+        self._check(iris.analysis.MAX)
+
+    def test_variance(self):
+        self._check(iris.analysis.VARIANCE)
+        self._check(iris.analysis.VARIANCE, ddof=0)
+        self._check(iris.analysis.STD_DEV)
+
+    def test_rms(self):
+        self._check(iris.analysis.RMS)
+
+    def test_proportion(self):
+        self._check(iris.analysis.PROPORTION, function=lambda values: values > 2)
+
+    def test_weighted_mean(self):
+        mean = iris.analysis.MEAN
+        weights = np.arange(24, dtype=np.float64).reshape(4, 6) + 1
+        expected, expected_weights = mean.aggregate(self.data, axis=-1, weights=weights, returned=True)
+        state = mean.initialise((4,))
+        for chunk in (slice(0, 2), slice(2, 6)):
+            state = mean.accumulate(state, self.data[:, chunk], axis=-1, weights=weights[:, chunk])
+        result, result_weights = mean.finalise(state, returned=True)
+        self.assertArrayEqual(ma.getmaskarray(result), ma.getmaskarray(expected))
+        self.assertArrayAlmostEqual(ma.filled(result, 0), ma.filled(expected, 0))
+        self.assertArrayAlmostEqual(result_weights, expected_weights)
+
+    def test_median(self):
+        self._check(iris.analysis.MEDIAN)
+
+    def test_percentile(self):
+        # The aggregate of a fully masked row is not masked.
+        self.data[2] = 1
+        self._check(iris.analysis.PERCENTILE, percent=30)
+
+    def test_approximate_median(self):
+        median = iris.analysis.MEDIAN
+        data = np.random.RandomState(0).randn(2, 1000)
+        states = [median.accumulate(median.initialise((2,), sketch_size=50), chunk, axis=-1)
+                  for chunk in np.split(data, 4, axis=-1)]
+        result = median.finalise(reduce(median.combine, states))
+        # The rank of the approximate median is within 2% of the true rank.
+        ranks = (data <= result[:, np.newaxis]).mean(axis=-1)
+        self.assertTrue(np.all(np.abs(ranks - 0.5) < 0.02))
+
+    def test_supports_partial(self):
+        self.assertTrue(iris.analysis.MEAN.supports_exact_partial(weights=np.ones(6)))
+        self.assertTrue(iris.analysis.MEDIAN.supports_partial())
+        self.assertFalse(iris.analysis.MEDIAN.supports_exact_partial())
+        self.assertFalse(iris.analysis.GMEAN.supports_partial())
+        with self.assertRaises(ValueError):
+            iris.analysis.GMEAN.initialise((4,))
+
+
+@iris.tests.skip_data
+class TestChunkedCollapse(tests.IrisTest):
+    def setUp(self):
+        path = tests.get_data_path(('PP', 'globClim1', 'theta.pp'))
+        self.cube = iris.load_cube(path, 'air_potential_temperature')
+
+    def _check(self, coords, aggregator, **kwargs):
+        expected = self.cube.copy().collapsed(coords, aggregator, **kwargs)
+        # Chunks of several whole levels, and of part of a level.
+        nlevels, nlat, nlon = self.cube.shape
+        for max_bytes in (3 * nlat * nlon * 4, 100 * nlon * 4):
+            with mock.patch('iris.cube._MAX_COLLAPSE_CHUNK_BYTES', max_bytes):
+                result = self.cube.collapsed(coords, aggregator, **kwargs)
+            self.assertIsNotNone(self.cube._data_manager)
+            self.assertEqual(result.coords(), expected.coords())
+            self.assertEqual(result.cell_methods, expected.cell_methods)
+            self.assertEqual(type(result.data), type(expected.data))
+            self.assertEqual(result.data.dtype, expected.data.dtype)
+            self.assertArrayEqual(ma.getmaskarray(result.data),
+                                  ma.getmaskarray(expected.data))
+            self.assertArrayAllClose(result.data, expected.data, rtol=1e-5)
+
+    def test_leading(self):
+        self._check('model_level_number', iris.analysis.MEAN)
+        self._check('model_level_number', iris.analysis.MAX)
+
+    def test_trailing(self):
+        self._check('longitude', iris.analysis.SUM)
+        self._check('longitude', iris.analysis.STD_DEV)
+
+    def test_multiple(self):
+        self._check(['model_level_number', 'longitude'], iris.analysis.MIN)
+        self._check(['latitude', 'longitude'], iris.analysis.RMS)
+
+
 @iris.tests.skip_data
 class TestRotatedPole(tests.IrisTest):
     def _check_both_conversions(self, cube):
@@ -738,6 +853,38 @@ class TestRollingWindow(tests.IrisTest):
         # use almost equal to compare floats
         self.assertArrayAlmostEqual(expected_result, res_cube.data)
 
+    def test_aggregate_rolling(self):
+        data = np.arange(40, dtype=np.float32).reshape(4, 10) % 7
+        data = ma.masked_array(data, mask=(data == 3))
+        data[2, 2:5] = ma.masked
+        windows = iris.util.rolling_window(data.data, window=3, axis=1)
+        windows = ma.masked_array(windows, mask=iris.util.rolling_window(data.mask, window=3, axis=1))
+        for aggregator, kwargs in [(iris.analysis.SUM, {}),
+                                   (iris.analysis.MEAN, {}),
+                                   (iris.analysis.MIN, {}),
+                                   (iris.analysis.MAX, {}),
+                                   (iris.analysis.RMS, {}),
+                                   (iris.analysis.COUNT, {'function': lambda values: values > 2})]:
+            self.assertTrue(aggregator.supports_rolling(**kwargs))
+            expected = aggregator.aggregate(windows, axis=2, **kwargs)
+            result = aggregator.aggregate_rolling(data, 3, axis=1, **kwargs)
+            self.assertArrayEqual(ma.getmaskarray(result), ma.getmaskarray(expected))
+            self.assertArrayAlmostEqual(ma.filled(result, 0), ma.filled(expected, 0))
+
+        # A non-finite value only affects the windows which contain it.
+        data = np.arange(20, dtype=np.float64).reshape(2, 10)
+        data[0, 2] = np.nan
+        data[1, 7] = np.inf
+        windows = iris.util.rolling_window(data, window=3, axis=1)
+        for aggregator in [iris.analysis.SUM, iris.analysis.MEAN,
+                           iris.analysis.MIN, iris.analysis.MAX,
+                           iris.analysis.RMS]:
+            expected = aggregator.aggregate(windows, axis=2)
+            result = aggregator.aggregate_rolling(data, 3, axis=1)
+            self.assertArrayAlmostEqual(result, expected)
+        self.assertFalse(iris.analysis.MEAN.supports_rolling(weights=np.ones(3)))
+        self.assertFalse(iris.analysis.VARIANCE.supports_rolling())
+
 
 class TestGeometry(tests.IrisTest):
 
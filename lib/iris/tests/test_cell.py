@@ -21,6 +21,8 @@ from __future__ import division
 # import iris tests first so that some things can be initialised before importing anything else
 import iris.tests as tests
 
+import datetime
+import operator
 import unittest
 
 import numpy as np
@@ -213,5 +215,54 @@ class TestCells(unittest.TestCase):
         self._check_permutations(13, Cell(10, [8, 12]), False, False, False)
 
 
+class TestCellArray(unittest.TestCase):
+    def setUp(self):
+        self.coord = iris.coords.AuxCoord(np.array([0, 1, 1, 2, 3.5]),
+                                          long_name='test', units='1',
+                                          bounds=np.array([[-1, 1], [1, 0],
+                                                           [0, 2], [1, 3],
+                                                           [3, 4]]))
+
+    def check(self, cells, coord, other):
+        # Comparing all the cells at once is the same as comparing each cell.
+        for op in (operator.eq, operator.ne, operator.lt, operator.le,
+                   operator.gt, operator.ge):
+            expected = [op(cell, other) for cell in coord.cells()]
+            self.assertEqual(list(op(cells, other)), expected)
+
+    def test_compare(self):
+        for coord in (self.coord, self.coord.copy(points=self.coord.points)):
+            cells = coord.cell_array()
+            for other in (1, 2.5, Cell(1, [0, 2]), Cell(1), Cell(1, [1, 0])):
+                self.check(cells, coord, other)
+
+    def test_compare_dates(self):
+        coord = iris.coords.AuxCoord(np.arange(4) * 24.0, long_name='time',
+                                     units='hours since 1970-01-01 00:00:00')
+        cells = coord.cell_array()
+        self.assertEqual(list(cells >= datetime.datetime(1970, 1, 2)),
+                         [False, True, True, True])
+        with self.assertRaises(ValueError):
+            self.coord.cell_array() == datetime.datetime(1970, 1, 2)
+
+    def test_isin(self):
+        cells = self.coord.cell_array()
+        self.assertEqual(list(cells.isin([-0.5, 3])),
+                         [True, False, False, True, True])
+        self.assertEqual(list(cells.isin([])), [False] * 5)
+
+    def test_find(self):
+        cells = self.coord.cell_array()
+        self.assertEqual(list(cells.find(cells[::-1])), [4, 3, 2, 1, 0])
+        other = self.coord.copy(points=self.coord.points).cell_array()
+        self.assertEqual(list(other.find(other[[1, 2, 0]])), [1, 1, 0])
+        self.assertEqual(list(cells.find(other)), [-1] * 5)
+
+    def test_getitem(self):
+        cells = self.coord.cell_array()
+        self.assertEqual(cells[1], self.coord.cell(1))
+        self.assertEqual(list(cells[1:3]), [self.coord.cell(1), self.coord.cell(2)])
+
+
 if __name__ == "__main__":
     tests.main()
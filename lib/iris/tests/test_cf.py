@@ -21,12 +21,15 @@ Test the cf module.
 # import iris tests first so that some things can be initialised before importing anything else
 import iris.tests as tests
 
+import os
 import unittest
 
 import mock
+import netCDF4
 
 import iris
 import iris.fileformats.cf as cf
+import iris.util
 
 
 class TestCaching(unittest.TestCase):
@@ -60,6 +63,101 @@ class TestCaching(unittest.TestCase):
         self.assertTrue('standard_name' in cf_var.__dict__)
 
 
+class TestDatasetPool(tests.IrisTest):
+    def setUp(self):
+        self.pool = cf._DatasetPool(maxsize=2)
+        self.filenames = []
+        for i in range(3):
+            filename = iris.util.create_temp_filename(suffix='.nc')
+            self._write(filename, i)
+            self.filenames.append(filename)
+
+    def tearDown(self):
+        for filename in self.filenames:
+            self.pool.discard(filename)
+            os.remove(filename)
+
+    def _write(self, filename, value):
+        dataset = netCDF4.Dataset(filename, mode='w')
+        dataset.value = value
+        dataset.close()
+
+    def test_reuse(self):
+        with self.pool.dataset(self.filenames[0]) as dataset:
+            self.assertEqual(dataset.value, 0)
+        with self.pool.dataset(self.filenames[0]) as reused:
+            self.assertIs(reused, dataset)
+            self.assertTrue(reused.isopen())
+
+    def test_exclusive(self):
+        # A dataset in use is never given to another user.
+        first = self.pool.acquire(self.filenames[0])
+        second = self.pool.acquire(self.filenames[0])
+        self.assertIsNot(second, first)
+        self.pool.release(first)
+        with self.pool.dataset(self.filenames[0]) as reused:
+            self.assertIs(reused, first)
+        self.pool.release(second)
+        self.assertTrue(first.isopen())
+        self.assertTrue(second.isopen())
+
+    def test_evict(self):
+        datasets = [self.pool.acquire(filename)
+                    for filename in self.filenames]
+        # Datasets in use are never closed.
+        self.assertTrue(all(dataset.isopen() for dataset in datasets))
+        for dataset in datasets:
+            self.pool.release(dataset)
+        # The least recently used dataset is closed.
+        self.assertEqual([dataset.isopen() for dataset in datasets],
+                         [False, True, True])
+
+    def test_modified(self):
+        with self.pool.dataset(self.filenames[0]) as dataset:
+            pass
+        self.pool.discard(self.filenames[0])
+        self.assertFalse(dataset.isopen())
+        self._write(self.filenames[0], 10)
+        dataset = self.pool.acquire(self.filenames[0])
+        self.assertEqual(dataset.value, 10)
+        self.pool.release(dataset)
+        self.assertTrue(dataset.isopen())
+        # Modifying the file without discarding it from the pool.
+        stat = os.stat(self.filenames[0])
+        os.utime(self.filenames[0], (stat.st_atime, stat.st_mtime + 10))
+        with self.pool.dataset(self.filenames[0]) as reopened:
+            self.assertIsNot(reopened, dataset)
+        self.assertFalse(dataset.isopen())
+
+
+class TestCFReaderReferences(tests.IrisTest):
+    def test_references(self):
+        with self.temp_filename(suffix='.nc') as filename:
+            dataset = netCDF4.Dataset(filename, mode='w')
+            dataset.createDimension('x', 3)
+            dataset.createVariable('x', 'f4', ('x',)).bounds = 'x_bnds'
+            dataset.createVariable('x_bnds', 'f4', ('x',))
+            dataset.createVariable('crs', 'i4', ())
+            dataset.createVariable('aux', 'f4', ('x',))
+            dataset.createVariable('area', 'f4', ('x',))
+            for name in ['a', 'b']:
+                var = dataset.createVariable(name, 'f4', ('x',))
+                var.coordinates = 'aux'
+                var.grid_mapping = 'crs'
+                var.cell_measures = 'area: area'
+            dataset.close()
+
+            cf_reader = cf.CFReader(filename)
+            cf_group = cf_reader.cf_group
+            self.assertEqual(sorted(cf_group.data_variables), ['a', 'b'])
+            for name in ['a', 'b']:
+                self.assertEqual(sorted(cf_group[name].cf_group),
+                                 ['area', 'aux', 'crs', 'x'])
+            self.assertEqual(cf_group['x'].cf_group.keys(), ['x_bnds'])
+            self.assertEqual(cf_group['aux'].cf_group.keys(), [])
+            del cf_reader
+
+
 @iris.tests.skip_data
 class TestCFReader(tests.IrisTest):
     def setUp(self):
@@ -21,7 +21,12 @@ Test the constrained cube loading mechanism.
 # import iris tests first so that some things can be initialised before importing anything else
 import iris.tests as tests
 
+import datetime
+
+import numpy as np
+
 import iris
+import iris._constraints
 import iris.tests.stock as stock
 
 
@@ -370,6 +375,65 @@ class TestBetween(tests.IrisTest):
         results = [False, False, True, True, False]
         self.run_test(function, numbers, results)
 
+    def test_repr(self):
+        self.assertEqual(repr(iris.util.between(2, 4, rh_inclusive=False)),
+                         'between(2, 4, lh_inclusive=True, rh_inclusive=False)')
+
+
+class TestVectorisedMatch(tests.IrisTest):
+    def setUp(self):
+        self.coord = iris.coords.DimCoord(np.arange(10, dtype=np.float64),
+                                          long_name='level')
+        self.coord.guess_bounds()
+
+    def check(self, coord_thing):
+        # The cells matched all at once are those matched one at a time.
+        coord_constraint = iris._constraints._CoordConstraint('level', coord_thing)
+        for coord in (self.coord, self.coord.copy(points=self.coord.points)):
+            result = coord_constraint._match(coord.cell_array())
+            self.assertIsNotNone(result)
+            expected = [coord_constraint._call_func(cell) for cell in coord.cells()]
+            self.assertEqual(list(result), expected)
+
+    def test_equality(self):
+        self.check(3)
+        self.check(3.5)
+
+    def test_membership(self):
+        self.check([2, 6.5, 20])
+        self.check([])
+
+    def test_between(self):
+        self.check(iris.util.between(2, 4))
+        self.check(iris.util.between(2, 4, lh_inclusive=False))
+        self.check(iris.util.between(2, 4, rh_inclusive=False))
+        self.check(iris.util.between(2.5, 4.5, lh_inclusive=False, rh_inclusive=False))
+
+    def test_strings(self):
+        coord = iris.coords.AuxCoord(np.array(['a', 'b', 'c']), long_name='letter')
+        for coord_thing, expected in [('b', [False, True, False]),
+                                      (['a', 'c'], [True, False, True])]:
+            coord_constraint = iris._constraints._CoordConstraint('letter', coord_thing)
+            self.assertEqual(list(coord_constraint._match(coord.cell_array())), expected)
+
+    def test_callable(self):
+        coord_constraint = iris._constraints._CoordConstraint('level', lambda cell: cell > 3)
+        self.assertIsNone(coord_constraint._match(self.coord.cell_array()))
+
+    def test_datetime(self):
+        # Datetimes are compared with each cell, as they always have been,
+        # even when the coordinate is a time reference.
+        coord = iris.coords.DimCoord(np.arange(3, dtype=np.float64),
+                                     'time', units='days since 2000-01-01')
+        value = datetime.datetime(2000, 1, 2)
+        for coord_thing in (value, [value], iris.util.between(value, value)):
+            coord_constraint = iris._constraints._CoordConstraint('time', coord_thing)
+            self.assertIsNone(coord_constraint._match(coord.cell_array()))
+        # A numeric cell is not equal to a datetime.
+        cube = iris.cube.Cube(np.arange(3), long_name='foo')
+        cube.add_dim_coord(coord, 0)
+        self.assertIsNone(cube.extract(iris.Constraint(time=value)))
+
 
 if __name__ == "__main__":
     tests.main()
@@ -27,6 +27,7 @@ import iris.tests as tests
 import collections
 
 import mock
+import numpy as np
 
 import iris
 import iris.fileformats.ff as ff
@@ -284,5 +285,38 @@ class TestFFPayload(tests.IrisTest):
         self._test_payload(mock_field, 400, pp.LBUSER_DTYPE_LOOKUP[_INTEGER])
 
 
+class TestFFLookup(tests.IrisTest):
+    def _write_ff(self, filename, n_entries, n_valid):
+        header = np.zeros(ff.FF_HEADER_DEPTH, dtype='>i8')
+        # LOOKUP table start (one-based word address), entry depth and count.
+        header[149:152] = [ff.FF_HEADER_DEPTH + 1, 64, n_entries]
+        table = np.zeros((n_entries, 64), dtype='>i8')
+        table[:, :pp.NUM_LONG_HEADERS] = np.arange(pp.NUM_LONG_HEADERS)
+        table[:, 0] = np.arange(n_entries)
+        floats = np.arange(pp.NUM_FLOAT_HEADERS, dtype='>f8')
+        table[:, pp.NUM_LONG_HEADERS:] = floats.view('>i8')
+        table[n_valid:, 0] = -99
+        with open(filename, 'wb') as ff_file:
+            header.tofile(ff_file)
+            table.tofile(ff_file)
+
+    def test_terminated(self):
+        with self.temp_filename() as filename:
+            self._write_ff(filename, 5, 3)
+            lookup = ff._index_ff_lookup(filename)
+        self.assertEqual(len(lookup), 3)
+        self.assertArrayEqual(lookup['lb'][:, 0], [0, 1, 2])
+        self.assertArrayEqual(lookup['lb'][1, 1:],
+                              np.arange(1, pp.NUM_LONG_HEADERS))
+        self.assertArrayEqual(lookup['b'][2],
+                              np.arange(pp.NUM_FLOAT_HEADERS))
+
+    def test_full(self):
+        with self.temp_filename() as filename:
+            self._write_ff(filename, 4, 4)
+            lookup = ff._index_ff_lookup(filename)
+        self.assertEqual(len(lookup), 4)
+
+
 if __name__ == '__main__':
     tests.main()
@@ -637,6 +637,9 @@ class TestNearestNeighbourAdditional(tests.IrisTest):
             test_pts = lower + test_fractions * (upper - lower)
             results = [test_coord.nearest_neighbour_index(x) for x in test_pts]
             self.assertTrue(np.all([r == expect for r in results]))
+            # the indices of all the points at once are the same
+            self.assertEqual(list(test_coord.nearest_neighbour_indices(test_pts)),
+                             results)
 
     def test_nearest_neighbour_circular(self):
         # First test (simplest): ascending-order, unbounded
@@ -762,5 +765,46 @@ class TestNearestNeighbourAdditional(tests.IrisTest):
         # NOTE: no circular cases, as AuxCoords _cannot_ be circular.
 
 
+class TestNearestNeighbourNDCoords(tests.IrisTest):
+    def setUp(self):
+        self.cube = iris.cube.Cube(np.arange(24.).reshape(2, 3, 4))
+        j, i = np.mgrid[0:3, 0:4]
+        self.lat = iris.coords.AuxCoord(10.0 * j + i, 'latitude')
+        self.lon = iris.coords.AuxCoord((20.0 * i + j).T, 'longitude')
+        self.cube.add_aux_coord(self.lat, (1, 2))
+        self.cube.add_aux_coord(self.lon, (2, 1))
+
+    def test_extract(self):
+        point_spec = [('latitude', 12.2), ('longitude', 40.5)]
+        indices = iintrp._nearest_neighbour_indices_ndcoords(self.cube,
+                                                             point_spec)
+        self.assertEqual(indices, (slice(None), 1, 2))
+        result = iintrp.extract_nearest_neighbour(self.cube, point_spec)
+        np.testing.assert_array_equal(result.data, self.cube.data[:, 1, 2])
+
+    def test_index_cached(self):
+        index = iintrp._spatial_index(self.cube, [self.lat, self.lon])
+        self.assertEqual(index.dims, [1, 2])
+        self.assertIs(iintrp._spatial_index(self.cube, [self.lat, self.lon]),
+                      index)
+        # Changing the points in place re-builds the index.
+        self.lat.points[1, 2] = 50
+        new_index = iintrp._spatial_index(self.cube, [self.lat, self.lon])
+        self.assertIsNot(new_index, index)
+        indices = new_index.query([[12.2, 50.0], [40.5, 41.0]])
+        np.testing.assert_array_equal(indices, [[2, 1], [2, 2]])
+        # So does setting the points.
+        self.lat.points = self.lat.points.copy()
+        self.assertIsNot(iintrp._spatial_index(self.cube,
+                                               [self.lat, self.lon]),
+                         new_index)
+
+    def test_index_not_copied(self):
+        iintrp._spatial_index(self.cube, [self.lat, self.lon])
+        lat = self.lat.copy()
+        self.assertFalse(hasattr(lat, '_spatial_index_cache'))
+        self.assertEqual(lat, self.lat)
+
+
 if __name__ == "__main__":
     tests.main()
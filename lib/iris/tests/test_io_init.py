@@ -21,10 +21,14 @@ Test the io/__init__.py module.
 # import iris tests first so that some things can be initialised before importing anything else
 import iris.tests as tests
 
+import os
 import unittest
 
+import mock
+
 import iris.fileformats as iff
 import iris.io
+import iris.io.format_picker as fp
 
 
 class TestDecodeUri(unittest.TestCase):
@@ -93,6 +97,104 @@ class TestFileFormatPicker(tests.IrisTest):
                 self.assertEqual(a.name, expected_format_name)
 
 
+class TestMapFiles(tests.IrisTest):
+    def _map(self, function, filenames, parallel):
+        return [list(result) for result in
+                iris.io._map_files(function, filenames, parallel)]
+
+    def test_serial(self):
+        filenames = ['a', 'bb', 'ccc']
+        function = lambda filename: (len(filename), filename)
+        self.assertEqual(self._map(function, filenames, None),
+                         [[1, 'a'], [2, 'bb'], [3, 'ccc']])
+
+    def test_parallel(self):
+        # The function need not be picklable, and the results must come
+        # back in order.
+        filenames = [str(i) for i in range(10)]
+        offset = 100
+        function = lambda filename: [int(filename) + offset, os.getpid()]
+        results = self._map(function, filenames, 3)
+        self.assertEqual([result[0] for result in results], range(100, 110))
+        self.assertNotIn(os.getpid(), [result[1] for result in results])
+        # The function is only set in the worker processes.
+        self.assertIsNone(iris.io._map_function)
+
+    def test_parallel_error(self):
+        def function(filename):
+            raise ValueError(filename)
+        with self.assertRaises(ValueError):
+            self._map(function, ['a', 'b'], 2)
+
+
+class TestRealisedSlices(tests.IrisTest):
+    class Slice(object):
+        def __init__(self, log, name):
+            self.log = log
+            self.name = name
+
+        @property
+        def data(self):
+            self.log.append(self.name)
+
+    def test_serial(self):
+        log = []
+        slices = [self.Slice(log, name) for name in 'abc']
+        for cube in iris.io._realised_slices(iter(slices)):
+            log.append('save ' + cube.name)
+        self.assertEqual(log, ['save a', 'save b', 'save c'])
+
+    def test_prefetch(self):
+        # The data of each slice is loaded before the slice is saved, and
+        # no more than one slice ahead.
+        log = []
+        slices = [self.Slice(log, name) for name in 'abc']
+        result = []
+        for cube in iris.io._realised_slices(iter(slices), prefetch=True):
+            self.assertIn(cube.name, log)
+            self.assertLessEqual(len(log), slices.index(cube) + 2)
+            result.append(cube)
+        self.assertEqual(result, slices)
+        self.assertEqual(log, ['a', 'b', 'c'])
+
+
+class TestLoadFilesKeywords(tests.IrisTest):
+    def _load(self, handler_keywords):
+        handler = mock.Mock(return_value=iter(['cube']))
+        spec = fp.FormatSpecification('test', fp.MAGIC_NUMBER_32_BIT, 0,
+                                      handler,
+                                      handler_keywords=handler_keywords)
+        with self.temp_filename('.test') as filename:
+            open(filename, 'w').close()
+            with mock.patch('iris.fileformats.FORMAT_AGENT') as agent:
+                agent.get_spec.return_value = spec
+                cubes = list(iris.io.load_files([filename], None,
+                                                constraints='constraints',
+                                                parallel=2))
+        self.assertEqual(cubes, ['cube'])
+        return handler.call_args[1]
+
+    def test_none(self):
+        self.assertEqual(self._load(()), {})
+
+    def test_parallel(self):
+        self.assertEqual(self._load(('parallel',)), {'parallel': 2})
+
+    def test_constraints_and_parallel(self):
+        self.assertEqual(self._load(('constraints', 'parallel')),
+                         {'constraints': 'constraints', 'parallel': 2})
+
+
+@iris.tests.skip_data
+class TestParallelLoad(tests.IrisTest):
+    def test_pp(self):
+        filenames = [tests.get_data_path(('PP', 'globClim1', 'theta.pp')),
+                     tests.get_data_path(('PP', 'COLPEX',
+                                          'theta_and_orog_subset.pp'))]
+        expected = iris.load(filenames)
+        self.assertEqual(iris.load(filenames, parallel=2), expected)
+
+
 @iris.tests.skip_data
 class TestFileExceptions(tests.IrisTest):
     def test_pp_little_endian(self):
@@ -25,6 +25,7 @@ import iris.tests as tests
 import numpy as np
 
 import iris
+import iris._merge
 import iris.cube
 import iris.exceptions
 from iris.coords import DimCoord
@@ -273,6 +274,17 @@ class TestTimeTripleMerging(tests.IrisTest):
         # => fp: scalar; rt, t: 3 (with no time being definitive)
         self._test_triples(triples, 'non_expanding')
     
+    def test_source_order(self):
+        # The merged cube does not depend on the order of the source-cubes.
+        triples = (
+            (0, 10, 10), (0, 11, 11), (0, 12, 12),
+            (1, 12, 13), (2, 12, 14),
+        )
+        cubes = [self._make_cube(fp, rt, t, data=i) for i, (fp, rt, t) in enumerate(triples)]
+        cube, = iris.cube.CubeList(cubes).merge()
+        reversed_cube, = iris.cube.CubeList(cubes[::-1]).merge()
+        self.assertEqual(cube, reversed_cube)
+
     def test_duplicate_data(self):
         # test what happens when we have repeated time coordinates (i.e. duplicate data)
         cube1 = self._make_cube(0, 10, 0)
@@ -390,5 +402,51 @@ class TestCubeMergeTheoretical(tests.IrisTest):
         self.assertCML(r, ('cube_merge', 'test_simple_attributes3.cml'))
 
 
+class TestProtoCubeRegistry(tests.IrisTest):
+    def _make_cube(self, name, t):
+        cube = iris.cube.Cube(np.zeros((2, 3), dtype=np.float32), long_name=name)
+        cube.add_aux_coord(DimCoord(np.int32(t), long_name='t', units='1'))
+        return cube
+
+    def test_register(self):
+        registry = iris._merge.ProtoCubeRegistry()
+        a0 = registry.register(self._make_cube('a', 0))
+        b0 = registry.register(self._make_cube('b', 0))
+        a1 = registry.register(self._make_cube('a', 1))
+        self.assertIs(a0, a1)
+        self.assertIsNot(a0, b0)
+
+    def test_merge(self):
+        registry = iris._merge.ProtoCubeRegistry()
+        for t in range(3):
+            for name in ['b', 'a']:
+                registry.register(self._make_cube(name, t))
+        cubes = registry.merge()
+        self.assertEqual([cube.name() for cube in cubes], ['b', 'a'])
+        self.assertEqual([cube.shape for cube in cubes], [(3, 2, 3), (3, 2, 3)])
+
+
+class TestRelationMatrix(tests.IrisTest):
+    def test_separable(self):
+        positions = iris._merge._Positions([{'a': a, 'b': b, 'c': 0} for a in range(3) for b in range(4)])
+        matrix = iris._merge.derive_relation_matrix(positions)
+        self.assertEqual(matrix['a'], (set(['b', 'c']), set()))
+        self.assertEqual(matrix['b'], (set(['a', 'c']), set()))
+        self.assertEqual(matrix['c'], (set(['a', 'b']), set()))
+
+    def test_inseparable(self):
+        positions = iris._merge._Positions([{'a': 0, 'b': 0}, {'a': 0, 'b': 1}, {'a': 1, 'b': 0}])
+        matrix = iris._merge.derive_relation_matrix(positions)
+        self.assertEqual(matrix['a'], (set(), set(['b'])))
+        self.assertEqual(matrix['b'], (set(), set(['a'])))
+
+    def test_dependent(self):
+        positions = iris._merge._Positions([{'t': t, 'z': z, 'h': z * 10} for t in range(2) for z in range(3)])
+        mapping = {}
+        self.assertTrue(iris._merge._is_dependent('h', ['z'], positions, mapping))
+        self.assertEqual(mapping, {(0,): 0, (1,): 10, (2,): 20})
+        self.assertFalse(iris._merge._is_dependent('t', ['z'], positions))
+
+
 if __name__ == "__main__":
     tests.main()
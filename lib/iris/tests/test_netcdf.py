@@ -25,11 +25,14 @@ import iris.tests as tests
 
 import os
 
+import mock
 import netCDF4 as nc
 import numpy as np
 import numpy.ma as ma
 
 import iris
+import iris.fileformats.manager
+import iris.fileformats.netcdf
 import iris.std_names
 import iris.util
 import iris.coord_systems as icoord_systems
@@ -195,6 +198,67 @@ class TestSave(tests.IrisTest):
             iris.save(cube, filename, netcdf_format='NETCDF3_CLASSIC')
             self.assertCDL(filename, ('netcdf', 'netcdf_save_no_name.cdl'))
 
+    def test_compression(self):
+        cube = iris.cube.Cube(np.arange(60, dtype=np.float32).reshape(3, 4, 5),
+                              standard_name='air_temperature', units='K')
+        cube.add_dim_coord(iris.coords.DimCoord(np.arange(3), 'time',
+                                                units='hours since epoch'), 0)
+        cube.add_dim_coord(iris.coords.DimCoord(np.arange(4), 'latitude',
+                                                units='degrees'), 1)
+        cube.add_dim_coord(iris.coords.DimCoord(np.arange(5), 'longitude',
+                                                units='degrees'), 2)
+        with self.temp_filename(suffix='.nc') as filename:
+            iris.fileformats.netcdf.save(cube, filename, zlib=True,
+                                         complevel=6)
+            ds = nc.Dataset(filename)
+            cf_var = ds.variables['air_temperature']
+            self.assertTrue(cf_var.filters()['zlib'])
+            self.assertEqual(cf_var.filters()['complevel'], 6)
+            # Each chunk is a single horizontal field.
+            self.assertEqual(cf_var.chunking(), [1, 4, 5])
+            self.assertArrayEqual(cf_var[:], cube.data)
+            ds.close()
+
+
+class TestLoadSameStructure(tests.IrisTest):
+    def test_coords_cache(self):
+        # Data variables of the same structure share their coordinates,
+        # but not the coordinate instances.
+        with self.temp_filename(suffix='.nc') as filename:
+            dataset = nc.Dataset(filename, mode='w')
+            dataset.createDimension('latitude', 3)
+            dataset.createDimension('longitude', 4)
+            for name, units in [('latitude', 'degrees_north'),
+                                ('longitude', 'degrees_east')]:
+                var = dataset.createVariable(name, 'f4', (name,))
+                var.units = units
+                var[:] = np.arange(var.shape[0])
+            for name, units in [('air_temperature', 'K'),
+                                ('air_pressure', 'Pa')]:
+                var = dataset.createVariable(name, 'f4',
+                                             ('latitude', 'longitude'))
+                var.standard_name = name
+                var.units = units
+                var[:] = np.zeros((3, 4))
+            dataset.close()
+
+            assert_facts = iris.fileformats.netcdf._assert_case_specific_facts
+            with mock.patch('iris.fileformats.netcdf.'
+                            '_assert_case_specific_facts',
+                            wraps=assert_facts) as facts:
+                cubes = iris.load(filename)
+            self.assertEqual(facts.call_count, 1)
+
+        temperature = cubes.extract('air_temperature')[0]
+        pressure = cubes.extract('air_pressure')[0]
+        self.assertEqual(str(temperature.units), 'K')
+        self.assertEqual(str(pressure.units), 'Pa')
+        self.assertEqual(temperature.coords(), pressure.coords())
+        for coord in temperature.coords():
+            self.assertIsNot(coord, pressure.coord(coord.name()))
+        self.assertEqual(temperature.coord_dims(temperature.coord('longitude')),
+                         pressure.coord_dims(pressure.coord('longitude')))
+
 
 @iris.tests.skip_data
 class TestNetCDFSave(tests.IrisTest):
@@ -509,6 +573,37 @@ class TestNetCDFSave(tests.IrisTest):
         self.assertCDL(file_out, ('netcdf', 'netcdf_save_conf_name.cdl'))
         os.remove(file_out)
 
+    def test_deferred_chunked(self):
+        # Deferred data is written one chunk at a time.
+        file_in = tests.get_data_path(
+            ('PP', 'cf_processing',
+             '000003000000.03.236.000128.1990.12.01.00.00.b.pp'))
+        cube = iris.load_cube(file_in)
+        chunksizes = tuple((length + 1) // 2 for length in cube.shape)
+        load = iris.fileformats.manager.DataManager.load
+        with self.temp_filename(suffix='.nc') as filename:
+            with mock.patch('iris.fileformats.manager.DataManager.load',
+                            autospec=True, side_effect=load) as patched:
+                iris.fileformats.netcdf.save(cube, filename, zlib=True,
+                                             chunksizes=chunksizes)
+            # Each chunk is read from the PP file just once.
+            n_chunks = np.prod([-(-length // size) for length, size in
+                                zip(cube.shape, chunksizes)])
+            self.assertEqual(patched.call_count, n_chunks)
+            # As for realised data, there is only a fill value if the
+            # data is masked.
+            dataset = nc.Dataset(filename)
+            try:
+                cf_var, = [var for var in dataset.variables.values()
+                           if var.shape == cube.shape]
+                has_fill_value = '_FillValue' in cf_var.ncattrs()
+            finally:
+                dataset.close()
+            self.assertEqual(has_fill_value,
+                             isinstance(cube.data, ma.MaskedArray))
+            reloaded = iris.load_cube(filename)
+            self.assertArrayEqual(reloaded.data, cube.data)
+
     def test_trajectory(self):
         cube = iris.load_cube(iris.sample_data_path('air_temp.pp'))
 
@@ -21,13 +21,21 @@ import iris.tests as tests
 
 from copy import deepcopy
 import os
+import shutil
+import tempfile
 from types import GeneratorType
 import unittest
 
+import mock
 import netcdftime
+import numpy as np
+import numpy.ma as ma
 
+import iris
 import iris.fileformats
+import iris.fileformats.manager
 import iris.fileformats.pp as pp
+import iris.proxy
 import iris.util
 
 
@@ -184,10 +192,9 @@ class TestPackedPP(IrisPPTest):
         
         self.check_pp(r, ('PP', 'nae_unpacked.pp.txt'))
         
-        # check that trying to save this field again raises an error (we cannot currently write WGDOS packed fields)
-        temp_filename = iris.util.create_temp_filename(".pp")
-        self.assertRaises(NotImplementedError, r[0].save, open(temp_filename, 'wb'))
-        os.remove(temp_filename)
+        # check that the field can be saved again, packed to the same accuracy
+        saved = self._resave(r[0])
+        self.assertArrayAllClose(saved.data, r[0].data, atol=2.0 ** r[0].bacc)
         
     def test_rle(self):
         r = pp.load(tests.get_data_path(('PP', 'ocean_rle', 'ocean_rle.pp')))
@@ -198,10 +205,19 @@ class TestPackedPP(IrisPPTest):
          
         self.check_pp(r, ('PP', 'rle_unpacked.pp.txt'))
         
-        # check that trying to save this field again raises an error (we cannot currently write RLE packed fields)
-        temp_filename = iris.util.create_temp_filename(".pp")
-        self.assertRaises(NotImplementedError, r[0].save, open(temp_filename, 'wb'))
-        os.remove(temp_filename)
+        # check that the field can be saved again, and is unchanged
+        saved = self._resave(r[0])
+        self.assertArrayEqual(saved.data, r[0].data)
+
+    def _resave(self, field):
+        with self.temp_filename('.pp') as temp_filename:
+            with open(temp_filename, 'wb') as pp_file:
+                field.save(pp_file)
+            saved, = pp.load(temp_filename, read_data=True)
+        self.assertEqual(saved.lbpack, field.lbpack)
+        self.assertArrayEqual(ma.getmaskarray(saved.data),
+                              ma.getmaskarray(field.data))
+        return saved
 
 
 @iris.tests.skip_data
@@ -280,6 +296,400 @@ class TestPPFileWithExtraCharacterData(IrisPPTest):
         os.remove(temp_filename)
     
 
+@iris.tests.skip_data
+class TestPPFieldIndex(tests.IrisTest):
+    def setUp(self):
+        self.filename = tests.get_data_path(('PP', 'model_comp', 'dec_subset.pp'))
+        self.index = pp.PPFieldIndex(self.filename)
+        self.fields = list(pp.load(self.filename))
+
+    def test_len(self):
+        self.assertEqual(len(self.index), len(self.fields))
+
+    def test_header(self):
+        self.assertArrayEqual(self.index.header('lbft'),
+                              [field.lbft for field in self.fields])
+        self.assertArrayEqual(self.index.header('lbuser'),
+                              [field.lbuser for field in self.fields])
+        self.assertArrayEqual(self.index.header('bdx'),
+                              [field.bdx for field in self.fields])
+        self.assertRaises(ValueError, self.index.header, 'wibble')
+
+    def test_stash_mask(self):
+        stash = self.fields[0].stash
+        mask = self.index.stash_mask(str(stash))
+        expected = [field.stash == stash for field in self.fields]
+        self.assertArrayEqual(mask, expected)
+        selected = list(self.index.fields(mask))
+        self.assertEqual(len(selected), sum(expected))
+        self.assertTrue(all(field.stash == stash for field in selected))
+
+    def test_field(self):
+        field = self.index.field(1)
+        self.assertEqual(field, self.fields[1])
+        field = self.index.field(1, read_data=True)
+        self.assertArrayEqual(field.data, self.fields[1].data)
+
+    def test_field_view(self):
+        row = self.index.headers[1]
+        expected = pp.make_pp_field(tuple(row['lb']) + tuple(row['b']))
+        field = self.index.field(1)
+        # Header elements are only read from the index when first used.
+        self.assertRaises(AttributeError, object.__getattribute__, field, 'lbft')
+        self.assertEqual(field.lbft, expected.lbft)
+        self.assertEqual(field.lbtim, expected.lbtim)
+        self.assertEqual(field.lbtim.ia, expected.lbtim.ia)
+        self.assertEqual(field.lbuser, expected.lbuser)
+        self.assertFalse(hasattr(field, 'wibble'))
+
+
+class TestPPFieldIndexEmptyFile(tests.IrisTest):
+    def test_empty_file(self):
+        with self.temp_filename('.pp') as filename:
+            open(filename, 'wb').close()
+            self.assertEqual(len(pp.PPFieldIndex(filename)), 0)
+            self.assertEqual(list(pp.load(filename)), [])
+
+
+class TestCachedIndex(tests.IrisTest):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.index = np.arange(3)
+        self.index_function = mock.Mock(return_value=self.index)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def _cached_index(self, filename):
+        with mock.patch('iris.config.FIELD_INDEX_DIR', self.cache_dir):
+            return pp._cached_index(filename, 'test', self.index_function)
+
+    def test_no_cache_dir(self):
+        with self.temp_filename('.pp') as filename:
+            open(filename, 'wb').close()
+            with mock.patch('iris.config.FIELD_INDEX_DIR', None):
+                pp._cached_index(filename, 'test', self.index_function)
+                pp._cached_index(filename, 'test', self.index_function)
+        self.assertEqual(self.index_function.call_count, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_reuse(self):
+        with self.temp_filename('.pp') as filename:
+            open(filename, 'wb').close()
+            self._cached_index(filename)
+            result = self._cached_index(filename)
+        self.assertEqual(self.index_function.call_count, 1)
+        self.assertArrayEqual(result, self.index)
+
+    def test_changed_file(self):
+        with self.temp_filename('.pp') as filename:
+            open(filename, 'wb').close()
+            self._cached_index(filename)
+            with open(filename, 'ab') as changed_file:
+                changed_file.write('\0' * 4)
+            self._cached_index(filename)
+        self.assertEqual(self.index_function.call_count, 2)
+
+
+class TestHeaderFilter(tests.IrisTest):
+    def setUp(self):
+        pp._ensure_load_rules_loaded()
+        # Potential temperature on two model levels, air temperature on
+        # two pressure levels, orography, and a field with no STASH code.
+        self.headers = np.zeros(6, dtype=pp._PP_INDEX_DTYPE)
+        self._set('lbuser', 6, [1, 1, 1, 1, 1, 0])
+        self._set('lbuser', 3, [4, 4, 16203, 16203, 33, 0])
+        self._set('lbvc', 0, [65, 65, 8, 8, 129, 0])
+        self._set('lblev', 0, [1, 2, 0, 0, 0, 0])
+
+    def _set(self, name, i, values):
+        position = pp._INDEX_HEADER_POSITIONS[name][i]
+        self.headers['lb'][:, position] = values
+
+    def _mask(self, constraints):
+        return pp._header_filter(constraints)(self.headers)
+
+    def test_name(self):
+        self.assertArrayEqual(self._mask('air_potential_temperature'),
+                              [True, True, False, False, True, True])
+
+    def test_stash_attribute(self):
+        constraint = iris.AttributeConstraint(STASH='m01s16i203')
+        self.assertArrayEqual(self._mask(constraint),
+                              [False, False, True, True, True, False])
+
+    def test_stash_attribute_callable(self):
+        constraint = iris.AttributeConstraint(STASH=lambda stash:
+                                              stash.section == 0)
+        self.assertArrayEqual(self._mask(constraint),
+                              [True, True, False, False, True, False])
+
+    def test_model_level_number(self):
+        constraint = iris.Constraint(model_level_number=2)
+        self.assertArrayEqual(self._mask(constraint),
+                              [False, True, False, False, True, False])
+
+    def test_multiple_constraints(self):
+        constraints = [iris.Constraint('air_temperature'),
+                       iris.Constraint(model_level_number=[1, 3])]
+        self.assertArrayEqual(self._mask(constraints),
+                              [True, False, True, True, True, True])
+
+    def test_combination(self):
+        constraint = (iris.Constraint('air_potential_temperature') &
+                      iris.Constraint(model_level_number=lambda cell: cell > 1))
+        self.assertArrayEqual(self._mask(constraint),
+                              [False, True, False, False, True, False])
+
+    def test_undecidable(self):
+        constraint = iris.Constraint(cube_func=lambda cube: False,
+                                     latitude=0)
+        self.assertTrue(np.all(self._mask(constraint)))
+
+    def test_user_rules(self):
+        with mock.patch('iris.fileformats.pp._user_load_rules', True):
+            self.assertIsNone(pp._header_filter('air_temperature'))
+
+
+class TestPPDataProxyLoadMany(tests.IrisTest):
+    def setUp(self):
+        # Write a file of 2x3 payloads, separated by 8 byte gaps.
+        fd, self.filename = tempfile.mkstemp('.pp')
+        self.payloads = [(np.arange(6).reshape(2, 3) + 10 * i).astype('>f4')
+                         for i in range(5)]
+        lbpack = pp.SplittableInt(0, {'n1': 0})
+        self.proxies = []
+        with os.fdopen(fd, 'wb') as pp_file:
+            for payload in self.payloads:
+                pp_file.write('\0' * 8)
+                self.proxies.append(pp.PPDataProxy(self.filename,
+                                                   pp_file.tell(), 24,
+                                                   lbpack))
+                pp_file.write(payload.tostring())
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def _load_many(self, proxies):
+        payloads = [None] * len(proxies)
+        for i, payload in pp.PPDataProxy.load_many(proxies, (2, 3),
+                                                   np.dtype('>f4'), None,
+                                                   (slice(None),
+                                                    slice(None))):
+            payloads[i] = payload
+        return payloads
+
+    def test_load_many(self):
+        order = [3, 0, 4, 1, 2, 3]
+        proxies = [self.proxies[i] for i in order]
+        payloads = self._load_many(proxies)
+        for i, payload in zip(order, payloads):
+            self.assertTrue(payload.dtype.isnative)
+            self.assertArrayEqual(payload, self.payloads[i])
+
+    def test_packed(self):
+        # Packed payloads are unpacked by a thread pool, but must still be
+        # matched up with their proxies.
+        lbpack = pp.SplittableInt(1, {'n1': 0})
+        proxies = [pp.PPDataProxy(proxy.path, proxy.offset, proxy.data_len,
+                                  lbpack) for proxy in self.proxies]
+
+        def wgdos_unpack(data_bytes, lbrow, lbnpt, mdi):
+            return np.frombuffer(data_bytes, '>f4').reshape(lbrow, lbnpt)
+
+        with mock.patch('iris.fileformats.pp.pp_packing') as pp_packing:
+            pp_packing.wgdos_unpack.side_effect = wgdos_unpack
+            with mock.patch('iris.fileformats.pp._UNPACK_THREADS', 3):
+                payloads = self._load_many(proxies[::-1])
+        self.assertEqual(pp_packing.wgdos_unpack.call_count, 5)
+        for payload, expected in zip(payloads, self.payloads[::-1]):
+            self.assertArrayEqual(payload, expected)
+
+    def test_coalesce_reads(self):
+        indices = range(5)
+        runs = list(pp._coalesce_reads(self.proxies, indices))
+        self.assertEqual(runs, [indices])
+        with mock.patch('iris.fileformats.pp._MAX_READ_GAP', 4):
+            runs = list(pp._coalesce_reads(self.proxies, indices))
+        self.assertEqual(runs, [[0], [1], [2], [3], [4]])
+        with mock.patch('iris.fileformats.pp._MAX_READ_SIZE', 64):
+            runs = list(pp._coalesce_reads(self.proxies, indices))
+        self.assertEqual(runs, [[0, 1], [2, 3], [4]])
+
+    def test_data_manager(self):
+        proxy_array = np.array(self.proxies[::-1] + [None])
+        manager = iris.fileformats.manager.DataManager((2, 3),
+                                                       np.dtype('>f4'), None)
+        data = manager.load(proxy_array)
+        self.assertEqual(data.shape, (6, 2, 3))
+        self.assertArrayEqual(data[:5], self.payloads[::-1])
+        self.assertTrue(np.all(data.mask[5]))
+
+    def test_data_manager_single(self):
+        # A single proxy is loaded directly, without any masking.
+        manager = iris.fileformats.manager.DataManager((2, 3),
+                                                       np.dtype('>f4'), None)
+        data = manager.load(np.array([self.proxies[2]]))
+        self.assertNotIsInstance(data, np.ma.MaskedArray)
+        self.assertTrue(data.dtype.isnative)
+        self.assertEqual(data.shape, (1, 2, 3))
+        self.assertArrayEqual(data[0], self.payloads[2])
+
+        proxy_array, manager = manager.getitem(np.array(self.proxies[3:4]),
+                                               (0, slice(None), slice(0, 2)))
+        data = manager.load(proxy_array)
+        self.assertTrue(data.flags['C_CONTIGUOUS'])
+        self.assertArrayEqual(data, self.payloads[3][:, :2])
+
+    def test_proxy_record_array(self):
+        records = iris.fileformats.manager.ProxyRecordArray.from_proxies(
+            self.proxies)
+        self.assertEqual(records.paths, (self.filename,))
+        proxy_array = iris.fileformats.manager.ProxyRecordArray(
+            (2, 3), pp.PPDataProxy, records.paths)
+        proxy_array.view(np.ndarray).flat[:5] = records.view(np.ndarray)
+        proxy_array = deepcopy(proxy_array)
+
+        manager = iris.fileformats.manager.DataManager((2, 3),
+                                                       np.dtype('>f4'), None)
+        data = manager.load(proxy_array)
+        self.assertEqual(data.shape, (2, 3, 2, 3))
+        self.assertArrayEqual(data[0], self.payloads[:3])
+        self.assertArrayEqual(data[1, :2], self.payloads[3:])
+        self.assertTrue(np.all(data.mask[1, 2]))
+
+        proxy_array, manager = manager.getitem(proxy_array, (1, 0))
+        self.assertIsInstance(proxy_array,
+                              iris.fileformats.manager.ProxyRecordArray)
+        self.assertEqual(proxy_array.shape, ())
+        self.assertArrayEqual(manager.load(proxy_array), self.payloads[3])
+
+    def test_merge_proxy_records(self):
+        # Merging cubes of single proxies gives a record array of proxies,
+        # and cubes with record arrays can themselves be merged.
+        manager = iris.fileformats.manager.DataManager((2, 3),
+                                                       np.dtype('>f4'), None)
+        cubes = iris.cube.CubeList()
+        for i, proxy in enumerate(self.proxies[:4]):
+            data = np.empty((), dtype='object')
+            data[()] = proxy
+            cube = iris.cube.Cube(data, long_name='foo',
+                                  data_manager=manager)
+            cube.add_aux_coord(iris.coords.DimCoord(i % 2, long_name='level'))
+            cube.add_aux_coord(iris.coords.DimCoord(i // 2, long_name='run'))
+            cubes.append(cube)
+
+        runs = iris.cube.CubeList()
+        for run in (0, 1):
+            cube, = cubes[2 * run:2 * run + 2].merge()
+            self.assertIsInstance(cube._data,
+                                  iris.fileformats.manager.ProxyRecordArray)
+            runs.append(cube)
+
+        cube, = runs.merge()
+        self.assertEqual(cube.shape, (2, 2, 2, 3))
+        expected = np.array(self.payloads[:4]).reshape(2, 2, 2, 3)
+        self.assertArrayEqual(cube.data, expected)
+        for run, run_cube in enumerate(runs):
+            self.assertArrayEqual(run_cube.data, expected[run])
+
+
+class TestPPFieldSavePacked(tests.IrisTest):
+    def setUp(self):
+        header = [0] * (pp.NUM_LONG_HEADERS + pp.NUM_FLOAT_HEADERS)
+        header[pp._INDEX_HEADER_POSITIONS['lbrel'][0]] = 3
+        self.field = pp.make_pp_field(tuple(header))
+        self.field.data = np.arange(6, dtype=np.float32).reshape(2, 3)
+        self.field.bacc = -6
+
+    def _save(self):
+        with self.temp_filename('.pp') as filename:
+            with open(filename, 'wb') as pp_file:
+                self.field.save(pp_file)
+            with open(filename, 'rb') as pp_file:
+                contents = pp_file.read()
+        return contents
+
+    def test_wgdos(self):
+        self.field.lbpack = 1
+        with mock.patch('iris.fileformats.pp.pp_packing') as pp_packing:
+            pp_packing.wgdos_pack.return_value = 'packed!!'
+            contents = self._save()
+        data, bacc, bmdi = pp_packing.wgdos_pack.call_args[0]
+        self.assertArrayEqual(data, self.field.data)
+        self.assertEqual(bacc, -6)
+        # The record is the header, then the data length, the packed data
+        # and the data length again.
+        self.assertEqual(len(contents), 4 + 256 + 4 + 4 + 8 + 4)
+        self.assertEqual(contents[264:268], '\0\0\0\x08')
+        self.assertEqual(contents[268:276], 'packed!!')
+
+    def test_rle(self):
+        self.field.lbpack = 4
+        with mock.patch('iris.fileformats.pp.pp_packing') as pp_packing:
+            pp_packing.rle_encode.return_value = np.array([1.5, 2.5],
+                                                          dtype=np.float32)
+            contents = self._save()
+        self.assertEqual(contents[268:276],
+                         np.array([1.5, 2.5], dtype='>f4').tostring())
+
+    def test_unsupported(self):
+        self.field.lbpack = 2
+        with self.assertRaises(NotImplementedError):
+            self._save()
+
+    def test_integer_data(self):
+        self.field.lbpack = 1
+        self.field.data = np.arange(6, dtype=np.int32).reshape(2, 3)
+        with self.assertRaises(NotImplementedError):
+            self._save()
+
+
+@unittest.skipIf(isinstance(pp.pp_packing, iris.proxy.FakeModule),
+                 'The pp_packing extension is not available.')
+class TestPackedRoundTrip(tests.IrisTest):
+    def setUp(self):
+        header = [0] * (pp.NUM_LONG_HEADERS + pp.NUM_FLOAT_HEADERS)
+        header[pp._INDEX_HEADER_POSITIONS['lbrel'][0]] = 3
+        self.field = pp.make_pp_field(tuple(header))
+        self.field.lbrow, self.field.lbnpt = 6, 40
+        self.field.bmdi = -1e30
+        data = np.sin(np.arange(240, dtype=np.float32)).reshape(6, 40) * 100
+        data = ma.masked_array(data)
+        data[1, 5:20] = ma.masked
+        data[2, ::2] = ma.masked
+        data[4] = ma.masked
+        self.field.data = data
+
+    def _round_trip(self, lbpack):
+        self.field.lbpack = lbpack
+        self.field.bacc = -6
+        with self.temp_filename('.pp') as filename:
+            with open(filename, 'wb') as pp_file:
+                self.field.save(pp_file)
+            fields = list(pp.load(filename, read_data=True))
+        self.assertEqual(len(fields), 1)
+        self.assertEqual(fields[0].lbpack, lbpack)
+        self.assertArrayEqual(ma.getmaskarray(fields[0].data),
+                              ma.getmaskarray(self.field.data))
+        return fields[0].data
+
+    def test_wgdos(self):
+        data = self._round_trip(1)
+        self.assertArrayAllClose(data, self.field.data, atol=2 ** -6)
+
+    def test_rle(self):
+        data = self._round_trip(4)
+        self.assertArrayEqual(data, self.field.data)
+
+    def test_wgdos_too_accurate(self):
+        self.field.lbpack = 1
+        self.field.bacc = -99
+        with self.temp_filename('.pp') as filename:
+            with open(filename, 'wb') as pp_file:
+                self.assertRaises(ValueError, self.field.save, pp_file)
+
+
 class TestBitwiseInt(unittest.TestCase):
 
     def test_3(self):
@@ -20,10 +20,11 @@
 import iris.tests as tests
 
 import numpy as np
+import numpy.ma as ma
 
 import iris
 from iris import load_cube
-from iris.analysis.interpolate import regrid_to_max_resolution
+from iris.analysis.interpolate import Regridder, regrid_to_max_resolution
 from iris.cube import Cube
 from iris.coords import DimCoord
 from iris.coord_systems import GeogCS
@@ -208,6 +209,66 @@ class TestRegridBilinear(tests.IrisTest):
         self.larger.add_dim_coord(coord, 1)
         self.assertCMLApproxData(self.source.regridded(self.larger), ('regrid', 'bilinear_larger_lon_extrapolate_right.cml'))
 
+    def test_regridder(self):
+        # The data vary linearly with latitude and longitude, so bilinear
+        # interpolation and extrapolation reproduce them exactly.
+        cube = Cube(np.arange(24, dtype=np.float32).reshape(2, 3, 4))
+        cube.add_dim_coord(DimCoord(np.array([0, 1]), long_name='level'), 0)
+        cube.add_dim_coord(self.source.coord('latitude').copy(), 1)
+        cube.add_dim_coord(self.source.coord('longitude').copy(), 2)
+        regridder = Regridder(self.source, self.larger)
+        result = regridder(cube)
+        lat = self.larger.coord('latitude').points.reshape(-1, 1)
+        lon = self.larger.coord('longitude').points
+        expected = 4 * (lat - 1) + (lon - 1)
+        self.assertEqual(result.shape, (2, 4, 5))
+        self.assertEqual(result.data.dtype, np.float32)
+        np.testing.assert_array_almost_equal(result.data,
+                                             [expected, expected + 12])
+        self.assertEqual(result.coord('longitude'),
+                         self.larger.coord('longitude'))
+        self.assertEqual(result.coord('level'), cube.coord('level'))
+        # The same regridder applies to any cube on the source grid.
+        np.testing.assert_array_almost_equal(regridder(self.source).data,
+                                             expected)
+
+    def test_regridder_masked(self):
+        # Only the grid points which depend on a masked value are masked.
+        self.source.data = ma.masked_equal(self.source.data, 5)
+        result = Regridder(self.source, self.smaller)(self.source)
+        np.testing.assert_array_equal(result.data.mask, [[True, True, False],
+                                                         [True, True, False]])
+
+    def test_regridder_off_grid(self):
+        regridder = Regridder(self.source, self.smaller)
+        with self.assertRaises(ValueError):
+            regridder(self.larger)
+
+    def test_regridder_unsigned_int(self):
+        self.source.data = self.source.data.astype(np.uint8)
+        regridder = Regridder(self.source, self.smaller)
+        with self.assertRaises(ValueError):
+            regridder(self.source)
+
+    def test_regridder_nearest(self):
+        # The grid dimensions need not be the last dimensions of the cube.
+        data = np.arange(12).reshape(3, 4)
+        cube = Cube(np.array([data, data + 12]).transpose(1, 0, 2))
+        cube.add_dim_coord(self.source.coord('latitude').copy(), 0)
+        cube.add_dim_coord(DimCoord(np.array([0, 1]), long_name='level'), 1)
+        cube.add_dim_coord(self.source.coord('longitude').copy(), 2)
+        grid = Cube(np.zeros((2, 3)))
+        grid.add_dim_coord(DimCoord(np.array([1.2, 2.9]), 'latitude',
+                                    units='degrees', coord_system=self.cs), 0)
+        grid.add_dim_coord(DimCoord(np.array([0.8, 3.6, 4.4]), 'longitude',
+                                    units='degrees', coord_system=self.cs), 1)
+        result = Regridder(self.source, grid, mode='nearest')(cube)
+        expected = np.array([[0, 3, 3], [8, 11, 11]])
+        self.assertEqual(result.shape, (2, 2, 3))
+        self.assertEqual(result.coord_dims(result.coord('level')), (1,))
+        np.testing.assert_array_equal(result.data[:, 0], expected)
+        np.testing.assert_array_equal(result.data[:, 1], expected + 12)
+
 
 if __name__ == "__main__":
     tests.main()
@@ -21,12 +21,16 @@ Test metadata translation rules.
 # import iris tests first so that some things can be initialised before importing anything else
 import iris.tests as tests
 
+import os
+import tempfile
 import types
 
+import numpy as np
+
 from iris.aux_factory import HybridHeightFactory
 from iris.fileformats.rules import ConcreteReferenceTarget, Factory, Loader, \
-                                   Reference, ReferenceTarget, RuleResult, \
-                                   load_cubes
+                                   ProcedureRule, Reference, ReferenceTarget, \
+                                   RuleResult, RulesContainer, load_cubes
 import iris.tests.stock as stock
 
 
@@ -182,5 +186,105 @@ class TestLoadCubes(tests.IrisTest):
         self.assertEqual(len(param_cube.coords('surface_altitude')), 1)
 
 
+class TestRuleDispatch(tests.IrisTest):
+    RULES = """
+IF
+f.lbuser[6] == 1
+f.lbuser[3] == 4
+THEN
+CMAttribute('standard_name', 'air_temperature')
+
+IF
+f.lbuser[6] == 1
+f.lbuser[3] == 10
+THEN
+CMAttribute('standard_name', 'specific_humidity')
+
+IF
+f.lbuser[6] == 2
+THEN
+CMAttribute('long_name', 'ocean')
+
+IF
+f.lbvc != 0
+THEN
+CMAttribute('long_name', 'levels')
+"""
+
+    def setUp(self):
+        self.temp_files = []
+        self.rules = RulesContainer(self._rules_file(self.RULES))
+
+    def tearDown(self):
+        for filename in self.temp_files:
+            os.remove(filename)
+
+    def _rules_file(self, text):
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w') as rules_file:
+            rules_file.write(text)
+        self.temp_files.append(filename)
+        return filename
+
+    def _field(self, lbuser, lbvc=0):
+        field = Mock()
+        field.lbuser = lbuser
+        field.lbvc = lbvc
+        return field
+
+    def _check(self, field, expected_candidates):
+        # The candidates must be in rule order, and must include every rule
+        # which matches.
+        candidates = self.rules._candidate_rules(None, field)
+        self.assertEqual(candidates,
+                         [self.rules._rules[i] for i in expected_candidates])
+        all_matching = [rule for rule in self.rules._rules
+                        if rule._matches_field(field)]
+        self.assertEqual(self.rules.matching_rules(field), all_matching)
+
+    def test_dispatch(self):
+        self._check(self._field([0, 0, 0, 4, 0, 0, 1]), [0, 3])
+        self._check(self._field([0, 0, 0, 10, 0, 0, 1], lbvc=65), [1, 3])
+        self._check(self._field([0, 0, 0, 99, 0, 0, 1]), [3])
+        self._check(self._field([0, 0, 0, 4, 0, 0, 2]), [2, 3])
+
+    def test_numpy_values(self):
+        lbuser = np.array([0, 0, 0, 10, 0, 0, 1], dtype=np.int32)
+        self._check(self._field(lbuser), [1, 3])
+
+    def test_unhashable_value(self):
+        # A value which can't safely be looked up leaves all the rules
+        # keyed on that value as candidates.
+        self._check(self._field([0, 0, 0, 4, 0, 0, Mock()]), [0, 1, 2, 3])
+
+    def test_undecidable(self):
+        # A key which can't be evaluated leaves the rules to report the
+        # problem.
+        field = self._field([0, 0, 0, 4])
+        self.assertEqual(self.rules._candidate_rules(None, field),
+                         self.rules._rules)
+        with self.assertRaises(IndexError):
+            self.rules.matching_rules(field)
+
+    def test_import_rules(self):
+        field = self._field([0, 0, 0, 4, 0, 0, 1])
+        self._check(field, [0, 3])
+        self.rules.import_rules(self._rules_file("""
+IF
+f.lbuser[6] == 1
+f.lbuser[3] == 4
+THEN
+CMAttribute('units', 'K')
+"""))
+        self._check(field, [0, 3, 4])
+
+    def test_procedure_rules(self):
+        # The actions of procedure rules can change the field, so every
+        # rule is a candidate.
+        self.rules = RulesContainer(self._rules_file(self.RULES),
+                                    ProcedureRule)
+        self._check(self._field([0, 0, 0, 4, 0, 0, 1]), [0, 1, 2, 3])
+
+
 if __name__ == "__main__":
     tests.main()
@@ -269,16 +269,43 @@ def between(lh, rh, lh_inclusive=True, rh_inclusive=True):
         between_3_and_6 = between(3, 6, rh_inclusive=False)
         for i in range(10):
            print i, between_3_and_6(i)
-        
+
+    As a coordinate constraint, e.g. ``Constraint(latitude=between(0, 90))``,
+    the inequality is tested for all the cells of the coordinate at once.
+
     """
-    if lh_inclusive and rh_inclusive:
-        return lambda c: lh <= c <= rh    
-    elif lh_inclusive and not rh_inclusive:
-        return lambda c: lh <= c < rh    
-    elif not lh_inclusive and rh_inclusive:
-        return lambda c: lh < c <= rh    
-    else:
-        return lambda c: lh < c < rh
+    return _Between(lh, rh, lh_inclusive, rh_inclusive)
+
+
+class _Between(object):
+    """
+    The callable inequality returned by :func:`between`.
+
+    Coordinate constraints recognise it, and compare it with the points or
+    bounds of all the cells of a coordinate at once.
+
+    """
+    def __init__(self, lh, rh, lh_inclusive=True, rh_inclusive=True):
+        self.lh = lh
+        self.rh = rh
+        self.lh_inclusive = lh_inclusive
+        self.rh_inclusive = rh_inclusive
+
+    def __call__(self, c):
+        if self.lh_inclusive:
+            lower = self.lh <= c
+        else:
+            lower = self.lh < c
+        if not lower:
+            return lower
+        if self.rh_inclusive:
+            return c <= self.rh
+        else:
+            return c < self.rh
+
+    def __repr__(self):
+        return 'between(%r, %r, lh_inclusive=%r, rh_inclusive=%r)' % \
+            (self.lh, self.rh, self.lh_inclusive, self.rh_inclusive)
 
 
 def reverse(array, axes):
@@ -15,6 +15,7 @@
 // You should have received a copy of the GNU Lesser General Public License
 // along with Iris.  If not, see <http://www.gnu.org/licenses/>.
 #include <Python.h>
+#include <math.h>
 
 #include <numpy/arrayobject.h>
 
@@ -23,6 +24,8 @@
 
 static PyObject *wgdos_unpack_py(PyObject *self, PyObject *args);
 static PyObject *rle_decode_py(PyObject *self, PyObject *args);
+static PyObject *wgdos_pack_py(PyObject *self, PyObject *args);
+static PyObject *rle_encode_py(PyObject *self, PyObject *args);
 
 #define BYTES_PER_INT_UNPACK_PPFIELD 4
 #define LBPACK_WGDOS_PACKED 1
@@ -83,10 +86,49 @@ void initpp_packing(void)
         ""
 	);
 
+	PyDoc_STRVAR(wgdos_pack__doc__,
+	"Pack PP field data using the WGDOS archive method.\n"
+	"\n"
+        "Provides access to the libmo_unpack library function wgdos_pack.\n"
+        "\n"
+        "Args:\n\n"
+        "* data (numpy.ndarray):\n"
+        "    The 2d array of field data to be packed.\n"
+        "* bacc (int):\n"
+        "    The packing accuracy, as a power of two.\n"
+        "* bmdi (float):\n"
+        "    The value used in the field to indicate missing data points.\n"
+        "\n"
+        "Returns:\n"
+        "    string, the packed field bytes, as they are written to a file.\n"
+	""
+	);
+
+
+	PyDoc_STRVAR(rle_encode__doc__,
+	"Compress PP field data using Run Length Encoding.\n"
+	"\n"
+        "Provides access to the libmo_unpack library function runlenEncode.\n"
+        "Each run of missing data points is replaced by a single missing data\n"
+        "value followed by a value giving the length of the run.\n"
+        "\n"
+        "Args:\n\n"
+        "* data (numpy.ndarray):\n"
+        "    The 2d array of field data to be compressed.\n"
+        "* bmdi (float):\n"
+        "    The value used in the field to indicate missing data points.\n"
+        "\n"
+        "Returns:\n"
+        "    numpy.ndarray, 1d array containing the compressed field data.\n"
+        ""
+	);
+
 	/* ==== Set up the module's methods table ====================== */
 	static PyMethodDef pp_packingMethods[] = {
 	    {"wgdos_unpack", wgdos_unpack_py, METH_VARARGS, wgdos_unpack__doc__},
 	    {"rle_decode", rle_decode_py, METH_VARARGS, rle_decode__doc__},
+	    {"wgdos_pack", wgdos_pack_py, METH_VARARGS, wgdos_pack__doc__},
+	    {"rle_encode", rle_encode_py, METH_VARARGS, rle_encode__doc__},
 	    {NULL, NULL, 0, NULL}     /* marks the end of this structure */
 	};
 
@@ -126,7 +168,12 @@ static PyObject *wgdos_unpack_py(PyObject *self, PyObject *args)
 
     function func; // function is defined by wgdosstuff.
     set_function_name(__func__, &func, 0);
-    int status = unpack_ppfield(mdi, 0, bytes_in, LBPACK_WGDOS_PACKED, npts, dataout, &func);
+    int status;
+
+    /* The unpacking only touches C memory, so let other threads run */
+    Py_BEGIN_ALLOW_THREADS
+    status = unpack_ppfield(mdi, 0, bytes_in, LBPACK_WGDOS_PACKED, npts, dataout, &func);
+    Py_END_ALLOW_THREADS
 
     /* Raise an exception if there was a problem with the WGDOS algorithm */
     if (status != 0) {
@@ -190,7 +237,12 @@ static PyObject *rle_decode_py(PyObject *self, PyObject *args)
 
     function func;  // function is defined by wgdosstuff.
     set_function_name(__func__, &func, 0);
-    int status = unpack_ppfield(mdi, (bytes_in_len/BYTES_PER_INT_UNPACK_PPFIELD), bytes_in, LBPACK_RLE_PACKED, npts, dataout, &func);
+    int status;
+
+    /* The decoding only touches C memory, so let other threads run */
+    Py_BEGIN_ALLOW_THREADS
+    status = unpack_ppfield(mdi, (bytes_in_len/BYTES_PER_INT_UNPACK_PPFIELD), bytes_in, LBPACK_RLE_PACKED, npts, dataout, &func);
+    Py_END_ALLOW_THREADS
     
     /* Raise an exception if there was a problem with the REL algorithm */
     if (status != 0) {
@@ -214,3 +266,148 @@ static PyObject *rle_decode_py(PyObject *self, PyObject *args)
         return (PyObject *)npy_array_out;
    }
 }
+
+
+/* wgdos_pack(data, bacc, mdi) */
+static PyObject *wgdos_pack_py(PyObject *self, PyObject *args)
+{
+    PyObject *data_in=NULL;
+    PyArrayObject *npy_array_in=NULL;
+    PyObject *bytes_out=NULL;
+    int bacc, nrows, ncols, npts, packed_len, max_words;
+    float mdi;
+
+    if (!PyArg_ParseTuple(args, "Oif", &data_in, &bacc, &mdi)) return NULL;
+
+    npy_array_in = (PyArrayObject *) PyArray_FROM_OTF(data_in, NPY_FLOAT, NPY_IN_ARRAY);
+    if (npy_array_in == NULL) return NULL;
+
+    if (PyArray_NDIM(npy_array_in) != 2) {
+        Py_DECREF(npy_array_in);
+        PyErr_SetString(PyExc_ValueError, "WGDOS packing requires a 2d array.");
+        return NULL;
+    }
+    nrows = (int) PyArray_DIM(npy_array_in, 0);
+    ncols = (int) PyArray_DIM(npy_array_in, 1);
+    npts = nrows * ncols;
+
+    /* Each packed value must fit in a word, so refuse an accuracy which is
+       too fine for the range of the values in any row. */
+    float *values = (float *) PyArray_DATA(npy_array_in);
+    double scale = ldexp(1.0, bacc);
+    int row, col;
+    for (row = 0; row < nrows; row++) {
+        float row_min = mdi, row_max = mdi;
+        int found = 0;
+        for (col = 0; col < ncols; col++) {
+            float value = values[row * ncols + col];
+            if (value == mdi) continue;
+            if (!found || value < row_min) row_min = value;
+            if (!found || value > row_max) row_max = value;
+            found = 1;
+        }
+        if (found && !((row_max - (double) row_min) / scale < 4294967295.0)) {
+            Py_DECREF(npy_array_in);
+            PyErr_SetString(PyExc_ValueError, "The WGDOS packing accuracy is too fine for the range of the data.");
+            return NULL;
+        }
+    }
+
+    /* wgdos_pack takes no limit on the size of its output, so the buffer
+       must hold the worst case: the 3 word field header, then for each row
+       a 2 word row header, the missing data and zero bitmaps (one bit per
+       column each, padded to whole words), and a full word per value. */
+    max_words = 3 + nrows * (2 + 2 * ((ncols + 31) / 32) + ncols);
+    int *dataout = (int*)calloc(max_words, sizeof(int));
+
+    if (dataout == NULL) {
+        Py_DECREF(npy_array_in);
+        PyErr_SetString(PyExc_ValueError, "Unable to allocate memory for wgdos_packing.");
+        return NULL;
+    }
+
+    function func; // function is defined by wgdosstuff.
+    set_function_name(__func__, &func, 0);
+    int status;
+
+    /* The packing only touches C memory, so let other threads run */
+    Py_BEGIN_ALLOW_THREADS
+    status = wgdos_pack(ncols, nrows, (float *) PyArray_DATA(npy_array_in), mdi, bacc,
+                        (unsigned char *) dataout, &packed_len, &func);
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(npy_array_in);
+
+    /* Raise an exception if there was a problem with the WGDOS algorithm */
+    if (status != 0 || packed_len < 0 || packed_len > max_words) {
+        free(dataout);
+        PyErr_SetString(PyExc_ValueError, "WGDOS pack encountered an error.");
+        return NULL;
+    }
+
+    /* The packed length is given in 32-bit words */
+    bytes_out = PyString_FromStringAndSize((char *) dataout, packed_len * BYTES_PER_INT_UNPACK_PPFIELD);
+    free(dataout);
+    return bytes_out;
+}
+
+
+/* rle_encode(data, mdi) */
+static PyObject *rle_encode_py(PyObject *self, PyObject *args)
+{
+    PyObject *data_in=NULL;
+    PyArrayObject *npy_array_in=NULL;
+    PyArrayObject *npy_array_out=NULL;
+    npy_intp dims[1];
+    int npts, packed_len, max_len;
+    float mdi;
+
+    if (!PyArg_ParseTuple(args, "Of", &data_in, &mdi)) return NULL;
+
+    npy_array_in = (PyArrayObject *) PyArray_FROM_OTF(data_in, NPY_FLOAT, NPY_IN_ARRAY);
+    if (npy_array_in == NULL) return NULL;
+    npts = (int) PyArray_SIZE(npy_array_in);
+
+    /* The worst case is alternating data and isolated missing data points,
+       where each missing data point is encoded as two values, so 3 * npts / 2
+       values. The buffer is larger than that, and runlenEncode is also given
+       its size through packed_len. */
+    max_len = 2 * npts;
+    float *dataout = (float*)calloc(max_len, sizeof(float));
+
+    if (dataout == NULL) {
+        Py_DECREF(npy_array_in);
+        PyErr_SetString(PyExc_ValueError, "Unable to allocate memory for rle_encoding.");
+        return NULL;
+    }
+
+    function func;  // function is defined by wgdosstuff.
+    set_function_name(__func__, &func, 0);
+    int status;
+    packed_len = max_len;
+
+    /* The encoding only touches C memory, so let other threads run */
+    Py_BEGIN_ALLOW_THREADS
+    status = runlenEncode((float *) PyArray_DATA(npy_array_in), npts, dataout, &packed_len, mdi, &func);
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(npy_array_in);
+
+    /* Raise an exception if there was a problem with the RLE algorithm */
+    if (status != 0 || packed_len < 0 || packed_len > max_len) {
+        free(dataout);
+        PyErr_SetString(PyExc_ValueError, "RLE encode encountered an error.");
+        return NULL;
+    }
+
+    dims[0] = packed_len;
+    npy_array_out = (PyArrayObject *) PyArray_SimpleNew(1, dims, NPY_FLOAT);
+    if (npy_array_out == NULL) {
+        free(dataout);
+        PyErr_SetString(PyExc_ValueError, "Failed to make the numpy array for the encoded data.");
+        return NULL;
+    }
+    memcpy(PyArray_DATA(npy_array_out), dataout, packed_len * sizeof(float));
+    free(dataout);
+    return (PyObject *)npy_array_out;
+}